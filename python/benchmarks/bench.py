@@ -0,0 +1,229 @@
+"""
+Benchmarks of the Blackjack engine's hot paths.
+
+    python benchmarks/bench.py                          # run everything, print JSON
+    python benchmarks/bench.py -o results.json          # ... and save it
+    python benchmarks/bench.py -b benchmarks/baseline.json
+
+Each benchmark reports a rate (operations per second, best of `--repeat`
+runs). With `--baseline`, every rate is compared with the stored one and the
+script exits with status 1 if any fell by more than `--tolerance`. Rates depend
+on the machine, so a baseline is only meaningful on the machine it was made on;
+refresh it with `-o benchmarks/baseline.json` after an intended change.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict
+
+from table_games.common import CARDS, Deck, LazyShoe, Shoe
+from table_games.blackjack.blackjack import Blackjack, SpotState, best_total, hard_total, soft_total
+from table_games.blackjack.basic import BASIC_TABLE, BasicPolicy
+from table_games.blackjack.profiler import Profiler
+
+# name -> (unit, setup), where setup(scale) returns a function that runs one
+# timed batch and returns the number of operations it did
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def benchmark(name: str, unit: str):
+    def register(setup: Callable[[int], Callable[[], int]]):
+        BENCHMARKS[name] = (unit, setup)
+        return setup
+    return register
+
+
+@benchmark('deck.standard', 'decks/s')
+def bench_standard(scale):
+    def run():
+        for _ in range(scale * 1000):
+            Deck.Standard()
+        return scale * 1000
+    return run
+
+@benchmark('deck.draw', 'cards/s')
+def bench_draw(scale):
+    shoe = Shoe(6, rng=1)
+    shoe.shuffle()
+    def run():
+        for _ in range(scale * 100):
+            shoe._cursor = 0
+            for _ in range(len(shoe)):
+                shoe.draw()
+        return scale * 100 * 6 * 52
+    return run
+
+@benchmark('deck.shuffle', 'shoes/s')
+def bench_shuffle(scale):
+    shoe = Shoe(6, rng=1)
+    def run():
+        for _ in range(scale * 100):
+            shoe.shuffle()
+        return scale * 100
+    return run
+
+@benchmark('deck.shuffle.lazy', 'shoes/s')
+def bench_lazy_shuffle(scale):
+    # A shuffle and the 52 draws of a 6 deck shoe cut at 5 decks
+    shoe = LazyShoe(6, rng=1)
+    def run():
+        for _ in range(scale * 100):
+            shoe.shuffle()
+            for _ in range(52):
+                shoe.draw()
+        return scale * 100
+    return run
+
+
+def _hands():
+    # Every two-card hand of a club and a diamond, pairs included, as lists and as `SpotState`s
+    lists = [[CARDS[a], CARDS[b]] for a in range(13) for b in range(13, 26)]
+    spots = []
+    for cards in lists:
+        spot = SpotState()
+        for card in cards:
+            spot.dealt(card)
+        spots.append(spot)
+    return lists, spots
+
+def _scoring(score, use_spots):
+    def setup(scale):
+        lists, spots = _hands()
+        hands = spots if use_spots else lists
+        def run():
+            for _ in range(scale * 100):
+                for hand in hands:
+                    score(hand)
+            return scale * 100 * len(hands)
+        return run
+    return setup
+
+for _score in (hard_total, soft_total, best_total):
+    benchmark(f'score.{ _score.__name__ }.list', 'hands/s')(_scoring(_score, False))
+    benchmark(f'score.{ _score.__name__ }.hand', 'hands/s')(_scoring(_score, True))
+
+
+@benchmark('policy.basic_action', 'decisions/s')
+def bench_basic_action(scale):
+    _, spots = _hands()
+    ups = [CARDS[code] for code in range(26, 39)]
+    submit = lambda action: True
+    def run():
+        for _ in range(scale * 10):
+            for spot in spots:
+                for up in ups:
+                    BasicPolicy.Action(None, spot, up, submit)
+        return scale * 10 * len(spots) * len(ups)
+    return run
+
+
+def _engine(players, profile=False):
+    def setup(scale):
+        game = Blackjack(6, True, 5, 5, 100, rng=1)
+        for _ in range(players):
+            game.add_player(BasicPolicy())
+        if profile:
+            Profiler().attach(game)
+        states = [state for _, state in game._players]
+        def run():
+            before = sum(state._hands for state in states)
+            game.simulate_rounds(scale * 2000 // players)
+            return sum(state._hands for state in states) - before
+        return run
+    return setup
+
+benchmark('engine.hands.1p', 'hands/s')(_engine(1))
+benchmark('engine.hands.6p', 'hands/s')(_engine(6))
+benchmark('engine.hands.1p.profiled', 'hands/s')(_engine(1, profile=True))
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from table_games.blackjack.env import VectorEnv, table_actions
+
+    @benchmark('env.steps', 'steps/s')
+    def bench_env(scale):
+        env = VectorEnv(4096, seed=1)
+        obs = [env.reset()[0]]
+        def run():
+            for _ in range(scale * 20):
+                obs[0] = env.step(table_actions(BASIC_TABLE, obs[0]))[0]
+            return scale * 20 * env.num_envs
+        return run
+
+
+def measure(name: str, scale: int = 1, repeat: int = 5) -> float:
+    """The best rate of `name` over `repeat` runs"""
+    _, setup = BENCHMARKS[name]
+    run = setup(scale)
+    run()   # Warm up
+
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops = run()
+        elapsed = time.perf_counter() - start
+        best = max(best, ops / elapsed)
+    return best
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> list:
+    """The benchmarks of `results` more than `tolerance` slower than in `baseline`, as (name, ratio)"""
+    regressions = []
+    for name, result in results['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        ratio = result['rate'] / base['rate']
+        result['baseline'] = base['rate']
+        result['ratio'] = round(ratio, 3)
+        if ratio < 1 - tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('-s', '--scale', type=int, default=1, help='multiply the work of every batch')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='timed runs per benchmark')
+    parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    parser.add_argument('-b', '--baseline', help='compare with the results in this JSON file')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.2, help='slowdown allowed before failing')
+    args = parser.parse_args(argv)
+
+    results = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {},
+    }
+    for name, (unit, _) in BENCHMARKS.items():
+        if args.filter in name:
+            rate = measure(name, args.scale, args.repeat)
+            results['results'][name] = {'rate': round(rate, 1), 'unit': unit}
+            print(f"{ name:<28} { rate:>14,.0f} { unit }", file=sys.stderr)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for name, ratio in regressions:
+            print(f"REGRESSION { name }: { ratio:.2f}x the baseline", file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    print(text)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,4 @@
 from .blackjack import Blackjack, BlackjackState
-from .basic import BasicPolicy
\ No newline at end of file
+from .basic import BasicPolicy
+from .strategy import StrategyTable
+from .events import Event, EventKind, EventSink
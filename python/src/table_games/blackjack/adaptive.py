@@ -0,0 +1,134 @@
+from math import erfc, inf, sqrt
+from os import cpu_count
+from typing import Dict, Tuple
+
+from table_games.common import substream
+
+from .blackjack import PlayerPolicy
+from .montecarlo import SimulationResult, run_jobs, simulate, worker_pool
+
+# Why a cell stopped
+STDERR = 'stderr'           # Its EV reached the target standard error
+SEPARATED = 'separated'     # Its EV is significantly different from that of every other policy under its rules
+MAX_ROUNDS = 'max_rounds'   # It played `max_rounds` rounds first
+
+Cell = Tuple[str, str]
+
+
+class AdaptiveRun:
+    """The results of `run_adaptive`, why each cell stopped, and the number of batches played"""
+
+    def __init__(self) -> None:
+        self.results: Dict[Cell, SimulationResult] = {}
+        self.reasons: Dict[Cell, str] = {}
+        self.batches = 0
+
+    def __repr__(self) -> str:
+        return "\n".join(f"{ cell }: { result } ({ self.reasons.get(cell, 'running') })" for cell, result in self.results.items())
+
+
+def separation(a: SimulationResult, b: SimulationResult) -> float:
+    """How many standard errors of their difference separate the EVs of `a` and `b`"""
+    stderr = sqrt(a.stderr() ** 2 + b.stderr() ** 2)
+    if stderr == 0:
+        return 0.0
+    return abs(a.ev() - b.ev()) / stderr
+
+def _tail(z: float) -> float:
+    """Chance that a standard normal is at least `z` away from 0"""
+    return erfc(z / sqrt(2))
+
+def _critical(p: float) -> float:
+    """The `z` whose `_tail` is `p`, by bisection"""
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        middle = (low + high) / 2
+        if _tail(middle) > p:
+            low = middle
+        else:
+            high = middle
+    return high
+
+def spent(alpha: float, fraction: float) -> float:
+    """
+    The type I error spent by `fraction` of the way through a sequential
+    test of level `alpha`, by the Lan-DeMets spending function that mimics
+    O'Brien-Fleming boundaries: almost nothing early, most of it near the end
+    """
+    if fraction <= 0:
+        return 0.0
+    return _tail(_critical(alpha) / sqrt(min(fraction, 1)))
+
+def boundary(alpha: float, before: float, after: float) -> float:
+    """
+    The separation (see `separation`) a look must reach to reject equal EVs,
+    spending the error of a test of level `alpha` between the fractions `before`
+    and `after` of the way through it. The union bound over the looks keeps
+    the chance of ever rejecting equal EVs within `alpha`.
+    """
+    step = spent(alpha, after) - spent(alpha, before)
+    if step <= 0:
+        return inf
+    return _critical(step)
+
+def _play_batch(args) -> SimulationResult:
+    rounds, seed, policy, players, rules = args
+    return simulate(rounds, seed, policy, players, rules)
+
+def _separated(cell: Cell, results: Dict[Cell, SimulationResult], alpha: float, batch: int, max_rounds: int) -> bool:
+    """Whether `cell`'s EV crossed the boundary of its latest look against every other policy under its rules"""
+    others = [other for other in results if other[0] == cell[0] and other != cell]
+    result = results[cell]
+    needed = boundary(alpha, (result.rounds - batch) / max_rounds, result.rounds / max_rounds)
+    return bool(others) and all(separation(result, results[other]) >= needed for other in others)
+
+
+def run_adaptive(rules: Dict[str, Dict], policies: Dict[str, PlayerPolicy], target_stderr: float = None, alpha: float = None,
+                 batch: int = 20000, max_rounds: int = 10000000, seed = 0, players: int = 1, workers: int = None) -> AdaptiveRun:
+    """
+    Simulates every combination of rule set and policy in batches of `batch`
+    rounds, stopping each cell as soon as its EV is precise enough rather than
+    after a fixed number of rounds.
+
+    A cell stops once the standard error of its EV is at most `target_stderr`,
+    or after `max_rounds` rounds, or once its EV is significantly different
+    from that of every other policy under the same rules. Each batch is a look
+    of a sequential test of level `alpha` (e.g. 0.05) per pair of policies,
+    through `max_rounds` rounds, whose boundary (see `boundary`) accounts for
+    the repeated looks. Cells of different rules aren't compared. Cells are
+    keyed by (rules name, policy name), like `sweep`.
+
+    Every cell deals its own shoes, so the EVs of two cells are independent
+    and the standard error of their difference is that of independent samples.
+
+    Each round of batches is split across a pool of `workers` processes. Batch
+    `i` of a cell is seeded from `seed`, the cell and `i`, so a run is
+    reproducible whatever the number of workers.
+    """
+    if target_stderr is None and alpha is None:
+        raise ValueError("Give a target standard error, an alpha, or both")
+
+    workers = workers or cpu_count() or 1
+    cells = {(rules_name, policy_name): (game_rules, policy)
+             for rules_name, game_rules in rules.items() for policy_name, policy in policies.items()}
+
+    run = AdaptiveRun()
+    run.results = {cell: SimulationResult() for cell in cells}
+    with worker_pool(workers) as pool:
+        while len(run.reasons) < len(cells):
+            active = [cell for cell in cells if cell not in run.reasons]
+            jobs = [(batch, substream(seed, *cell, run.batches), cells[cell][1], players, cells[cell][0]) for cell in active]
+            for cell, result in zip(active, run_jobs(_play_batch, jobs, workers, pool)):
+                run.results[cell].merge(result)
+            run.batches += 1
+
+            for cell in active:
+                result = run.results[cell]
+                if target_stderr is not None and result.stderr() <= target_stderr:
+                    run.reasons[cell] = STDERR
+                elif alpha is not None and _separated(cell, run.results, alpha, batch, max_rounds):
+                    run.reasons[cell] = SEPARATED
+                elif result.rounds >= max_rounds:
+                    run.reasons[cell] = MAX_ROUNDS
+
+    return run
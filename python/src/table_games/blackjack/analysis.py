@@ -0,0 +1,156 @@
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+from table_games.common import Card, CValue
+
+from .blackjack import Blackjack, PlayerState, SpotState
+from .probability import BUST, DEALER_TOTALS, DealerProbabilities
+
+
+def _can_resplit(spot: SpotState, game: Blackjack, player: PlayerState) -> bool:
+    """Whether `game`'s limits on resplitting still let the pair of `spot` split, as `Blackjack` checks them"""
+    if spot._split and spot._cards[0]._value == CValue.ACE.value and not game._rsa:
+        return False
+    if player is not None:
+        hands = sum(1 for other in player._spots if other._root is spot._root)
+    else:
+        hands = 2 if spot._split else 1
+    return hands < game._spc
+
+
+class Analyzer:
+    """
+    Composition-dependent expected value of each play of a hand.
+
+    EVs are per unit of the spot's bet and, like the decisions they inform,
+    conditioned on the dealer not having a blackjack. Three simplifications
+    keep each decision to milliseconds: the dealer's distribution and the
+    player's draws are both fixed at the composition of the decision, rather
+    than depleted by the cards the player goes on to draw; the dealer's hole
+    card isn't conditioned on; and a split is valued as two independent hands
+    with no resplits.
+
+    Intermediate results are kept in LRU transposition caches of at most
+    `maxsize` entries, keyed on the hand (its hard total and whether it holds an
+    ace) and the shoe composition. Reuse one analyzer across calls to keep them warm.
+    """
+
+    def __init__(self, maxsize: int = 1 << 18) -> None:
+        self._maxsize = maxsize
+        self._dealers: Dict[bool, DealerProbabilities] = {}
+        self._stand = lru_cache(maxsize=maxsize)(self._stand_uncached)
+        self._play = lru_cache(maxsize=maxsize)(self._play_uncached)
+        self._hit = lru_cache(maxsize=maxsize)(self._hit_uncached)
+
+    def _dealer(self, h17: bool) -> DealerProbabilities:
+        dealer = self._dealers.get(h17)
+        if dealer is None:
+            dealer = self._dealers[h17] = DealerProbabilities(h17, self._maxsize)
+        return dealer
+
+    def evaluate(self, spot: SpotState, up_card: Card, game: Blackjack, composition: Sequence[int],
+                 player: PlayerState = None) -> Dict[str, float]:
+        """
+        EVs of 'stand', 'hit', 'double' and 'split' for `spot` against
+        `up_card` under `game`'s rules. A play the rules don't allow is None.
+
+        `composition` is what is left in the shoe, as returned by
+        `Deck.composition()`: it excludes the spot's cards and the upcard, and
+        includes the dealer's hole card.
+
+        `player` is the state `spot` belongs to, whose other spots count
+        against `game`'s limit on splits; without it, a spot already split is
+        taken to be one of two hands.
+        """
+        composition = tuple(composition)
+        up = up_card._points
+        h17 = game._h17
+        hard = spot._hard
+        ace = spot._aces > 0
+
+        result = {
+            'stand': self._stand(spot.best_total(), up, composition, h17),
+            'hit': self._hit(hard, ace, up, composition, h17),
+            'double': None,
+            'split': None,
+        }
+
+        if len(spot._cards) == 2 and (game._das or not spot._split):
+            result['double'] = self._double(hard, ace, up, composition, h17)
+
+        if len(spot._cards) == 2 and spot._cards[0]._points == spot._cards[1]._points and _can_resplit(spot, game, player):
+            result['split'] = self._split(spot._cards[0]._points, up, composition, h17, game._das)
+
+        return result
+
+    def best(self, spot: SpotState, up_card: Card, game: Blackjack, composition: Sequence[int],
+             player: PlayerState = None) -> Tuple[str, float]:
+        """The play with the highest EV, and its EV"""
+        plays = self.evaluate(spot, up_card, game, composition, player)
+        return max(((name, ev) for name, ev in plays.items() if ev is not None), key=lambda play: play[1])
+
+    def _stand_uncached(self, total: int, up: int, composition: Tuple[int, ...], h17: bool) -> float:
+        if total > 21:
+            return -1.0
+
+        dealer = self._dealer(h17).outcomes(up, composition)
+        ev = dealer[BUST]
+        for idx, dealer_total in enumerate(DEALER_TOTALS):
+            if total > dealer_total:
+                ev += dealer[idx]
+            elif total < dealer_total:
+                ev -= dealer[idx]
+        return ev
+
+    def _draws(self, composition: Tuple[int, ...]):
+        """(point value, probability) of each possible next card"""
+        remaining = sum(composition)
+        for idx, count in enumerate(composition):
+            if count:
+                yield idx + 1, count / remaining
+
+    def _play_uncached(self, hard: int, ace: bool, up: int, composition: Tuple[int, ...], h17: bool) -> float:
+        """EV of the best of standing and hitting"""
+        if hard > 21:
+            return -1.0
+        total = hard + 10 if ace and hard <= 11 else hard
+        stand = self._stand(total, up, composition, h17)
+        if hard >= 21:
+            return stand
+        return max(stand, self._hit(hard, ace, up, composition, h17))
+
+    def _hit_uncached(self, hard: int, ace: bool, up: int, composition: Tuple[int, ...], h17: bool) -> float:
+        return sum(p * self._play(hard + points, ace or points == 1, up, composition, h17)
+                   for points, p in self._draws(composition))
+
+    def _double(self, hard: int, ace: bool, up: int, composition: Tuple[int, ...], h17: bool) -> float:
+        ev = 0.0
+        for points, p in self._draws(composition):
+            new_hard = hard + points
+            new_ace = ace or points == 1
+            total = new_hard + 10 if new_ace and new_hard <= 11 else new_hard
+            ev += p * self._stand(total, up, composition, h17)
+        return 2 * ev
+
+    def _split(self, points: int, up: int, composition: Tuple[int, ...], h17: bool, das: bool) -> float:
+        ace = points == 1
+        ev = 0.0
+        for drawn, p in self._draws(composition):
+            hard = points + drawn
+            has_ace = ace or drawn == 1
+            if ace:
+                # Split aces get one card each
+                hand = self._stand(hard + 10 if hard <= 11 else hard, up, composition, h17)
+            else:
+                hand = self._play(hard, has_ace, up, composition, h17)
+                if das:
+                    hand = max(hand, self._double(hard, has_ace, up, composition, h17))
+            ev += p * hand
+        return 2 * ev
+
+    def cache_clear(self) -> None:
+        self._stand.cache_clear()
+        self._play.cache_clear()
+        self._hit.cache_clear()
+        for dealer in self._dealers.values():
+            dealer.cache_clear()
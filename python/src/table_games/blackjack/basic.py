@@ -1,4 +1,5 @@
 from .blackjack import *
+from .strategy import DOUBLE_HIT, HIT, STAND, StrategyTable
 
 basic_strategy = {
     'hard': {
@@ -49,8 +50,31 @@ def has_ace(cards: List[Card]):
     return False
 
 
+BASIC_TABLE = StrategyTable(basic_strategy)
+
+_STAND = SpotStandAction()
+_HIT = SpotHitAction()
+_DOUBLE = SpotDoubleAction()
+_SPLIT = SpotSplitAction()
+
+
+def play_table(table: StrategyTable, spot: SpotState, up_card: Card, submit) -> None:
+    """Submits the action `table` gives for `spot`, falling back when a split or double is refused"""
+    if table.split(spot, up_card) and submit(_SPLIT):
+        return
+
+    action = table.play(spot, up_card)
+    if action == STAND: submit(_STAND)
+    elif action == HIT: submit(_HIT)
+    elif not submit(_DOUBLE):
+        submit(_HIT if action == DOUBLE_HIT else _STAND)
+
+
 class BasicPolicy(PlayerPolicy):
 
+    # Subclasses can play a different chart, e.g. `StrategyTable.load(path)`
+    TABLE = BASIC_TABLE
+
     @classmethod
     def PrebetAction(cls, player: PlayerState, submit):
         submit(PlayerSpreadAction(1))
@@ -65,44 +89,7 @@ class BasicPolicy(PlayerPolicy):
     
     @classmethod
     def Action(cls, player: PlayerState, spot: SpotState, up_card: Card, submit):
-
-        action = ""
-        
-        is_pair = True
-        is_pair &= len(spot._cards) == 2
-        is_pair &= spot._cards[0]._value == spot._cards[1]._value
-
-        soft = soft_total(spot._cards)
-        hard = hard_total(spot._cards)
-
-        column = min(10, up_card._value) - 2
-        if column == -1: column = 9
-
-        if is_pair:
-            should_split = basic_strategy['pairs'][min(10, spot._cards[0]._value)][column]
-            if should_split == 'Y':
-                if not submit(SpotSplitAction()): raise Exception()
-                return
-        
-        if (soft <= 21) and (has_ace(spot._cards)):
-            soft = max(13, soft)
-            soft = min(soft, 20)
-            action = basic_strategy['soft'][soft][column]
-        else:
-            hard = max(8, hard)
-            hard = min(hard, 17)
-            action = basic_strategy['hard'][hard][column]
-        
-        if action == 'S': submit(SpotStandAction())
-        elif action == 'H': submit(SpotHitAction())
-        elif action[0] == 'D':
-            if not submit(SpotDoubleAction()):
-                if action[1] == 'S':
-                    submit(SpotStandAction())
-                elif action[1] == 'H':
-                    submit(SpotHitAction())
-                else:
-                    raise Exception()
+        play_table(cls.TABLE, spot, up_card, submit)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,244 @@
+"""
+Lockstep simulation of many tables at once with NumPy.
+
+Requires the optional `numpy` dependency.
+"""
+import numpy as np
+
+from table_games.common import CValue
+
+from .basic import BASIC_TABLE
+from .montecarlo import SimulationResult
+from .strategy import COLUMNS, DOUBLE_HIT, DOUBLE_STAND, HARD, HIT, PAIRS, ROWS, SOFT, SPLIT, UPCARD_COLUMN, StrategyTable
+
+ACE = CValue.ACE.value
+
+# Point value of each rank, and chart column of each upcard point value
+_POINTS = np.array([0] + [min(value.value, 10) for value in CValue], dtype=np.int16)
+_COLUMN = np.array([0] + list(UPCARD_COLUMN[1:]), dtype=np.intp)
+
+
+class BatchBlackjack:
+    """
+    `tables` tables of one player each, played in lockstep as arrays.
+
+    Every table has its own shoe and plays the same rules as `Blackjack`
+    (`h17`, `das`, `spc`, `rsa`, `bj`) with a flat bet of `bet` on one spot,
+    following `table` and never taking insurance, just like `BasicPolicy`. Given
+    the same shoe, a table ends up with exactly the bank a `Blackjack` game
+    would (in units of `bet`).
+
+    Shoes are arrays of card ranks (`CValue` values). If `shoes` isn't given,
+    shuffled shoes are drawn from `seed` and a card is burned from each;
+    given shoes are dealt from their first card. Reshuffles use `seed` either way.
+    """
+
+    def __init__(self, tables: int, deck_count: int, h17: bool, pen: float, das = True, spc = 4, rsa = True, bj = 1.5,
+                 table: StrategyTable = BASIC_TABLE, bet = 1, seed = None, shoes: np.ndarray = None) -> None:
+        self._tables = tables
+        self._h17 = h17
+        self._das = das
+        self._spc = spc
+        self._rsa = rsa
+        self._bj = bj
+        self._bet = bet
+        self._actions = np.frombuffer(table._actions, dtype=np.uint8).copy()
+        self._rng = np.random.default_rng(seed)
+
+        # Reshuffle once fewer cards than this are left, like `Blackjack`
+        self._reserve = (deck_count - pen) * 52
+
+        if shoes is None:
+            ranks = np.tile(np.arange(1, len(CValue) + 1, dtype=np.uint8), 4 * deck_count)
+            self._shoes = self._rng.permuted(np.tile(ranks, (tables, 1)), axis=1)
+            self._cursor = np.ones(tables, dtype=np.intp)
+        else:
+            self._shoes = np.array(shoes, dtype=np.uint8).reshape(tables, -1)
+            self._cursor = np.zeros(tables, dtype=np.intp)
+
+        self.bank = np.zeros(tables)
+        self.result = SimulationResult()
+
+    def _draw(self, rows: np.ndarray) -> np.ndarray:
+        cards = self._shoes[rows, self._cursor[rows]]
+        self._cursor[rows] += 1
+        return cards
+
+    def play_rounds(self, n: int) -> SimulationResult:
+        """Plays `n` rounds at every table and returns the running totals"""
+        for _ in range(n):
+            self.play_round()
+        return self.result
+
+    def play_round(self) -> np.ndarray:
+        """Plays a round at every table and returns each table's net result"""
+        K = self._tables
+        H = self._spc
+        everyone = np.arange(K)
+        actions = self._actions
+
+        # Deal, in the same order as `Blackjack`
+        p1 = self._draw(everyone)
+        d1 = self._draw(everyone)
+        p2 = self._draw(everyone)
+        d2 = self._draw(everyone)
+
+        # One slot per hand a spot can be split into
+        first = np.zeros((K, H), dtype=np.uint8)
+        second = np.zeros((K, H), dtype=np.uint8)
+        hard = np.zeros((K, H), dtype=np.int16)
+        aces = np.zeros((K, H), dtype=np.int16)
+        cards = np.zeros((K, H), dtype=np.int16)
+        bets = np.zeros((K, H))
+        split = np.zeros((K, H), dtype=bool)
+        hands = np.ones(K, dtype=np.intp)
+
+        first[:, 0] = p1
+        second[:, 0] = p2
+        hard[:, 0] = _POINTS[p1] + _POINTS[p2]
+        aces[:, 0] = (p1 == ACE).astype(np.int16) + (p2 == ACE)
+        cards[:, 0] = 2
+        bets[:, 0] = self._bet
+
+        dealer_hard = _POINTS[d1] + _POINTS[d2]
+        dealer_aces = (d1 == ACE).astype(np.int16) + (d2 == ACE)
+        dealer_blackjack = (dealer_aces > 0) & (dealer_hard == 11)
+        playing = ~dealer_blackjack
+        column = _COLUMN[_POINTS[d1]]
+
+        for h in range(H):
+            live = playing & (hands > h)
+            if h == 0:
+                live &= ~((aces[:, 0] > 0) & (hard[:, 0] == 11))
+
+            while True:
+                rows = np.flatnonzero(live)
+                if rows.size == 0:
+                    break
+
+                # Split hands are dealt their second card; split aces then stand,
+                # unless it's an ace they may split again
+                waiting = rows[cards[rows, h] == 1]
+                if waiting.size:
+                    card = self._draw(waiting)
+                    second[waiting, h] = card
+                    hard[waiting, h] += _POINTS[card]
+                    aces[waiting, h] += card == ACE
+                    cards[waiting, h] = 2
+                    stands = first[waiting, h] == ACE
+                    if self._rsa:
+                        stands &= (card != ACE) | (hands[waiting] >= H)
+                    live[waiting[stands]] = False
+
+                    rows = np.flatnonzero(live)
+                    if rows.size == 0:
+                        break
+
+                # Splits
+                pair = (cards[rows, h] == 2) & (first[rows, h] == second[rows, h])
+                pair_index = (PAIRS * ROWS + _POINTS[first[rows, h]]) * COLUMNS + column[rows]
+                splits = pair & (actions[pair_index] == SPLIT) & (hands[rows] < H)
+                if not self._rsa:
+                    splits &= ~((first[rows, h] == ACE) & split[rows, h])
+
+                splitting = rows[splits]
+                if splitting.size:
+                    self._split(splitting, h, first, second, hard, aces, cards, bets, split)
+                    hands[splitting] += 1
+
+                # Everyone else plays the hard or soft chart
+                rows = rows[~splits]
+                if rows.size == 0:
+                    continue
+
+                hand_hard = hard[rows, h]
+                soft = (aces[rows, h] > 0) & (hand_hard <= 11)
+                index = np.where(soft, SOFT * ROWS + hand_hard + 10, HARD * ROWS + hand_hard) * COLUMNS + column[rows]
+                action = actions[index]
+
+                can_double = cards[rows, h] == 2
+                if not self._das:
+                    can_double &= ~split[rows, h]
+                doubling = ((action == DOUBLE_HIT) | (action == DOUBLE_STAND)) & can_double
+                hitting = (action == HIT) | ((action == DOUBLE_HIT) & ~can_double)
+
+                drawing = rows[doubling | hitting]
+                if drawing.size:
+                    card = self._draw(drawing)
+                    hard[drawing, h] += _POINTS[card]
+                    aces[drawing, h] += card == ACE
+                    cards[drawing, h] += 1
+
+                doubled = rows[doubling]
+                bets[doubled, h] *= 2
+
+                hit = rows[hitting]
+                live[rows[~hitting]] = False
+                live[hit[hard[hit, h] > 21]] = False
+
+        # The dealer plays out every table without a blackjack
+        while True:
+            dealer_soft = np.where(dealer_aces > 0, dealer_hard + 10, dealer_hard)
+            stands = (dealer_hard >= 17) | ((dealer_soft >= 18) & (dealer_soft <= 21))
+            if not self._h17:
+                stands |= dealer_soft == 17
+            rows = np.flatnonzero(playing & ~stands)
+            if rows.size == 0:
+                break
+            card = self._draw(rows)
+            dealer_hard[rows] += _POINTS[card]
+            dealer_aces[rows] += card == ACE
+
+        dealer_total = np.where((dealer_aces > 0) & (dealer_hard <= 11), dealer_hard + 10, dealer_hard)[:, None]
+        total = np.where((aces > 0) & (hard <= 11), hard + 10, hard)
+        natural = ~split & (cards == 2) & (aces > 0) & (hard == 11)
+        dealt = (np.arange(H) < hands[:, None]) & playing[:, None]
+
+        blackjacks = dealt & natural
+        losses = dealt & ~natural & ((total > 21) | ((dealer_total <= 21) & (total < dealer_total)))
+        wins = dealt & ~natural & (total <= 21) & ((dealer_total > 21) | (total > dealer_total))
+        pushes = dealt & ~natural & (total <= 21) & (dealer_total <= 21) & (total == dealer_total)
+
+        payout = np.select([blackjacks, wins, losses], [self._bj, 1.0, -1.0], 0.0)
+        net = (payout * bets).sum(axis=1)
+        net[dealer_blackjack] = -self._bet
+
+        self.bank += net
+        result = self.result
+        result.record_rounds(K, float(net.sum()), float((net * net).sum()))
+        result.hands += int(dealt.sum()) + int(dealer_blackjack.sum())
+        result.wins += int(wins.sum())
+        result.losses += int(losses.sum()) + int(dealer_blackjack.sum())
+        result.pushes += int(pushes.sum())
+        result.blackjacks += int(blackjacks.sum())
+        result.bank += float(net.sum())
+        result.wagered += K * self._bet
+
+        # Reshuffle the shoes past the cut card, and burn a card
+        rows = np.flatnonzero(self._shoes.shape[1] - self._cursor < self._reserve)
+        if rows.size:
+            self._shoes[rows] = self._rng.permuted(self._shoes[rows], axis=1)
+            self._cursor[rows] = 1
+
+        return net
+
+    @staticmethod
+    def _split(rows, h, first, second, hard, aces, cards, bets, split) -> None:
+        """Splits hand `h` of each of `rows`, making room for the new hand right after it"""
+        for slots in (first, second, hard, aces, cards, bets, split):
+            slots[rows, h + 2:] = slots[rows, h + 1:-1]
+
+        card = second[rows, h]
+        first[rows, h + 1] = card
+        second[rows, h + 1] = 0
+        hard[rows, h + 1] = _POINTS[card]
+        aces[rows, h + 1] = card == ACE
+        cards[rows, h + 1] = 1
+        bets[rows, h + 1] = bets[rows, h]
+        split[rows, h + 1] = True
+
+        second[rows, h] = 0
+        hard[rows, h] = _POINTS[first[rows, h]]
+        aces[rows, h] = first[rows, h] == ACE
+        cards[rows, h] = 1
+        split[rows, h] = True
@@ -2,20 +2,91 @@ from enum import Enum
 from copy import deepcopy
 from typing import List, Tuple
 
-from table_games.common import CValue, Card, Deck
+from table_games.common import CValue, Card, Count, CountingSystem, CSMShoe, Deck, LazyShoe, Shoe
+
+from .events import Event, EventKind, EventSink, PrintSink
 
 MAX_PLAYERS = 6
 
-class SpotState:
-    
+class Hand:
+    """
+    The cards held by a spot or by the dealer.
+
+    The hard total, the number of aces and the pair and blackjack flags are
+    updated as each card is dealt, so scoring a hand never rescans its cards.
+    """
+
     def __init__(self):
-        self._bet = 0
         self._cards: List[Card] = []
-        self._split = False
-        self._insured = False
+        self._hard = 0
+        self._aces = 0
+        self._pair = False
+        self._blackjack = False
 
     def dealt(self, card: Card) -> None:
         self._cards.append(card)
+        self._hard += card._points
+        if card._value == CValue.ACE.value:
+            self._aces += 1
+
+        two_cards = len(self._cards) == 2
+        self._pair = two_cards and self._cards[0]._value == card._value
+        self._blackjack = two_cards and self._aces > 0 and self._hard == 11
+
+    def split(self) -> Card:
+        """Removes and returns the second card of a pair"""
+        first, second = self._cards
+        self.clear()
+        self.dealt(first)
+        return second
+
+    def clear(self) -> None:
+        self._cards.clear()
+        self._hard = 0
+        self._aces = 0
+        self._pair = False
+        self._blackjack = False
+
+    def hard_total(self) -> int:
+        return self._hard
+
+    def soft_total(self) -> int:
+        return self._hard + 10 if self._aces else self._hard
+
+    def best_total(self) -> int:
+        return self._hard + 10 if self.is_soft() else self._hard
+
+    def is_soft(self) -> bool:
+        """True if an ace can be counted as 11 without busting"""
+        return self._aces > 0 and self._hard <= 11
+
+    def is_pair(self) -> bool:
+        return self._pair
+
+    def is_blackjack(self) -> bool:
+        return self._blackjack
+
+    def __len__(self):
+        return len(self._cards)
+
+    def __getitem__(self, idx):
+        return self._cards[idx]
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __repr__(self) -> str:
+        return repr(self._cards)
+
+
+class SpotState(Hand):
+    
+    def __init__(self):
+        super().__init__()
+        self._bet = 0
+        self._split = False
+        self._insured = False
+        self._root = self       # The spot this hand was split from, for the split limit
 
 
 class SpotAction: pass
@@ -37,6 +108,16 @@ class PlayerState:
     def __init__(self) -> None:
         self._spots = [SpotState()]
         self._bank = 0
+        self._count: Count = None     # The live count of the policy's `COUNT` system, if it has one
+        self._limits = (0, 0)         # The (minimum, maximum) bet of the table the player sits at
+
+        # Running tallies of every hand this player has settled
+        self._wagered = 0       # Initial bets, before doubles and splits
+        self._hands = 0
+        self._wins = 0
+        self._losses = 0
+        self._pushes = 0
+        self._blackjacks = 0
 
 
 class PlayerAction: pass
@@ -47,6 +128,9 @@ class PlayerSpreadAction(PlayerAction):
 
 class PlayerPolicy:
 
+    # The counting system whose live count is given to the player as `PlayerState._count`
+    COUNT: CountingSystem = None
+
     @classmethod
     def PrebetAction(cls, player: PlayerState, submit):
         raise NotImplementedError()
@@ -95,9 +179,11 @@ class BlackjackState(Enum):
 
 
 def hard_total(cards: List[Card]):
-    return sum(map(lambda card: min(card._value, 10), cards))
+    if isinstance(cards, Hand): return cards._hard
+    return sum(card._points for card in cards)
 
 def soft_total(cards: List[Card]):
+    if isinstance(cards, Hand): return cards.soft_total()
     total = hard_total(cards)
 
     has_ace = False
@@ -122,19 +208,151 @@ def best_total(cards, against=17):
     return hard if (hard >= 17) else soft
 
 def is_blackjack(cards):
+    if isinstance(cards, Hand): return cards._blackjack
     if len(cards) != 2: return False
     if soft_total(cards) != 21: return False
     return True
 
 
-class Wrapper:
-    def __init__(self, value) -> None:
-        self.value = value
+class PlayerView:
+    """
+    A read-only view of a `PlayerState`, handed to policies by
+    `Blackjack.simulate_rounds` instead of a deep copy.
+
+    Only the attributes in `VISIBLE` can be read, and `_spots` are copies.
+    """
+
+    # Read through to the state; `_count` is the live count, as in a deep copy
+    VISIBLE = frozenset(('_bank', '_count', '_limits', '_wagered', '_hands', '_wins', '_losses', '_pushes', '_blackjacks'))
+
+    __slots__ = ('__player',)
+
+    def __init__(self, player: PlayerState) -> None:
+        object.__setattr__(self, '_PlayerView__player', player)
+
+    @property
+    def _spots(self):
+        return tuple(deepcopy(spot) for spot in self.__player._spots)
+
+    def __getattr__(self, name):
+        if name in PlayerView.VISIBLE:
+            return getattr(self.__player, name)
+        raise AttributeError(f"PlayerView has no attribute { name !r}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PlayerView is read-only")
+
+
+class _Seat:
+    """
+    A player sitting at the table.
+
+    The seat's `submit` callbacks are bound once when the player joins, and the
+    spot being played is kept on the seat, so no closures are built per decision.
+    """
+
+    def __init__(self, game, index: int, policy: PlayerPolicy, state: PlayerState) -> None:
+        self._game = game
+        self._index = index
+        self._policy = policy
+        self._state = state
+        self._view = PlayerView(state)
+
+        self._spot: SpotState = None
+        self._spot_idx = 0
+        self._done = False
+
+        self._submit_spread = self.submit_spread
+        self._submit_bet = self.submit_bet
+        self._submit_action = self.submit_action
+
+    def submit_spread(self, action: PlayerAction):
+        if type(action) is PlayerSpreadAction:
+            desired_spots = action.spots
+
+            if self._game._events is not None:
+                self._game._events.emit(Event(EventKind.SPREAD, self._index, amount=desired_spots))
+
+            if desired_spots > (MAX_PLAYERS // len(self._game._players)):
+                return False
+            else:
+                self._state._spots = [SpotState() for _ in range(desired_spots)]
+                return True
+        else:
+            return False
+
+    def submit_bet(self, bet):
+        game = self._game
+        if bet < game._tmin: return False
+        if bet > game._tmax: return False
+
+        for spot in self._state._spots:
+            spot._bet = bet
+            self._state._bank -= bet
+            self._state._wagered += bet
+
+        return True
+
+    def submit_action(self, action: SpotAction) -> bool:
+        game = self._game
+        events = game._events
+        spot = self._spot
+        playerState = self._state
+
+        if type(action) is SpotStandAction:
+            if events is not None:
+                events.emit(Event(EventKind.STAND, self._index, spot, up_card=game._dealer[0]))
+            self._done = True
+            return True
+        elif type(action) is SpotHitAction:
+            card = game._deck.draw()
+            spot.dealt(card)
+            if events is not None:
+                events.emit(Event(EventKind.HIT, self._index, spot, card, game._dealer[0]))
+            if spot._hard > 21:
+                if events is not None:
+                    events.emit(Event(EventKind.BUST, self._index, spot, card, game._dealer[0]))
+                self._done = True
+            return True
+        elif type(action) is SpotDoubleAction:
+            if len(spot._cards) != 2: return False
+            if spot._split == True and game._das == False: return False
+
+            card = game._deck.draw()
+            spot.dealt(card)
+            if events is not None:
+                events.emit(Event(EventKind.DOUBLE, self._index, spot, card, game._dealer[0]))
+            playerState._bank -= spot._bet
+            spot._bet *= 2
+            
+            self._done = True
+            return True
+        elif type(action) is SpotSplitAction:
+            if len(spot._cards) != 2: return False
+            if spot._cards[0]._points != spot._cards[1]._points: return False
+            if spot._split and spot._cards[0]._value == CValue.ACE.value and not game._rsa: return False
+
+            hands = sum(1 for other in playerState._spots if other._root is spot._root)
+            if hands >= game._spc: return False
+
+            if events is not None:
+                events.emit(Event(EventKind.SPLIT, self._index, spot, up_card=game._dealer[0]))
+            new_spot = SpotState()
+            new_spot._bet = spot._bet
+            playerState._bank -= new_spot._bet
+            new_spot.dealt(spot.split())
+            new_spot._root = spot._root
+            new_spot._split = True
+            spot._split = True
+            playerState._spots.insert(self._spot_idx+1, new_spot)
+            self._spot_idx -= 1
+            self._done = True
+            return True
 
 
 class Blackjack:
 
-    def __init__(self, deck_count: int, h17: bool, pen: float, tmin: int, tmax: int, das = True, spc = 4, rsa = True, bj = 1.5) -> None:
+    def __init__(self, deck_count: int, h17: bool, pen: float, tmin: int, tmax: int, das = True, spc = 4, rsa = True, bj = 1.5, events: EventSink = None, rng = None, shoe: Deck = None, csm = False, lazy = False) -> None:
         """
         Arguments:
             deck_count: The number of decks in the shoe
@@ -146,6 +364,11 @@ class Blackjack:
             spc: The number of hands a player is allowed to split to
             rsa: True if the player is allowed to re-split aces
             bj: The pay rate of getting a blackjack
+            events: Where to send the events of the game, or None to not build them at all
+            rng: The `random.Random` or seed the shoe is shuffled with, or None to use the global `random` module
+            shoe: The shoe to deal from, e.g. a `ReplayShoe`, instead of a new `Shoe` of `deck_count` decks
+            csm: True if the shoe is a continuous shuffling machine, taking back the cards of each round (`pen` is ignored)
+            lazy: True to shuffle the shoe as it is dealt (`LazyShoe`) instead of all at once when it is reshuffled
         """
         
         self._deck_count = deck_count
@@ -157,227 +380,257 @@ class Blackjack:
         self._spc = spc
         self._rsa = rsa
         self._bj = bj
+        self._events = events
+        self._csm = csm
 
         self._players: List[Tuple[PlayerPolicy, PlayerState]] = []
-        self._deck = Deck.Standard()
-        for _ in range(self._deck_count - 1):
-            self._deck += Deck.Standard()
+        self._seats: List[_Seat] = []
+        if shoe is None:
+            shoe = (CSMShoe if csm else LazyShoe if lazy else Shoe)(self._deck_count, rng)
+        self._deck = shoe
         self._deck.shuffle()
-        self._deck.draw()
+        self._deck.burn()
 
         self._state = BlackjackState.PREBETTING
-        self._dealer: List[Card] = []
+        self._dealer = Hand()
 
-    def add_player(self, player: PlayerPolicy):
+    def add_player(self, player: PlayerPolicy, state: PlayerState = None):
+        """Seats `player`, with a fresh `PlayerState` or with `state` when they come from another table"""
         if len(self._players) >= MAX_PLAYERS:
             return False
         else:
-            self._players.append((player, PlayerState()))
+            if state is None:
+                state = PlayerState()
+            if getattr(player, 'COUNT', None) is not None:
+                state._count = self._deck.track(player.COUNT)
+            state._limits = (self._tmin, self._tmax)
+            self._players.append((player, state))
+            self._seats.append(_Seat(self, len(self._seats), player, state))
             return True
+
+    def remove_player(self, state: PlayerState) -> bool:
+        """Unseats the player with `state`; only allowed between rounds"""
+        if self._state != BlackjackState.PREBETTING:
+            raise RuntimeError("Players can only leave between rounds")
+
+        for idx, (_, player_state) in enumerate(self._players):
+            if player_state is state:
+                del self._players[idx]
+                del self._seats[idx]
+                for seat_idx, seat in enumerate(self._seats):
+                    seat._index = seat_idx
+                return True
+        return False
         
     def next(self) -> bool:
         if len(self._players) <= 0: return False
 
         if self._state == BlackjackState.PREBETTING:
-            for playerPolicy, playerState in self._players:
-                
-                def submit(action: PlayerAction):
-                    if type(action) is PlayerSpreadAction:
-                        desired_spots = action.spots
+            self._prebet(False)
+        elif self._state == BlackjackState.BETTING:
+            self._bet(False)
+        elif self._state == BlackjackState.DEALING:
+            self._deal(False)
+        elif self._state == BlackjackState.ACTION:
+            self._action()
+        elif self._state == BlackjackState.RESULTS:
+            self._results()
+        elif self._state == BlackjackState.CLEANUP:
+            self._cleanup()
 
-                        print(f"Desired spots: { desired_spots }")
+        return True
 
-                        if desired_spots > (MAX_PLAYERS // len(self._players)):
-                            return False
-                        else:
-                            playerState._spots = [SpotState() for _ in range(desired_spots)]
-                            return True
-                    else:
-                        return False
-                    
-                playerPolicy.PrebetAction(deepcopy(playerState), submit)
-            
-            self._state = BlackjackState.BETTING
+    def simulate_rounds(self, n: int) -> int:
+        """
+        Plays `n` whole rounds in one call, finishing any round already in
+        progress first.
 
-        elif self._state == BlackjackState.BETTING:
-            for playerPolicy, playerState in self._players:
-                
-                def submit(bet):
-                    if bet < self._tmin: return False
-                    if bet > self._tmax: return False
+        The rounds are played exactly as stepping through `next()` would play
+        them, except that policies are handed a read-only `PlayerView` of their
+        state instead of a deep copy.
 
-                    for spot in playerState._spots:
-                        spot._bet = bet
-                        playerState._bank -= bet
+        Returns the number of rounds played
+        """
+        if len(self._players) <= 0: return 0
 
-                    return True
-                    
-                playerPolicy.Bet(deepcopy(playerState), submit)
+        while self._state != BlackjackState.PREBETTING:
+            self.next()
 
-            self._state = BlackjackState.DEALING
+        for _ in range(n):
+            self._prebet(True)
+            self._bet(True)
+            self._deal(True)
+            if self._state == BlackjackState.ACTION:
+                self._action()
+                self._results()
+            self._cleanup()
 
-        elif self._state == BlackjackState.DEALING:
-            for playerPolicy, playerState in self._players:
-                for spot in playerState._spots:
-                    spot.dealt(self._deck.draw())
+        return n
+
+    def _prebet(self, view: bool) -> None:
+        for seat in self._seats:
+            seat._policy.PrebetAction(seat._view if view else deepcopy(seat._state), seat._submit_spread)
+        
+        self._state = BlackjackState.BETTING
+
+    def _bet(self, view: bool) -> None:
+        for seat in self._seats:
+            seat._policy.Bet(seat._view if view else deepcopy(seat._state), seat._submit_bet)
 
-            self._dealer.append(self._deck.draw())
+        self._state = BlackjackState.DEALING
 
-            for playerPolicy, playerState in self._players:
+    def _deal(self, view: bool) -> None:
+        if self._events is not None:
+            self._events.emit(Event(EventKind.ROUND_START))
+
+        for playerPolicy, playerState in self._players:
+            # A player whose bet was refused sits the round out
+            if playerState._spots and playerState._spots[0]._bet == 0:
+                playerState._spots.clear()
+            for spot in playerState._spots:
+                spot.dealt(self._deck.draw())
+
+        self._dealer.dealt(self._deck.draw())
+
+        for playerPolicy, playerState in self._players:
+            for spot in playerState._spots:
+                spot.dealt(self._deck.draw())
+                
+        self._dealer.dealt(self._deck.draw_hidden())
+
+        if self._dealer[0]._value == 1:
+            # Insurance
+            for seat in self._seats:
+                playerState = seat._state
+                takes_insurance = seat._policy.InsuranceAction(seat._view if view else deepcopy(playerState))
+                if takes_insurance:
+                    for spot in playerState._spots:
+                        playerState._bank -= 0.5 * spot._bet
+                        spot._insured = True
+
+        if self._dealer.is_blackjack():
+            self._deck.reveal(self._dealer[1])
+            if self._events is not None:
+                self._events.emit(Event(EventKind.DEALER_BLACKJACK))
+            for seat in self._seats:
+                playerState = seat._state
+                playerState._hands += len(playerState._spots)
+                playerState._losses += len(playerState._spots)
                 for spot in playerState._spots:
+                    payout = (3/2) * spot._bet if spot._insured else 0
+                    playerState._bank += payout
+                    if self._events is not None:
+                        self._events.emit(Event(EventKind.SETTLE, seat._index, spot, amount=payout))
+
+            self._state = BlackjackState.CLEANUP
+        else:
+            self._state = BlackjackState.ACTION
+
+    def _action(self) -> None:
+        up_card = self._dealer[0]
+
+        for seat in self._seats:
+            spots = seat._state._spots
+            seat._spot_idx = 0
+            while seat._spot_idx < len(spots):
+                spot = spots[seat._spot_idx]
+                if len(spot._cards) == 1:
                     spot.dealt(self._deck.draw())
-                    
-            self._dealer.append(self._deck.draw())
-
-            if self._dealer[0]._value == 1:
-                # Insurance
-                for playerPolicy, playerState in self._players:
-                    takes_insurance = playerPolicy.InsuranceAction(deepcopy(playerState))
-                    if takes_insurance:
-                        for spot in playerState._spots:
-                            playerState._bank -= 0.5 * spot._bet
-                            spot._insured = True
-
-            if is_blackjack(self._dealer):
-                print('Dealer has a blackjack!')
-                for playerPolicy, playerState in self._players:
-                    for spot in playerState._spots:
-                        if spot._insured:
-                            playerState._bank += (3/2) * spot._bet
 
-                self._state = BlackjackState.CLEANUP
-            else:
-                self._state = BlackjackState.ACTION
+                    # Split aces stand on their second card, unless it's an ace they may split again
+                    split_aces = spot._cards[0]._value == CValue.ACE.value
+                    dealt_second_ace = spot._cards[1]._value == CValue.ACE.value
+                    can_resplit = self._rsa and sum(1 for other in spots if other._root is spot._root) < self._spc
+                    has_action = (not split_aces) or (dealt_second_ace and can_resplit)
 
-        elif self._state == BlackjackState.ACTION:
-            for playerPolicy, playerState in self._players:
-                spot_idx = Wrapper(0)
-                while spot_idx.value < len(playerState._spots):
-                    spot = playerState._spots[spot_idx.value]
-                    if len(spot._cards) == 1:
-                        spot.dealt(self._deck.draw())
-
-                        split_aces = spot._cards[0]._value == CValue.ACE.value
-                        dealt_second_ace = spot._cards[1]._value == CValue.ACE.value
-                        has_action = (not split_aces) or dealt_second_ace
-
-                        if not has_action:
-                            spot_idx.value += 1
-                            continue
-                    elif len(spot._cards) == 2 and soft_total(spot._cards) == 21:
-                        print(f"{ spot._cards }")
-                        print("Blackjack!")
-                        spot_idx.value += 1
+                    if not has_action:
+                        seat._spot_idx += 1
                         continue
+                elif spot.is_blackjack():
+                    if self._events is not None:
+                        self._events.emit(Event(EventKind.BLACKJACK, seat._index, spot))
+                    seat._spot_idx += 1
+                    continue
+
+                seat._spot = spot
+                seat._done = False
+                while not seat._done:
+                    seat._policy.Action(seat._state, spot, up_card, seat._submit_action)
+                
+                seat._spot_idx += 1
 
+        self._state = BlackjackState.RESULTS
 
-                    done = Wrapper(False)
-                    
-                    while not done.value:
-
-                        def submit(action: SpotAction) -> bool:
-                            if type(action) is SpotStandAction:
-                                print(f'STAND on { spot._cards } vs { self._dealer[0] }')
-                                done.value = True
-                                return True
-                            elif type(action) is SpotHitAction:
-                                print(f'HIT on { spot._cards } vs { self._dealer[0] }')
-                                spot.dealt(self._deck.draw())
-                                if hard_total(spot._cards) > 21:
-                                    print(f"You drew a { spot._cards[-1] } and busted!")
-                                    done.value = True
-                                return True
-                            elif type(action) is SpotDoubleAction:
-                                if len(spot._cards) != 2: return False
-                                if spot._split == True and self._das == False: return False
-
-                                print(f'DOUBLE on { spot._cards } vs { self._dealer[0] }')
-                                spot.dealt(self._deck.draw())
-                                print(f"You drew a { spot._cards[-1] }!")
-                                playerState._bank -= spot._bet
-                                spot._bet *= 2
-                                
-                                done.value = True
-                                return True
-                            elif type(action) is SpotSplitAction:
-                                if len(spot._cards) != 2: return False
-                                a_val = min(10, spot._cards[0]._value)
-                                b_val = min(10, spot._cards[1]._value)
-                                if a_val != b_val: return False
-
-                                print(f'SPLIT on { spot._cards } vs { self._dealer[0] }')
-                                new_spot = SpotState()
-                                new_spot._bet = spot._bet
-                                playerState._bank -= new_spot._bet
-                                new_spot.dealt(spot._cards[1])
-                                new_spot._split = True
-                                spot._split = True
-                                playerState._spots.insert(spot_idx.value+1, new_spot)
-                                spot._cards.remove(spot._cards[1])
-                                spot_idx.value -= 1
-                                done.value = True
-                                return True
-                            
-                        playerPolicy.Action(playerState, spot, self._dealer[0], submit)
-                    
-                    spot_idx.value += 1
-
-            self._state = BlackjackState.RESULTS
+    def _results(self) -> None:
+        self._deck.reveal(self._dealer[1])
 
-        elif self._state == BlackjackState.RESULTS:
-            
-            while True:
-                hard = hard_total(self._dealer)
-                soft = soft_total(self._dealer)
-
-                if hard >= 17:
-                    break
-                elif soft <= 21 and soft >= 18:
-                    break
+        while True:
+            hard = self._dealer.hard_total()
+            soft = self._dealer.soft_total()
+
+            if hard >= 17:
+                break
+            elif soft <= 21 and soft >= 18:
+                break
+            elif soft == 17 and not self._h17:
+                break
+            else:
+                self._dealer.dealt(self._deck.draw())
+
+        dealer_total = self._dealer.best_total()
+
+        for seat in self._seats:
+            playerState = seat._state
+            playerState._hands += len(playerState._spots)
+            for spot in playerState._spots:
+                spot_total = spot.best_total()
+                if (not spot._split) and spot.is_blackjack():
+                    payout = (1 + self._bj) * spot._bet
+                    playerState._blackjacks += 1
+                elif spot_total > 21:           # Player busted
+                    payout = 0
+                    playerState._losses += 1
+                elif dealer_total > 21:         # Dealer busted
+                    payout = 2 * spot._bet
+                    playerState._wins += 1
+                elif spot_total == dealer_total:# Push
+                    payout = spot._bet
+                    playerState._pushes += 1
+                elif spot_total < dealer_total: # Lost
+                    payout = 0
+                    playerState._losses += 1
+                elif spot_total > dealer_total:
+                    payout = 2 * spot._bet
+                    playerState._wins += 1
                 else:
-                    self._dealer.append(self._deck.draw())
+                    raise Exception()
 
-            dealer_total = best_total(self._dealer)
+                playerState._bank += payout
+                if self._events is not None:
+                    self._events.emit(Event(EventKind.SETTLE, seat._index, spot, amount=payout))
 
-            for playerPolicy, playerState in self._players:
-                for spot in playerState._spots:
-                    spot_total = best_total(spot._cards, dealer_total)
-                    if (not spot._split) and (len(spot._cards) == 2) and (soft_total(spot._cards) == 21):
-                        playerState._bank += (1 + self._bj) * spot._bet
-                    elif spot_total > 21:           # Player busted
-                        continue
-                    elif dealer_total > 21:         # Dealer busted
-                        playerState._bank += 2 * spot._bet
-                    elif spot_total == dealer_total:# Push
-                        playerState._bank += spot._bet
-                    elif spot_total < dealer_total: # Lost
-                        continue
-                    elif spot_total > dealer_total:
-                        playerState._bank += 2 * spot._bet
-                    else:
-                        raise Exception()
+        self._state = BlackjackState.CLEANUP
 
-            self._state = BlackjackState.CLEANUP
+    def _cleanup(self) -> None:
+        if self._events is not None:
+            self._events.emit(Event(EventKind.ROUND_END))
 
-        elif self._state == BlackjackState.CLEANUP:
-            self._dealer.clear()
-            for playerPolicy, playerState in self._players:
-                for spot in playerState._spots:
-                    spot._bet = 0
-                    spot._cards.clear()
-                playerState._spots.clear()
+        self._dealer.clear()
+        for playerPolicy, playerState in self._players:
+            for spot in playerState._spots:
+                spot._bet = 0
+                spot.clear()
+            playerState._spots.clear()
 
-            if (self._deck_count - self._pen) * 52 > len(self._deck):
-                print("Shuffling...")
-                self._deck = Deck.Standard()
-                for _ in range(self._deck_count - 1):
-                    self._deck += Deck.Standard()
-                self._deck.shuffle()
-                self._deck.draw()
+        if self._csm:
+            self._deck.recycle()
+        elif (self._deck_count - self._pen) * 52 > len(self._deck):
+            if self._events is not None:
+                self._events.emit(Event(EventKind.SHUFFLE))
+            self._deck.shuffle()
+            self._deck.burn()
 
-            self._state = BlackjackState.PREBETTING
-
-        return True
+        self._state = BlackjackState.PREBETTING
 
 
 class CLIPlayer(PlayerPolicy):
@@ -435,7 +688,7 @@ class CLIPlayer(PlayerPolicy):
     
 
 if __name__ == "__main__":
-    game = Blackjack(2, True, 1, 10, 300, True, 4, False, 3/2)
+    game = Blackjack(2, True, 1, 10, 300, True, 4, False, 3/2, events=PrintSink())
     player = CLIPlayer("David")
     game.add_player(player)
 
@@ -0,0 +1,169 @@
+from math import ceil
+from typing import Dict, List, Sequence
+
+from table_games.common import substream
+
+from .blackjack import MAX_PLAYERS, Blackjack, PlayerPolicy, PlayerState
+from .basic import BasicPolicy
+from .deviations import CountPolicy
+from .montecarlo import DEFAULT_RULES, SimulationResult, run_jobs, split, tally
+
+# Most tables `run_casino` puts on one floor, the tables a hopper can move between
+FLOOR_TABLES = 8
+
+
+class _Hopper:
+    """A player who moves between the tables of a floor"""
+
+    def __init__(self, policy: PlayerPolicy) -> None:
+        self.policy = policy
+        self.state = PlayerState()
+        self.table: Blackjack = None
+        self.moves = 0
+        self.result = SimulationResult()
+
+
+class Floor:
+    """
+    Tables played side by side in one process.
+
+    Every table has its own shoe, shuffled from its own substream of `seed`, and
+    `players` seated players playing `policy`. Hoppers play counting policies
+    and move between rounds: they stay while their table's true count is at
+    least `min_true_count`, and otherwise move to the table with the best true
+    count that has a free seat, back-counting every table as they go.
+    """
+
+    def __init__(self, table_ids: Sequence[int], rules: Dict = None, seed = 0, players: int = 1,
+                 policy: PlayerPolicy = BasicPolicy(), hoppers: Sequence[PlayerPolicy] = (), min_true_count: float = 1) -> None:
+        self._table_ids = list(table_ids)
+        self._min_true_count = min_true_count
+        self._tables: List[Blackjack] = []
+        self._seated: List[List[PlayerState]] = []
+        self.results = [SimulationResult() for _ in self._table_ids]
+
+        for table_id in self._table_ids:
+            table = Blackjack(**(DEFAULT_RULES if rules is None else rules), rng=substream(seed, 'table', table_id))
+            for _ in range(players):
+                table.add_player(policy)
+            self._tables.append(table)
+            self._seated.append([state for _, state in table._players])
+
+        self.hoppers = [_Hopper(hopper) for hopper in hoppers]
+        for idx, hopper in enumerate(self.hoppers):
+            tables = self._tables[idx % len(self._tables):] + self._tables[:idx % len(self._tables)]
+            if not any(self._seat(hopper, table) for table in tables):
+                raise ValueError("Every table of the floor is full")
+
+    def _seat(self, hopper: _Hopper, table: Blackjack) -> bool:
+        """Moves `hopper` to `table`; returns False, leaving them where they are, if it's full"""
+        if not table.add_player(hopper.policy, hopper.state):
+            return False
+        if hopper.table is not None:
+            hopper.table.remove_player(hopper.state)
+            hopper.moves += 1
+        hopper.table = table
+        return True
+
+    def _move(self, hopper: _Hopper) -> None:
+        system = hopper.policy.COUNT
+        current = hopper.table._deck.track(system).true_count()
+        if current >= self._min_true_count:
+            return
+
+        best, best_count = None, current
+        for table in self._tables:
+            if table is hopper.table or len(table._players) >= MAX_PLAYERS:
+                continue
+            true_count = table._deck.track(system).true_count()
+            if true_count > best_count:
+                best, best_count = table, true_count
+
+        if best is not None:
+            self._seat(hopper, best)
+
+    def play_round(self) -> None:
+        for hopper in self.hoppers:
+            self._move(hopper)
+
+        hopper_banks = [hopper.state._bank for hopper in self.hoppers]
+        for table, seated, result in zip(self._tables, self._seated, self.results):
+            bank = sum(state._bank for state in seated)
+            if table.simulate_rounds(1):
+                result.record_round(sum(state._bank for state in seated) - bank)
+
+        for hopper, bank in zip(self.hoppers, hopper_banks):
+            hopper.result.record_round(hopper.state._bank - bank)
+
+    def play_rounds(self, rounds: int) -> None:
+        for _ in range(rounds):
+            self.play_round()
+
+        for seated, result in zip(self._seated, self.results):
+            tally(result, seated)
+        for hopper in self.hoppers:
+            tally(hopper.result, [hopper.state])
+
+
+class CasinoResult:
+    """Per-table results of the seated players, and per-hopper results"""
+
+    def __init__(self) -> None:
+        self.tables: Dict[int, SimulationResult] = {}
+        self.hoppers: List[SimulationResult] = []
+        self.moves: List[int] = []
+
+    def table_total(self) -> SimulationResult:
+        total = SimulationResult()
+        for result in self.tables.values():
+            total.merge(result)
+        return total
+
+    def hopper_total(self) -> SimulationResult:
+        total = SimulationResult()
+        for result in self.hoppers:
+            total.merge(result)
+        return total
+
+
+def _play_floor(args) -> CasinoResult:
+    table_ids, rounds, rules, seed, players, policy, hoppers, min_true_count = args
+    floor = Floor(table_ids, rules, seed, players, policy, hoppers, min_true_count)
+    floor.play_rounds(rounds)
+
+    result = CasinoResult()
+    result.tables = dict(zip(table_ids, floor.results))
+    result.hoppers = [hopper.result for hopper in floor.hoppers]
+    result.moves = [hopper.moves for hopper in floor.hoppers]
+    return result
+
+def run_casino(tables: int, rounds: int, rules: Dict = None, seed = 0, players: int = 1, policy: PlayerPolicy = BasicPolicy(),
+               hoppers: int = 0, hopper: CountPolicy = CountPolicy(), min_true_count: float = 1, floor_tables: int = FLOOR_TABLES,
+               workers: int = None) -> CasinoResult:
+    """
+    Plays `rounds` rounds at each of `tables` independent tables.
+
+    The tables are split into floors of consecutive tables, as equal as can
+    be with at most `floor_tables` each, and hopper `i` of the `hoppers`
+    players of `hopper` is seated on floor `i % floors`, moving between the
+    tables of its floor. Each `Floor` is played whole in one of a pool of
+    `workers` processes, and table `i` shuffles from its own substream of
+    `seed`, so the results don't depend on the number of workers.
+    """
+    floors = split(tables, ceil(tables / floor_tables))
+
+    jobs = []
+    for floor, table_ids in enumerate(floors):
+        floor_hoppers = [hopper] * len(range(floor, hoppers, len(floors)))
+        jobs.append((table_ids, rounds, rules, seed, players, policy, floor_hoppers, min_true_count))
+
+    result = CasinoResult()
+    hopper_results = {}
+    for floor, floor_result in enumerate(run_jobs(_play_floor, jobs, workers)):
+        result.tables.update(floor_result.tables)
+        for idx, hopper_result, moves in zip(range(floor, hoppers, len(floors)), floor_result.hoppers, floor_result.moves):
+            hopper_results[idx] = (hopper_result, moves)
+
+    result.hoppers = [hopper_results[idx][0] for idx in range(hoppers)]
+    result.moves = [hopper_results[idx][1] for idx in range(hoppers)]
+    return result
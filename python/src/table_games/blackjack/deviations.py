@@ -0,0 +1,154 @@
+from array import array
+from copy import copy
+from math import floor
+from typing import List, NamedTuple, Sequence, Tuple
+
+from table_games.common import HI_LO, Card, CountingSystem
+
+from .blackjack import PlayerPolicy, PlayerSpreadAction, PlayerState, SpotState
+from .basic import BASIC_TABLE, play_table
+from .strategy import UPCARD_COLUMN, StrategyTable
+
+# True counts are floored into buckets over this range; counts beyond it are clamped
+TC_MIN = -10
+TC_MAX = 10
+
+
+def tc_bucket(true_count: float) -> int:
+    """Index of the bucket for `true_count`"""
+    return min(max(floor(true_count), TC_MIN), TC_MAX) - TC_MIN
+
+
+class Deviation(NamedTuple):
+    """
+    Play `action` at or above true count `index`, and `otherwise` below it, or
+    the base chart's action if `otherwise` is None
+    """
+    section: str        # 'hard', 'soft' or 'pairs', as in the strategy charts
+    total: int
+    upcard: int         # Point value of the dealer's upcard
+    index: int
+    action: str
+    otherwise: str = None
+
+
+# Hi-Lo indices for multi-deck games. The 18th is insurance, see `INSURANCE_INDEX`.
+# The negative ones and 12 v 4 hit below their index where basic strategy stands; the
+# others play the base chart below it, so 11 v A only changes S17 charts, which hit.
+ILLUSTRIOUS_18 = [
+    Deviation('hard',  16, 10,  0, 'S'),
+    Deviation('hard',  15, 10,  4, 'S'),
+    Deviation('pairs', 10,  5,  5, 'Y'),
+    Deviation('pairs', 10,  6,  4, 'Y'),
+    Deviation('hard',  10, 10,  4, 'DH'),
+    Deviation('hard',  12,  3,  2, 'S'),
+    Deviation('hard',  12,  2,  3, 'S'),
+    Deviation('hard',  11,  1,  1, 'DH'),
+    Deviation('hard',   9,  2,  1, 'DH'),
+    Deviation('hard',  10,  1,  4, 'DH'),
+    Deviation('hard',   9,  7,  3, 'DH'),
+    Deviation('hard',  16,  9,  5, 'S'),
+    Deviation('hard',  13,  2, -1, 'S',  'H'),
+    Deviation('hard',  12,  4,  0, 'S',  'H'),
+    Deviation('hard',  12,  5, -2, 'S',  'H'),
+    Deviation('hard',  12,  6, -1, 'S',  'H'),
+    Deviation('hard',  13,  3, -2, 'S',  'H'),
+]
+INSURANCE_INDEX = 3
+
+
+def compile_deviations(base: StrategyTable, deviations: Sequence[Deviation]) -> List[StrategyTable]:
+    """One strategy table per true count bucket: `base` with `deviations` applied"""
+    tables = []
+    for true_count in range(TC_MIN, TC_MAX + 1):
+        chart = base.chart()
+        for deviation in deviations:
+            row = chart[deviation.section].get(deviation.total)
+            if row is None:
+                raise ValueError(f"The chart has no { deviation.section } { deviation.total } row")
+            if true_count >= deviation.index:
+                row[UPCARD_COLUMN[deviation.upcard]] = deviation.action
+            elif deviation.otherwise is not None:
+                row[UPCARD_COLUMN[deviation.upcard]] = deviation.otherwise
+        tables.append(StrategyTable(chart))
+    return tables
+
+
+class BetRamp:
+    """
+    The number of spots and the bet per spot to play at each true count.
+
+    `steps` are (true count, spots, bet) and apply from their true count up to
+    the next step's; counts below the first step use the first step.
+    """
+
+    def __init__(self, steps: Sequence[Tuple[int, int, float]]) -> None:
+        steps = sorted(steps)
+        if not steps:
+            raise ValueError("A bet ramp needs at least one step")
+        self.steps = steps
+
+        self._spots = array('B')
+        self._bets = array('d')
+        for true_count in range(TC_MIN, TC_MAX + 1):
+            step = steps[0]
+            for candidate in steps:
+                if candidate[0] <= true_count:
+                    step = candidate
+            self._spots.append(step[1])
+            self._bets.append(step[2])
+
+    def spots(self, true_count: float) -> int:
+        return self._spots[tc_bucket(true_count)]
+
+    def bet(self, true_count: float) -> float:
+        return self._bets[tc_bucket(true_count)]
+
+    def __repr__(self) -> str:
+        return f"BetRamp({ self.steps !r})"
+
+
+# A 1-10 spread on one spot, two spots from +4, within the limits of `DEFAULT_RULES`
+DEFAULT_RAMP = BetRamp([(TC_MIN, 1, 10), (1, 1, 20), (2, 1, 40), (3, 1, 80), (4, 2, 100)])
+
+
+class CountPolicy(PlayerPolicy):
+    """
+    Bets by `ramp` and plays `base` with `deviations`, all indexed by the true
+    count of `system`.
+
+    The ramp and the deviations are compiled into per-bucket arrays and tables
+    up front, so each decision is a bucket lookup plus a table lookup. The
+    ramp's bets are clamped to the limits of the table.
+    """
+
+    def __init__(self, ramp: BetRamp = DEFAULT_RAMP, deviations: Sequence[Deviation] = ILLUSTRIOUS_18,
+                 base: StrategyTable = BASIC_TABLE, insurance_index: float = INSURANCE_INDEX,
+                 system: CountingSystem = HI_LO) -> None:
+        super().__init__()
+        self.COUNT = system
+        self._ramp = ramp
+        self._deviations = list(deviations)
+        self._insurance_index = insurance_index
+        self._tables = compile_deviations(base, self._deviations)
+
+    def with_ramp(self, ramp: BetRamp) -> 'CountPolicy':
+        """This policy, betting by `ramp` instead"""
+        policy = copy(self)
+        policy._ramp = ramp
+        return policy
+
+    def PrebetAction(self, player: PlayerState, submit):
+        spots = self._ramp._spots[tc_bucket(player._count.true_count())]
+        if not submit(PlayerSpreadAction(spots)):
+            submit(PlayerSpreadAction(1))
+
+    def Bet(self, player: PlayerState, submit):
+        tmin, tmax = player._limits
+        submit(min(max(self._ramp._bets[tc_bucket(player._count.true_count())], tmin), tmax))
+
+    def InsuranceAction(self, player: PlayerState) -> bool:
+        return player._count.true_count() >= self._insurance_index
+
+    def Action(self, player: PlayerState, spot: SpotState, up_card: Card, submit):
+        play_table(self._tables[tc_bucket(player._count.true_count())], spot, up_card, submit)
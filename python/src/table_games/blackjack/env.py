@@ -0,0 +1,225 @@
+"""
+A vectorized, Gymnasium-style environment for learning to play a hand.
+
+Requires the optional `numpy` dependency.
+"""
+from typing import Dict, Tuple
+
+import numpy as np
+
+from table_games.common import HI_LO, CValue, CountingSystem
+
+from .strategy import COLUMNS, DOUBLE_HIT, DOUBLE_STAND, HARD, HIT, ROWS, SOFT, STAND, UPCARD_COLUMN, StrategyTable
+
+ACE = CValue.ACE.value
+
+# Actions, numbered like the chart actions of `strategy.py`
+ACTIONS = (STAND, HIT, DOUBLE_HIT)
+DOUBLE = DOUBLE_HIT
+
+# Layout of an observation
+OBS_TOTAL = 0           # Best total of the hand
+OBS_SOFT = 1            # 1 if the total counts an ace as 11
+OBS_UPCARD = 2          # Point value of the dealer's upcard, aces as 1
+OBS_TRUE_COUNT = 3      # True count of the cards seen, in `system`
+OBS_CAN_DOUBLE = 4      # 1 if the hand still has two cards
+OBS_COMPOSITION = 5     # Share of each point value among the unseen cards, aces first and tens last
+OBSERVATION_SIZE = OBS_COMPOSITION + 10
+
+_POINTS = np.array([0] + [min(value.value, 10) for value in CValue], dtype=np.int16)
+_COLUMN = np.array([0] + list(UPCARD_COLUMN[1:]), dtype=np.intp)
+
+
+def table_actions(table: StrategyTable, observations: np.ndarray) -> np.ndarray:
+    """The action `table`'s hard and soft charts take for each observation"""
+    total = observations[:, OBS_TOTAL].astype(np.intp)
+    soft = observations[:, OBS_SOFT] > 0
+    can_double = observations[:, OBS_CAN_DOUBLE] > 0
+    column = _COLUMN[observations[:, OBS_UPCARD].astype(np.intp)]
+
+    index = np.where(soft, SOFT * ROWS, HARD * ROWS) + total
+    actions = np.frombuffer(table._actions, dtype=np.uint8)[index * COLUMNS + column]
+    actions = np.where(actions == DOUBLE_STAND, np.where(can_double, DOUBLE, STAND), actions)
+    return np.where((actions == DOUBLE_HIT) & ~can_double, HIT, actions)
+
+
+class VectorEnv:
+    """
+    `num_envs` tables of one player and one spot each, stepped together.
+
+    Each episode is one hand: `step` takes an action per table (`STAND`, `HIT`
+    or `DOUBLE`; a double after the first decision is taken as a hit) and
+    returns, Gymnasium-style, `(observations, rewards, terminated, truncated,
+    info)`. Rewards are the hand's net result in bets, paid when it ends.
+    A finished table is dealt its next hand right away, so `observations` is
+    always a decision to make; the terminal state isn't observed.
+
+    Hands without a decision (a player or dealer blackjack) are settled while
+    dealing: their results go to `info['natural']` and `bank` but not to the
+    rewards, since no action caused them.
+
+    The dealer plays like `Blackjack` (`h17`, peeking for blackjack, and a
+    dealer blackjack beating a player's), and each
+    table has its own shoe of `deck_count` decks, reshuffled with a card burned
+    once fewer than `deck_count - pen` decks remain.
+    """
+
+    def __init__(self, num_envs: int, deck_count: int = 6, h17: bool = True, pen: float = 5, bj: float = 1.5,
+                 system: CountingSystem = HI_LO, seed = None) -> None:
+        self.num_envs = num_envs
+        self.observation_shape = (num_envs, OBSERVATION_SIZE)
+        self._deck_count = deck_count
+        self._h17 = h17
+        self._bj = bj
+        self._rng = np.random.default_rng(seed)
+        self._reserve = (deck_count - pen) * 52
+
+        self._tags = np.array(system.tags, dtype=np.float32)
+        self._full = np.array([4 * deck_count] * 9 + [16 * deck_count], dtype=np.int16)
+        self._initial_count = system.initial_count(deck_count)
+
+        ranks = np.tile(np.arange(1, len(CValue) + 1, dtype=np.uint8), 4 * deck_count)
+        self._shoes = np.tile(ranks, (num_envs, 1))
+        self._cursor = np.zeros(num_envs, dtype=np.intp)
+        # Cards not seen yet, burned and hole cards included
+        self._unseen = np.zeros((num_envs, 10), dtype=np.int16)
+
+        self._hard = np.zeros(num_envs, dtype=np.int16)
+        self._aces = np.zeros(num_envs, dtype=np.int16)
+        self._cards = np.zeros(num_envs, dtype=np.int16)
+        self._bet = np.ones(num_envs, dtype=np.float32)
+        self._up = np.zeros(num_envs, dtype=np.int16)
+        self._hole = np.zeros(num_envs, dtype=np.int16)
+        self._natural = np.zeros(num_envs, dtype=np.float32)
+
+        self.bank = np.zeros(num_envs)
+        self.episodes = 0
+
+    def reset(self, seed = None) -> Tuple[np.ndarray, Dict]:
+        """Reshuffles every shoe and deals every table a new hand"""
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+        everyone = np.arange(self.num_envs)
+        self._shuffle(everyone)
+        self._natural[:] = 0
+        self._deal(everyone)
+        return self._observe(), {'natural': self._natural.copy()}
+
+    def _shuffle(self, rows: np.ndarray) -> None:
+        self._shoes[rows] = self._rng.permuted(self._shoes[rows], axis=1)
+        self._cursor[rows] = 1
+        self._unseen[rows] = self._full
+
+    def _draw(self, rows: np.ndarray, seen: bool = True) -> np.ndarray:
+        points = _POINTS[self._shoes[rows, self._cursor[rows]]]
+        self._cursor[rows] += 1
+        if seen:
+            self._unseen[rows, points - 1] -= 1
+        return points
+
+    def _deal(self, rows: np.ndarray) -> None:
+        """Deals a hand at each of `rows`, settling hands without a decision until every row has one"""
+        while rows.size:
+            low = rows[self._shoes.shape[1] - self._cursor[rows] < self._reserve]
+            if low.size:
+                self._shuffle(low)
+
+            p1 = self._draw(rows)
+            up = self._draw(rows)
+            p2 = self._draw(rows)
+            hole = self._draw(rows, seen=False)
+
+            self._hard[rows] = p1 + p2
+            self._aces[rows] = (p1 == ACE).astype(np.int16) + (p2 == ACE)
+            self._cards[rows] = 2
+            self._bet[rows] = 1
+            self._up[rows] = up
+            self._hole[rows] = hole
+
+            player = (self._aces[rows] > 0) & (self._hard[rows] == 11)
+            dealer = ((up == ACE) & (hole == 10)) | ((up == 10) & (hole == ACE))
+            natural = player | dealer
+            settled = rows[natural]
+            if settled.size:
+                self._reveal(settled)
+                net = np.where(dealer[natural], -1.0, self._bj)
+                self._natural[settled] += net
+                self.bank[settled] += net
+                self.episodes += settled.size
+            rows = settled
+
+    def _reveal(self, rows: np.ndarray) -> None:
+        self._unseen[rows, self._hole[rows] - 1] -= 1
+
+    def _observe(self) -> np.ndarray:
+        obs = np.empty(self.observation_shape, dtype=np.float32)
+        soft = (self._aces > 0) & (self._hard <= 11)
+        unseen = self._unseen.astype(np.float32)
+        remaining = unseen.sum(axis=1)
+
+        running = self._initial_count + ((self._full - unseen) * self._tags).sum(axis=1)
+        obs[:, OBS_TOTAL] = np.where(soft, self._hard + 10, self._hard)
+        obs[:, OBS_SOFT] = soft
+        obs[:, OBS_UPCARD] = self._up
+        obs[:, OBS_TRUE_COUNT] = running / np.maximum(remaining / 52, 1 / 52)
+        obs[:, OBS_CAN_DOUBLE] = self._cards == 2
+        obs[:, OBS_COMPOSITION:] = unseen / remaining[:, None]
+        return obs
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict]:
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected { self.num_envs } actions, got shape { actions.shape }")
+        if not np.isin(actions, ACTIONS).all():
+            raise ValueError(f"Invalid actions { np.unique(actions[~np.isin(actions, ACTIONS)]).tolist() }, expected one of { ACTIONS }")
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        self._natural[:] = 0
+
+        doubling = (actions == DOUBLE) & (self._cards == 2)
+        drawing = np.flatnonzero((actions == HIT) | (actions == DOUBLE))
+        if drawing.size:
+            card = self._draw(drawing)
+            self._hard[drawing] += card
+            self._aces[drawing] += card == ACE
+            self._cards[drawing] += 1
+        self._bet[doubling] = 2
+
+        busted = self._hard > 21
+        done = (actions == STAND) | doubling | busted
+        rewards[busted] = -self._bet[busted]
+
+        standing = np.flatnonzero(done & ~busted)
+        if standing.size:
+            rewards[standing] = self._showdown(standing)
+
+        finished = np.flatnonzero(done)
+        self._reveal(finished[busted[finished]])
+        self.bank[finished] += rewards[finished]
+        self.episodes += finished.size
+        self._deal(finished)
+
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        return self._observe(), rewards, done, truncated, {'natural': self._natural.copy()}
+
+    def _showdown(self, rows: np.ndarray) -> np.ndarray:
+        """The dealer plays out `rows`; returns their net results"""
+        self._reveal(rows)
+        hard = self._up[rows] + self._hole[rows]
+        aces = (self._up[rows] == ACE).astype(np.int16) + (self._hole[rows] == ACE)
+
+        while True:
+            soft = np.where(aces > 0, hard + 10, hard)
+            stands = (hard >= 17) | ((soft >= 18) & (soft <= 21))
+            if not self._h17:
+                stands |= soft == 17
+            hitting = np.flatnonzero(~stands)
+            if hitting.size == 0:
+                break
+            card = self._draw(rows[hitting])
+            hard[hitting] += card
+            aces[hitting] += card == ACE
+
+        dealer = np.where((aces > 0) & (hard <= 11), hard + 10, hard)
+        player = np.where((self._aces[rows] > 0) & (self._hard[rows] <= 11), self._hard[rows] + 10, self._hard[rows])
+        result = np.where(dealer > 21, 1, np.sign(player - dealer)).astype(np.float32)
+        return result * self._bet[rows]
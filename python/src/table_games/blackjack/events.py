@@ -0,0 +1,80 @@
+from enum import Enum
+from typing import Any, List, NamedTuple
+
+from table_games.common import Card
+
+
+class EventKind(Enum):
+
+    SPREAD = 1              # A player spread to `amount` spots
+    STAND = 2
+    HIT = 3                 # `card` was dealt to `spot`
+    BUST = 4                # `card` busted `spot`
+    DOUBLE = 5              # `card` was dealt to the doubled `spot`
+    SPLIT = 6
+    BLACKJACK = 7           # `spot` was dealt a blackjack
+    DEALER_BLACKJACK = 8
+    SHUFFLE = 9
+    ROUND_START = 10        # The cards are about to be dealt
+    SETTLE = 11             # `spot` was paid `amount` (its bet and winnings, or insurance)
+    ROUND_END = 12          # Every spot is settled and the cards are about to be cleared
+
+
+class Event(NamedTuple):
+    kind: EventKind
+    player: int = None      # Index of the player in `Blackjack._players`
+    spot: Any = None        # The live `SpotState`; read it while handling the event
+    card: Card = None
+    up_card: Card = None
+    amount: float = None
+
+
+class EventSink:
+    """
+    Receives the events of a `Blackjack` game.
+
+    A game without a sink (the default) doesn't build any events, so it pays
+    nothing for them.
+    """
+
+    def emit(self, event: Event) -> None:
+        raise NotImplementedError()
+
+
+class ListSink(EventSink):
+    """Keeps every event"""
+
+    def __init__(self) -> None:
+        self.events: List[Event] = []
+
+    def emit(self, event: Event) -> None:
+        self.events.append(event)
+
+
+class PrintSink(EventSink):
+    """Prints a line per event, like the game used to"""
+
+    def emit(self, event: Event) -> None:
+        kind = event.kind
+        spot = event.spot
+
+        if kind == EventKind.SPREAD:
+            print(f"Desired spots: { event.amount }")
+        elif kind == EventKind.STAND:
+            print(f'STAND on { spot._cards } vs { event.up_card }')
+        elif kind == EventKind.HIT:
+            print(f'HIT on { spot._cards[:-1] } vs { event.up_card }')
+        elif kind == EventKind.BUST:
+            print(f"You drew a { event.card } and busted!")
+        elif kind == EventKind.DOUBLE:
+            print(f'DOUBLE on { spot._cards[:-1] } vs { event.up_card }')
+            print(f"You drew a { event.card }!")
+        elif kind == EventKind.SPLIT:
+            print(f'SPLIT on { spot._cards } vs { event.up_card }')
+        elif kind == EventKind.BLACKJACK:
+            print(f"{ spot._cards }")
+            print("Blackjack!")
+        elif kind == EventKind.DEALER_BLACKJACK:
+            print('Dealer has a blackjack!')
+        elif kind == EventKind.SHUFFLE:
+            print("Shuffling...")
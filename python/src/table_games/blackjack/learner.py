@@ -0,0 +1,265 @@
+"""
+Learns a strategy chart by Monte Carlo control over the `Blackjack` engine.
+
+Requires the optional `numpy` dependency.
+"""
+import random
+from os import cpu_count
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from table_games.common import Card, substream
+
+from .blackjack import Blackjack, PlayerPolicy, PlayerSpreadAction, PlayerState, SpotState
+from .basic import _DOUBLE, _HIT, _SPLIT, _STAND
+from .events import Event, EventKind, EventSink
+from .montecarlo import DEFAULT_RULES, SHARDS, run_jobs, split, worker_pool
+from .strategy import (ACTION_NAMES, COLUMNS, DOUBLE_HIT, DOUBLE_STAND, HAND_CLASSES, HARD, HIT, NO_SPLIT, PAIRS, ROWS, SOFT,
+                       SPLIT, STAND, StrategyTable, table_index)
+
+# The Q table has a row per chart cell (see `table_index`) and a column per action
+# code; a double is learned as `DOUBLE_HIT`, and `DOUBLE_STAND` is never taken
+STATES = len(HAND_CLASSES) * ROWS * COLUMNS
+ACTIONS = NO_SPLIT + 1
+
+_SUBMIT = {STAND: _STAND, HIT: _HIT, DOUBLE_HIT: _DOUBLE, SPLIT: _SPLIT}
+
+# Rows of the exported chart
+CHART_ROWS = {
+    'hard': range(4, 22),
+    'soft': range(12, 22),
+    'pairs': range(1, 11),
+}
+
+# Upcard point value of each chart column
+_COLUMN_POINTS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 1)
+
+
+class _Explorer(PlayerPolicy, EventSink):
+    """
+    Plays one spot at a flat bet and adds up the return of each decision.
+
+    The first decision on each dealt hand is random (exploring starts), so
+    every action of every starting hand is tried; the others are greedy by a Q
+    table, but for a random legal action with probability `epsilon`.
+
+    A decision's return is the net result, in bets, of the hand it was made
+    for; a split's is that of both hands it made, and of their own splits.
+    """
+
+    def __init__(self, q: np.ndarray, epsilon: float, bet: int, rng: random.Random) -> None:
+        super().__init__()
+        self._q = q
+        self._epsilon = epsilon
+        self._bet = bet
+        self._random = rng.random
+        self._choice = rng.choice
+
+        self.sums = np.zeros((STATES, ACTIONS))
+        self.counts = np.zeros((STATES, ACTIONS))
+
+        self._decisions: List[Tuple[SpotState, int, int]] = []
+        self._children: Dict[int, List[SpotState]] = {}
+        self._nets: Dict[int, float] = {}
+
+    def PrebetAction(self, player: PlayerState, submit):
+        submit(PlayerSpreadAction(1))
+
+    def Bet(self, player: PlayerState, submit):
+        submit(self._bet)
+
+    def InsuranceAction(self, player: PlayerState) -> bool:
+        return False
+
+    def _pick(self, state: int, actions: Tuple[int, ...], explore: bool) -> int:
+        if explore or self._random() < self._epsilon:
+            return self._choice(actions)
+        values = self._q[state]
+        return max(actions, key=values.__getitem__)
+
+    def Action(self, player: PlayerState, spot: SpotState, up_card: Card, submit):
+        up = up_card._points
+        # Only a dealt hand's first decision explores; the hands of a split
+        # play greedily, so the split is valued by how they'll really be played
+        start = len(spot._cards) == 2
+        explore = start and not spot._split
+
+        if spot._pair:
+            state = table_index(PAIRS, spot._cards[0]._points, up)
+            action = self._pick(state, (SPLIT, NO_SPLIT), explore)
+            explore = False
+            if action == SPLIT:
+                at = next(idx for idx, other in enumerate(player._spots) if other is spot)
+                if submit(_SPLIT):
+                    self._decisions.append((spot, state, SPLIT))
+                    self._children.setdefault(id(spot), []).append(player._spots[at + 1])
+                    return
+            else:
+                self._decisions.append((spot, state, NO_SPLIT))
+
+        if spot.is_soft():
+            state = table_index(SOFT, spot._hard + 10, up)
+        else:
+            state = table_index(HARD, spot._hard, up)
+
+        action = self._pick(state, (STAND, HIT, DOUBLE_HIT) if start else (STAND, HIT), explore)
+        if not submit(_SUBMIT[action]):
+            action = self._pick(state, (STAND, HIT), explore)
+            submit(_SUBMIT[action])
+        self._decisions.append((spot, state, action))
+
+    def emit(self, event: Event) -> None:
+        if event.kind == EventKind.SETTLE:
+            spot = event.spot
+            self._nets[id(spot)] = event.amount - spot._bet
+        elif event.kind == EventKind.ROUND_END:
+            self._end_round()
+
+    def _net(self, spot: SpotState) -> float:
+        return self._nets.get(id(spot), 0) + sum(self._net(child) for child in self._children.get(id(spot), ()))
+
+    def _end_round(self) -> None:
+        for spot, state, action in self._decisions:
+            net = self._net(spot) if action == SPLIT else self._nets.get(id(spot), 0)
+            self.sums[state, action] += net / self._bet
+            self.counts[state, action] += 1
+
+        self._decisions.clear()
+        self._children.clear()
+        self._nets.clear()
+
+
+def _explore(args) -> Tuple[np.ndarray, np.ndarray]:
+    rounds, key, q, epsilon, rules = args
+    rules = DEFAULT_RULES if rules is None else rules
+    explorer = _Explorer(q, epsilon, rules['tmin'], substream(key, 'explore'))
+    game = Blackjack(**rules, rng=substream(key, 'shoe'), events=explorer)
+    game.add_player(explorer)
+    game.simulate_rounds(rounds)
+    return explorer.sums, explorer.counts
+
+
+class QTable:
+    """
+    Sample averages of the return of each action in each chart cell.
+
+    Totals of independent runs can be combined with `merge`.
+    """
+
+    def __init__(self) -> None:
+        self.sums = np.zeros((STATES, ACTIONS))
+        self.counts = np.zeros((STATES, ACTIONS))
+
+    def decay(self, factor: float) -> 'QTable':
+        """Weighs the returns so far by `factor`, so that newer ones count for more"""
+        self.sums *= factor
+        self.counts *= factor
+        return self
+
+    def merge(self, sums: np.ndarray, counts: np.ndarray) -> 'QTable':
+        self.sums += sums
+        self.counts += counts
+        return self
+
+    def values(self) -> np.ndarray:
+        """The average return of each action, 0 where it was never taken"""
+        return np.divide(self.sums, self.counts, out=np.zeros_like(self.sums), where=self.counts > 0)
+
+    def _best(self, state: int, actions: Tuple[int, ...], default: int) -> int:
+        seen = [action for action in actions if self.counts[state, action]]
+        if not seen:
+            return default
+        values = self.values()[state]
+        return max(seen, key=values.__getitem__)
+
+    def chart(self) -> Dict[str, Dict[int, List[str]]]:
+        """
+        The greedy strategy, as a chart like `basic_strategy` over `CHART_ROWS`.
+
+        A double is written `DH` or `DS` depending on whether hitting beat
+        standing, and cells never visited default to standing (or not splitting).
+        """
+        chart = {section: {} for section in HAND_CLASSES}
+        for hand_class, section in enumerate(HAND_CLASSES):
+            for total in CHART_ROWS[section]:
+                row = []
+                for up in _COLUMN_POINTS:
+                    state = table_index(hand_class, total, up)
+                    if hand_class == PAIRS:
+                        action = self._best(state, (SPLIT, NO_SPLIT), NO_SPLIT)
+                    else:
+                        action = self._best(state, (STAND, HIT, DOUBLE_HIT), STAND)
+                        if action == DOUBLE_HIT and self._best(state, (STAND, HIT), STAND) == STAND:
+                            action = DOUBLE_STAND
+                    row.append(ACTION_NAMES[action])
+                chart[section][total] = row
+        return chart
+
+    def table(self) -> StrategyTable:
+        """The greedy strategy, ready for `BasicPolicy.TABLE`"""
+        return StrategyTable(self.chart())
+
+
+def chart_diff(chart: Dict, other: Dict) -> List[Tuple[str, int, int, str, str]]:
+    """
+    The cells where two charts differ, as (section, total, upcard points,
+    action in `chart`, action in `other`), over the rows of `chart`.
+
+    `other` is compiled like a `StrategyTable`, so its missing hard and soft
+    rows read as its nearest row, e.g. `basic_strategy`'s hard 17 for hard 20.
+    """
+    mine = StrategyTable(chart)
+    theirs = StrategyTable(other)
+
+    diff = []
+    for hand_class, section in enumerate(HAND_CLASSES):
+        for total in sorted(mine._chart[section]):
+            for up in _COLUMN_POINTS:
+                a = mine.lookup(hand_class, total, up)
+                b = theirs.lookup(hand_class, total, up)
+                if a != b:
+                    diff.append((section, total, up, ACTION_NAMES[a], ACTION_NAMES[b]))
+    return diff
+
+
+def learn(iterations: int, rounds: int, seed = 0, rules: Dict = None, epsilon: float = 0.1, memory: float = 0.9,
+          workers: int = None, q: QTable = None, shards: int = None) -> QTable:
+    """
+    Learns a strategy by Monte Carlo control.
+
+    Each iteration plays `rounds` rounds split into `shards` tables (`SHARDS`
+    by default) across `workers` processes, all making a random first decision
+    on each hand and then following the greedy strategy of the table so far,
+    but for a random action with probability `epsilon`, and then adds their
+    returns to the table. Returns of earlier iterations, made by a worse
+    strategy, are weighed down by `memory` each iteration. Pass `q` to
+    continue training a table.
+
+    Shard `i` of each iteration is seeded from `seed`, the iteration and `i`,
+    so the table learned doesn't depend on the number of workers.
+    """
+    workers = workers or cpu_count() or 1
+    shards = shards or SHARDS
+    q = QTable() if q is None else q
+
+    with worker_pool(workers) as pool:
+        for iteration in range(iterations):
+            values = q.values()
+            jobs = [(len(shard_rounds), (seed, iteration, shard), values, epsilon, rules)
+                    for shard, shard_rounds in enumerate(split(rounds, shards))]
+
+            results = list(run_jobs(_explore, jobs, workers, pool))
+            q.decay(memory)
+            for sums, counts in results:
+                q.merge(sums, counts)
+
+    return q
+
+
+if __name__ == "__main__":
+    from .basic import basic_strategy
+
+    learned = learn(20, 200000)
+    for cell in chart_diff(learned.chart(), basic_strategy):
+        print(*cell)
@@ -0,0 +1,229 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from math import sqrt
+from os import cpu_count
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from table_games.common import Deck, ReplayShoe, make_rng, substream
+
+from .blackjack import Blackjack, PlayerPolicy, PlayerState
+from .basic import BasicPolicy
+
+# The game played by `basic.py`
+DEFAULT_RULES = {
+    'deck_count': 6,
+    'h17': True,
+    'pen': 5,
+    'tmin': 5,
+    'tmax': 100,
+}
+
+# Independent tables a run is split into unless told otherwise; fixed, so that a
+# run's result doesn't depend on the number of workers or of CPUs
+SHARDS = 16
+
+
+class SimulationResult:
+    """
+    Totals of a simulation, over every player at the table.
+
+    Results of independent runs can be combined with `merge`, which is how
+    `run` joins the shards played by its workers.
+    """
+
+    def __init__(self) -> None:
+        self.rounds = 0
+        self.hands = 0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.blackjacks = 0
+        self.bank = 0
+        self.wagered = 0
+
+        # Sums of the table's net result per round, for the variance
+        self._net = 0
+        self._net_sq = 0
+
+    def record_round(self, net: float) -> None:
+        self.rounds += 1
+        self._net += net
+        self._net_sq += net * net
+
+    def record_rounds(self, rounds: int, net: float, net_sq: float) -> None:
+        """Records `rounds` rounds at once from the sum of their nets and of their squares"""
+        self.rounds += rounds
+        self._net += net
+        self._net_sq += net_sq
+
+    def merge(self, other: 'SimulationResult') -> 'SimulationResult':
+        self.rounds += other.rounds
+        self.hands += other.hands
+        self.wins += other.wins
+        self.losses += other.losses
+        self.pushes += other.pushes
+        self.blackjacks += other.blackjacks
+        self.bank += other.bank
+        self.wagered += other.wagered
+        self._net += other._net
+        self._net_sq += other._net_sq
+        return self
+
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> 'SimulationResult':
+        result = cls()
+        for name, value in values.items():
+            if name not in vars(result):
+                raise ValueError(f"Unknown result field { name !r}")
+            setattr(result, name, value)
+        return result
+
+    def ev(self) -> float:
+        """Mean net result per round"""
+        return self._net / self.rounds if self.rounds else 0
+
+    def stdev(self) -> float:
+        """Standard deviation of the net result of a round"""
+        if self.rounds < 2:
+            return 0
+        mean = self.ev()
+        variance = (self._net_sq - self.rounds * mean * mean) / (self.rounds - 1)
+        return sqrt(max(variance, 0))
+
+    def stderr(self) -> float:
+        return self.stdev() / sqrt(self.rounds) if self.rounds else 0
+
+    def confidence_interval(self, z: float = 1.96) -> Tuple[float, float]:
+        """Interval around `ev` (95% for the default z)"""
+        margin = z * self.stderr()
+        return (self.ev() - margin, self.ev() + margin)
+
+    def edge(self) -> float:
+        """Net result per unit of initial bet"""
+        return self.bank / self.wagered if self.wagered else 0
+
+    def __repr__(self) -> str:
+        low, high = self.confidence_interval()
+        return (f"{ self.rounds } rounds, { self.hands } hands: "
+                f"{ self.wins } won, { self.losses } lost, { self.pushes } pushed, { self.blackjacks } blackjacks; "
+                f"bank ${ self.bank }, EV ${ self.ev():.4f}/round (95% CI { low:.4f} to { high:.4f}), "
+                f"edge { 100 * self.edge():.3f}%")
+
+
+def simulate(rounds: int, seed, policy: PlayerPolicy = BasicPolicy(), players: int = 1, rules: Dict = None, shoe: Deck = None) -> SimulationResult:
+    """
+    Plays `rounds` rounds of one table in this process.
+
+    Every player at the table plays `policy`, so it must not keep per-player
+    state. `rules` are keyword arguments for `Blackjack` (`DEFAULT_RULES` if
+    None), and `seed` is the seed or `random.Random` the shoe is shuffled with,
+    unless the table deals from `shoe`.
+    """
+    game = Blackjack(**(DEFAULT_RULES if rules is None else rules), rng=make_rng(seed), shoe=shoe)
+    for _ in range(players):
+        game.add_player(policy)
+
+    states = [state for _, state in game._players]
+    result = SimulationResult()
+    bank = 0
+
+    for _ in range(rounds):
+        game.simulate_rounds(1)
+        new_bank = sum(state._bank for state in states)
+        result.record_round(new_bank - bank)
+        bank = new_bank
+
+    tally(result, states)
+    return result
+
+def tally(result: SimulationResult, states: Sequence[PlayerState]) -> SimulationResult:
+    """Adds the hands, bank and wagers of each of `states` to the totals of `result`"""
+    for state in states:
+        result.hands += state._hands
+        result.wins += state._wins
+        result.losses += state._losses
+        result.pushes += state._pushes
+        result.blackjacks += state._blackjacks
+        result.bank += state._bank
+        result.wagered += state._wagered
+    return result
+
+def split(total: int, parts: int) -> List[range]:
+    """`range(total)` cut into `parts` runs whose lengths differ by at most one, the longer first"""
+    runs = []
+    start = 0
+    for part in range(parts):
+        length = total // parts + (1 if part < total % parts else 0)
+        runs.append(range(start, start + length))
+        start += length
+    return runs
+
+def run_jobs(function: Callable, jobs: Iterable, workers: int = None, pool: Executor = None) -> Iterator:
+    """
+    The result of `function` on each of `jobs`, in order.
+
+    The jobs run in `pool` if given, else in this process when `workers` is 1,
+    else in a new pool of `workers` processes (all the CPUs by default).
+    Each job should carry its own substream of the run's seed, so that results
+    don't depend on where it ran.
+    """
+    if pool is not None:
+        yield from pool.map(function, jobs)
+    elif (workers or cpu_count() or 1) == 1:
+        yield from map(function, jobs)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            yield from pool.map(function, jobs)
+
+@contextmanager
+def worker_pool(workers: int = None) -> Iterator[Executor]:
+    """A pool of `workers` processes to pass to `run_jobs` call after call, or None if `workers` is 1"""
+    workers = workers or cpu_count() or 1
+    if workers == 1:
+        yield None
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            yield pool
+
+
+def _simulate_shard(args) -> SimulationResult:
+    rounds, seed, policy, players, rules, replay, shard, shards = args
+    shoe = None
+    if replay is not None:
+        deck_count = (DEFAULT_RULES if rules is None else rules)['deck_count']
+        shoe = ReplayShoe(replay, deck_count, shard, shards)
+    try:
+        return simulate(rounds, seed, policy, players, rules, shoe)
+    finally:
+        if shoe is not None:
+            shoe.close()
+
+def run(rounds: int, seed = 0, policy: PlayerPolicy = BasicPolicy(), players: int = 1, rules: Dict = None, workers: int = None, shards: int = None,
+        replay: str = None) -> SimulationResult:
+    """
+    Plays `rounds` rounds split into `shards` independent tables (`SHARDS` by
+    default) across a pool of `workers` processes, and merges their results.
+
+    Shard `i` shuffles with its own substream of `seed`, so a run is
+    reproducible for a given `seed` and `shards`, whatever the number of workers.
+
+    With `replay`, the path of a file written by `write_shoes`, the tables deal
+    its shoes instead, shard `i` taking shoes `i`, `i + shards`, ...; two runs
+    with the same file and `shards` deal every policy the same cards.
+    """
+    shards = shards or SHARDS
+
+    jobs = [(len(shard_rounds), substream(seed, 'shard', shard), policy, players, rules, replay, shard, shards)
+            for shard, shard_rounds in enumerate(split(rounds, shards))]
+
+    result = SimulationResult()
+    for shard_result in run_jobs(_simulate_shard, jobs, workers):
+        result.merge(shard_result)
+    return result
+
+
+if __name__ == "__main__":
+    print(run(1000000))
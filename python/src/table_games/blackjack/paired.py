@@ -0,0 +1,126 @@
+from math import sqrt
+from os import cpu_count
+from typing import Dict, List, Tuple
+
+from table_games.common import PairedShoe
+
+from .blackjack import Blackjack, PlayerPolicy
+from .montecarlo import DEFAULT_RULES, SimulationResult, run_jobs, split, tally
+from .stats import RunningStats
+
+
+class PairedResult:
+    """
+    The results of policies played on the same shoes: each policy's totals,
+    and per shoe, the difference between each policy's net result and the
+    first policy's.
+
+    Results of disjoint runs of shoes can be combined with `merge`.
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        self.names = list(names)
+        self.results: Dict[str, SimulationResult] = {name: SimulationResult() for name in names}
+        self.differences: Dict[str, RunningStats] = {name: RunningStats() for name in names[1:]}
+        self.shoes = 0
+
+    def merge(self, other: 'PairedResult') -> 'PairedResult':
+        for name in self.names:
+            self.results[name].merge(other.results[name])
+        for name, stats in self.differences.items():
+            stats.merge(other.differences[name])
+        self.shoes += other.shoes
+        return self
+
+    def difference(self, name: str) -> Tuple[float, float]:
+        """
+        How much more `name` wins per round than the first policy, and the
+        standard error of that, from the paired differences of each shoe
+        """
+        stats = self.differences[name]
+        rounds_per_shoe = self.results[self.names[0]].rounds / self.shoes if self.shoes else 0
+        if not rounds_per_shoe:
+            return 0.0, 0.0
+        return stats.mean / rounds_per_shoe, stats.stdev() / sqrt(stats.count) / rounds_per_shoe
+
+    def __repr__(self) -> str:
+        lines = [f"{ self.shoes } shoes"]
+        for name in self.names:
+            lines.append(f"{ name }: { self.results[name] }")
+        for name in self.differences:
+            mean, stderr = self.difference(name)
+            lines.append(f"{ name } - { self.names[0] }: { mean:+.4f}/round (SE { stderr:.4f})")
+        return "\n".join(lines)
+
+
+def _play_shoes(game: Blackjack, shoe: PairedShoe, shoes: int, result: SimulationResult) -> List[float]:
+    """Plays `game` until it has dealt `shoes` shoes, returning the table's net result of each"""
+    states = [state for _, state in game._players]
+    nets = []
+    bank = sum(state._bank for state in states)
+
+    for _ in range(shoes):
+        dealing = shoe.shoe
+        shoe_bank = bank
+        while shoe.shoe == dealing:
+            game.simulate_rounds(1)
+            new_bank = sum(state._bank for state in states)
+            result.record_round(new_bank - bank)
+            bank = new_bank
+        nets.append(bank - shoe_bank)
+
+    tally(result, states)
+    return nets
+
+def _compare_shard(args) -> PairedResult:
+    policies, start, shoes, seed, rules, players = args
+    rules = DEFAULT_RULES if rules is None else rules
+
+    paired = PairedResult(list(policies))
+    nets = {}
+    for name, policy in policies.items():
+        shoe = PairedShoe(rules['deck_count'], seed, start)
+        game = Blackjack(**rules, shoe=shoe)
+        for _ in range(players):
+            game.add_player(policy)
+        nets[name] = _play_shoes(game, shoe, shoes, paired.results[name])
+
+    baseline = nets[paired.names[0]]
+    for name, stats in paired.differences.items():
+        for net, base in zip(nets[name], baseline):
+            stats.add(net - base)
+    paired.shoes = shoes
+    return paired
+
+
+def compare(policies: Dict[str, PlayerPolicy], shoes: int, seed = 0, rules: Dict = None, players: int = 1,
+            workers: int = None, shards: int = None) -> PairedResult:
+    """
+    Plays each of `policies` on the same `shoes` shoes (common random numbers)
+    and compares them with the first one, shoe by shoe.
+
+    Every policy deals shoe `n` from `PairedShoe(seed)`, however many cards
+    it took from the shoes before, so the luck of the deal cancels out of the
+    differences. The shoes are split into `shards` runs of consecutive shoes
+    across `workers` processes.
+
+    Common shoes are the only variance reduction: shoes dealt in reverse
+    (antithetic pairs) reduced nothing, as a reversed shoe deals the same
+    cards just as well, and no stratification variable fits whole shoes.
+    """
+    workers = workers or cpu_count() or 1
+    shards = min(shards or workers, shoes)
+
+    jobs = [(policies, shard.start, len(shard), seed, rules, players) for shard in split(shoes, shards)]
+
+    paired = PairedResult(list(policies))
+    for shard in run_jobs(_compare_shard, jobs, workers):
+        paired.merge(shard)
+    return paired
+
+
+if __name__ == "__main__":
+    from .basic import BasicPolicy
+    from .deviations import CountPolicy
+
+    print(compare({'basic': BasicPolicy(), 'count': CountPolicy()}, 10000))
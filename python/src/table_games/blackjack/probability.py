@@ -0,0 +1,107 @@
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+# Positions of the outcomes in a dealer distribution
+DEALER_TOTALS = (17, 18, 19, 20, 21)
+BUST = 5
+BLACKJACK = 6
+OUTCOMES = 7
+
+TEN = 9     # Index of the ten-valued cards in a composition
+
+
+def _add(total: list, weight: float, outcomes: Tuple[float, ...]) -> None:
+    for idx, p in enumerate(outcomes):
+        total[idx] += weight * p
+
+
+class DealerProbabilities:
+    """
+    Exact distribution of the dealer's final hand for a shoe composition.
+
+    A composition is a sequence of ten card counts by point value, aces first
+    and ten-valued cards last, as returned by `Deck.composition()`. The dealer
+    plays by the rules of `Blackjack`: they hit soft 17 only if `h17`.
+
+    Distributions are memoized by (dealer hand, composition) in an LRU cache of
+    at most `maxsize` entries, which is kept between calls.
+    """
+
+    def __init__(self, h17: bool = True, maxsize: int = 1 << 16) -> None:
+        self._h17 = h17
+        self._play = lru_cache(maxsize=maxsize)(self._play_uncached)
+
+    def outcomes(self, up_points: int, composition: Sequence[int], peek: bool = True) -> Tuple[float, ...]:
+        """
+        Probabilities of the dealer finishing on 17, 18, 19, 20, 21, busting
+        and having a blackjack, in that order (see `DEALER_TOTALS`, `BUST` and
+        `BLACKJACK`).
+
+        `composition` is what is left in the shoe after the upcard, including
+        the unseen hole card. With `peek`, the result is conditioned on the
+        dealer not having a blackjack, as it is by the time players act.
+        """
+        composition = tuple(composition)
+        remaining = sum(composition)
+        if remaining == 0:
+            raise ValueError("The shoe is empty")
+
+        total = [0.0] * OUTCOMES
+        excluded = 0.0
+        up_ace = up_points == 1
+
+        for idx, count in enumerate(composition):
+            if not count:
+                continue
+
+            p = count / remaining
+            if (up_ace and idx == TEN) or (up_points == 10 and idx == 0):
+                if peek:
+                    excluded += p
+                else:
+                    total[BLACKJACK] += p
+                continue
+
+            rest = list(composition)
+            rest[idx] -= 1
+            _add(total, p, self._play(up_points + idx + 1, up_ace or idx == 0, tuple(rest)))
+
+        if peek:
+            if excluded >= 1:
+                raise ValueError("The dealer can only have a blackjack")
+            return tuple(p / (1 - excluded) for p in total)
+        return tuple(total)
+
+    def _play_uncached(self, hard: int, ace: bool, composition: Tuple[int, ...]) -> Tuple[float, ...]:
+        soft = hard + 10 if ace else hard
+
+        if hard >= 17:
+            total = hard
+        elif 18 <= soft <= 21 or (soft == 17 and not self._h17):
+            total = soft
+        else:
+            total = None
+
+        if total is not None:
+            outcome = [0.0] * OUTCOMES
+            outcome[BUST if total > 21 else total - 17] = 1.0
+            return tuple(outcome)
+
+        remaining = sum(composition)
+        if remaining == 0:
+            raise ValueError("The shoe ran out of cards")
+
+        outcome = [0.0] * OUTCOMES
+        for idx, count in enumerate(composition):
+            if not count:
+                continue
+            rest = list(composition)
+            rest[idx] -= 1
+            _add(outcome, count / remaining, self._play(hard + idx + 1, ace or idx == 0, tuple(rest)))
+        return tuple(outcome)
+
+    def cache_info(self):
+        return self._play.cache_info()
+
+    def cache_clear(self) -> None:
+        self._play.cache_clear()
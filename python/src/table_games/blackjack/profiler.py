@@ -0,0 +1,170 @@
+from time import perf_counter_ns
+from typing import Dict, List
+
+from .blackjack import Blackjack, BlackjackState, PlayerPolicy
+
+# The engine method that plays each phase
+PHASES = {
+    BlackjackState.PREBETTING: '_prebet',
+    BlackjackState.BETTING: '_bet',
+    BlackjackState.DEALING: '_deal',
+    BlackjackState.ACTION: '_action',
+    BlackjackState.RESULTS: '_results',
+    BlackjackState.CLEANUP: '_cleanup',
+}
+
+CALLBACKS = ('PrebetAction', 'Bet', 'InsuranceAction', 'Action')
+
+
+class Timer:
+    """
+    Number of calls, total and longest time (in nanoseconds) of something,
+    with a histogram of its durations: bucket `b` counts the calls that took
+    from 2**(b-1) to 2**b - 1 ns.
+    """
+
+    __slots__ = ('calls', 'total_ns', 'max_ns', 'histogram')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram: List[int] = [0] * 64
+
+    def add(self, ns: int) -> None:
+        self.calls += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.histogram[ns.bit_length()] += 1
+
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> Dict:
+        last = max((idx for idx, count in enumerate(self.histogram) if count), default=-1)
+        return {
+            'calls': self.calls,
+            'total_ns': self.total_ns,
+            'mean_ns': self.mean_ns(),
+            'max_ns': self.max_ns,
+            'histogram': self.histogram[:last + 1],
+        }
+
+
+class _TimedPolicy:
+    """Stands in for a policy, timing its callbacks"""
+
+    def __init__(self, policy: PlayerPolicy, timers: Dict[str, Timer]) -> None:
+        self._policy = policy
+        for name in CALLBACKS:
+            setattr(self, name, self._timed(getattr(policy, name), timers[name]))
+
+    @staticmethod
+    def _timed(callback, timer: Timer):
+        def timed(*args):
+            start = perf_counter_ns()
+            try:
+                return callback(*args)
+            finally:
+                timer.add(perf_counter_ns() - start)
+        return timed
+
+    def __getattr__(self, name):
+        return getattr(self._policy, name)
+
+
+class Profiler:
+    """
+    Times the phases of a `Blackjack` game and the callbacks of its policies,
+    and counts the cards dealt and the reshuffles.
+
+    Nothing is measured until the profiler is attached, and a game that was
+    never attached runs its usual code: `attach` swaps timed wrappers in for
+    the game's phase methods, its policies and its shoe's `shuffle` on that
+    one instance, and `detach` puts them back.
+
+    Phase times include the policy callbacks made during the phase, so the
+    engine's own time in a phase is its time less that of the callbacks.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[BlackjackState, Timer] = {phase: Timer() for phase in PHASES}
+        self.callbacks: Dict[str, Timer] = {name: Timer() for name in CALLBACKS}
+        self.reshuffles = 0
+        self._drawn = 0
+        self._game: Blackjack = None
+
+    def attach(self, game: Blackjack) -> 'Profiler':
+        self._game = game
+
+        for phase, method in PHASES.items():
+            setattr(game, method, self._timed_phase(getattr(game, method), self.phases[phase]))
+
+        for seat in game._seats:
+            seat._policy = _TimedPolicy(seat._policy, self.callbacks)
+        add_player = game.add_player
+        def add_timed_player(player, state=None):
+            added = add_player(player, state)
+            if added:
+                game._seats[-1]._policy = _TimedPolicy(player, self.callbacks)
+            return added
+        game.add_player = add_timed_player
+
+        deck = game._deck
+        shuffle = deck.shuffle
+        self._mark = deck._cursor
+        def counted_shuffle():
+            self._drawn += deck._cursor - self._mark
+            self.reshuffles += 1
+            shuffle()
+            self._mark = deck._cursor
+        deck.shuffle = counted_shuffle
+
+        return self
+
+    def detach(self) -> None:
+        game = self._game
+        self._drawn = self.cards_drawn()
+
+        for method in PHASES.values():
+            del game.__dict__[method]
+        for seat in game._seats:
+            if type(seat._policy) is _TimedPolicy:
+                seat._policy = seat._policy._policy
+        del game.add_player
+        del game._deck.shuffle
+
+        self._game = None
+
+    @staticmethod
+    def _timed_phase(method, timer: Timer):
+        def timed(*args):
+            start = perf_counter_ns()
+            method(*args)
+            timer.add(perf_counter_ns() - start)
+        return timed
+
+    def cards_drawn(self) -> int:
+        """Cards taken from the shoe so far, burned cards included"""
+        if self._game is None:
+            return self._drawn
+        return self._drawn + self._game._deck._cursor - self._mark
+
+    def rounds(self) -> int:
+        return self.phases[BlackjackState.CLEANUP].calls
+
+    def report(self) -> Dict:
+        """Everything measured so far, as plain data"""
+        engine_ns = sum(timer.total_ns for timer in self.phases.values())
+        policy_ns = sum(timer.total_ns for timer in self.callbacks.values())
+        return {
+            'rounds': self.rounds(),
+            'cards_drawn': self.cards_drawn(),
+            'reshuffles': self.reshuffles,
+            'phases': {phase.name: timer.to_dict() for phase, timer in self.phases.items()},
+            'callbacks': {name: timer.to_dict() for name, timer in self.callbacks.items()},
+            'total_ns': engine_ns,
+            'policy_ns': policy_ns,
+            'policy_share': policy_ns / engine_ns if engine_ns else 0.0,
+        }
@@ -0,0 +1,211 @@
+"""
+Streams hand histories to disk as columnar NumPy chunks.
+
+Requires the optional `numpy` dependency.
+"""
+import glob
+import os
+import queue
+import threading
+from array import array
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from table_games.common import HI_LO, CountingSystem
+
+from .blackjack import Blackjack
+from .events import Event, EventKind, EventSink
+
+# Actions are recorded as their `EventKind` values
+ACTIONS = {
+    EventKind.STAND: EventKind.STAND.value,
+    EventKind.HIT: EventKind.HIT.value,
+    EventKind.DOUBLE: EventKind.DOUBLE.value,
+    EventKind.SPLIT: EventKind.SPLIT.value,
+}
+
+COLUMNS = {
+    'round': (np.int64, ()),
+    'position': (np.int32, ()),         # Cards dealt from the shoe when the round started
+    'running_count': (np.float32, ()),
+    'true_count': (np.float32, ()),
+    'player': (np.int8, ()),
+    'spot': (np.int8, ()),
+    'bet': (np.float64, ()),
+    'payout': (np.float64, ()),
+}
+
+# Columns of any length per row, stored as all of a chunk's values one after the other
+# and an `_end` column of where each row's values end; see `ragged`
+RAGGED = (
+    'cards',        # Card codes
+    'dealer',
+    'actions',
+)
+
+
+class HandRecorder(EventSink):
+    """
+    Records every settled hand of a game as a row: its round, the shoe position
+    and count when the round started, its player and spot, its cards, the
+    dealer's cards, its actions, its bet and its payout.
+
+    Rows are gathered into chunks of `chunk_rows` and written by a background
+    thread to `directory` as numbered `.npz` files of one array per column. At
+    most `max_pending` full chunks wait to be written; past that, the game
+    waits for the writer, so memory stays bounded however long the run.
+    Call `close` (or use the recorder as a context manager) to flush the rest.
+
+    If a chunk can't be written, the writer stops and its error is raised by
+    the next `emit` or `close`.
+    """
+
+    def __init__(self, directory: str, chunk_rows: int = 1 << 16, max_pending: int = 4, system: CountingSystem = HI_LO) -> None:
+        self._directory = directory
+        self._chunk_rows = chunk_rows
+        self._system = system
+        self._game: Blackjack = None
+        self._count = None
+
+        self._round = -1
+        self._position = 0
+        self._running_count = 0.0
+        self._true_count = 0.0
+        self._actions: Dict[int, list] = {}
+        self._settled = []
+
+        self._chunk = 0
+        self._new_chunk()
+
+        os.makedirs(directory, exist_ok=True)
+        self._error: BaseException = None
+        self._queue = queue.Queue(max_pending)
+        self._writer = threading.Thread(target=self._write, daemon=True)
+        self._writer.start()
+
+    def attach(self, game: Blackjack) -> 'HandRecorder':
+        """Records the hands of `game`"""
+        self._game = game
+        self._count = game._deck.track(self._system)
+        game._events = self
+        return self
+
+    def _new_chunk(self) -> None:
+        self._columns = {name: np.zeros((self._chunk_rows,) + shape, dtype) for name, (dtype, shape) in COLUMNS.items()}
+        self._ragged: Dict[str, array] = {name: array('B') for name in RAGGED}
+        for name in RAGGED:
+            self._columns[name + '_end'] = np.zeros(self._chunk_rows, np.int64)
+        self._rows = 0
+
+    def emit(self, event: Event) -> None:
+        if self._error is not None:
+            raise self._error
+        kind = event.kind
+
+        if kind in ACTIONS:
+            self._actions.setdefault(id(event.spot), []).append(ACTIONS[kind])
+        elif kind == EventKind.SETTLE:
+            spot = event.spot
+            self._settled.append((event.player, list(spot._cards), self._actions.get(id(spot), ()), spot._bet, event.amount))
+        elif kind == EventKind.ROUND_START:
+            deck = self._game._deck
+            self._round += 1
+            self._position = deck._cursor
+            self._running_count = self._count.running_count()
+            self._true_count = self._count.true_count()
+        elif kind == EventKind.ROUND_END:
+            self._end_round()
+
+    def _end_round(self) -> None:
+        dealer = [card._code for card in self._game._dealer]
+        spots: Dict[int, int] = {}
+
+        for player, cards, actions, bet, payout in self._settled:
+            columns = self._columns
+            ragged = self._ragged
+            row = self._rows
+            columns['round'][row] = self._round
+            columns['position'][row] = self._position
+            columns['running_count'][row] = self._running_count
+            columns['true_count'][row] = self._true_count
+            columns['player'][row] = player
+            columns['spot'][row] = spots.get(player, 0)
+            ragged['cards'].extend(card._code for card in cards)
+            ragged['dealer'].extend(dealer)
+            ragged['actions'].extend(actions)
+            for name in RAGGED:
+                columns[name + '_end'][row] = len(ragged[name])
+            columns['bet'][row] = bet
+            columns['payout'][row] = payout
+            spots[player] = spots.get(player, 0) + 1
+
+            self._rows += 1
+            if self._rows == self._chunk_rows:
+                self._flush()
+
+        self._actions.clear()
+        self._settled.clear()
+
+    def _flush(self) -> None:
+        if self._rows:
+            columns = {name: column[:self._rows] for name, column in self._columns.items()}
+            for name, values in self._ragged.items():
+                columns[name] = np.array(values, np.uint8)
+            self._put((self._chunk, columns))
+            self._chunk += 1
+            self._new_chunk()
+
+    def _put(self, item) -> None:
+        """Queues `item` for the writer, waiting while the queue is full unless the writer has stopped"""
+        while True:
+            if self._error is not None:
+                raise self._error
+            if not self._writer.is_alive():
+                raise RuntimeError("The hand recorder's writer has stopped")
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _write(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            chunk, columns = item
+            path = os.path.join(self._directory, f"chunk-{chunk:08d}.npz")
+            try:
+                np.savez(path + '.tmp.npz', **columns)
+                os.replace(path + '.tmp.npz', path)
+            except BaseException as error:
+                self._error = error
+                return
+
+    def close(self) -> None:
+        """Writes the rows still buffered and waits for the writer to finish"""
+        try:
+            self._flush()
+            self._put(None)
+        finally:
+            self._writer.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_chunks(directory: str) -> Iterator[Dict[str, np.ndarray]]:
+    """The columns of each chunk written by a `HandRecorder`, in order"""
+    for path in sorted(glob.glob(os.path.join(directory, 'chunk-*.npz'))):
+        with np.load(path) as chunk:
+            yield {name: chunk[name] for name in chunk.files}
+
+def ragged(chunk: Dict[str, np.ndarray], name: str) -> List[np.ndarray]:
+    """The values of each row of the `RAGGED` column `name` of `chunk`"""
+    return np.split(chunk[name], chunk[name + '_end'][:-1])
@@ -0,0 +1,195 @@
+from collections import Counter
+from math import exp, inf, log, sqrt
+from typing import Dict, List, Tuple
+
+from table_games.common import HI_LO, CountingSystem, substream
+
+from .blackjack import Blackjack, PlayerPolicy
+from .basic import BasicPolicy
+from .deviations import TC_MAX, TC_MIN, tc_bucket
+from .montecarlo import DEFAULT_RULES, SHARDS, run_jobs, split
+
+
+class RunningStats:
+    """Count, mean and variance of a stream of values, by Welford's method"""
+
+    __slots__ = ('count', 'mean', '_m2')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Adds the values of `other`, as if they had been added one by one"""
+        count = self.count + other.count
+        if count:
+            delta = other.mean - self.mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self.mean += delta * other.count / count
+            self.count = count
+        return self
+
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stdev(self) -> float:
+        return sqrt(self.variance())
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={ self.count }, mean={ self.mean:.4f}, stdev={ self.stdev():.4f})"
+
+
+class BankrollStats:
+    """
+    Streaming statistics of one player's result per round: its mean and
+    variance, overall and per true count bucket (see `tc_bucket`), a histogram
+    of the results, the amount wagered and the deepest drawdown of the bank.
+
+    Memory doesn't grow with the number of rounds, and the statistics of
+    independent sessions can be combined with `merge`, as if the merged
+    session had been played right after this one.
+    """
+
+    def __init__(self) -> None:
+        self.rounds = RunningStats()
+        self.bins: List[RunningStats] = [RunningStats() for _ in range(TC_MAX - TC_MIN + 1)]
+        self.histogram: Counter = Counter()
+        self.wagered = 0
+
+        self.bank = 0
+        self._peak = 0          # Highest and lowest bank so far, from the start of the session at 0
+        self._low = 0
+        self.max_drawdown = 0
+
+    def record(self, net: float, wagered: float = 0, true_count: float = None) -> None:
+        """Adds the result of a round, played at `true_count` if known"""
+        self.rounds.add(net)
+        if true_count is not None:
+            self.bins[tc_bucket(true_count)].add(net)
+        self.histogram[net] += 1
+        self.wagered += wagered
+
+        self.bank += net
+        if self.bank > self._peak:
+            self._peak = self.bank
+        else:
+            if self._peak - self.bank > self.max_drawdown:
+                self.max_drawdown = self._peak - self.bank
+            if self.bank < self._low:
+                self._low = self.bank
+
+    def merge(self, other: 'BankrollStats') -> 'BankrollStats':
+        self.rounds.merge(other.rounds)
+        for mine, theirs in zip(self.bins, other.bins):
+            mine.merge(theirs)
+        self.histogram.update(other.histogram)
+        self.wagered += other.wagered
+
+        # `other`'s banks continue from this session's last one
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown, self._peak - (self.bank + other._low))
+        self._peak = max(self._peak, self.bank + other._peak)
+        self._low = min(self._low, self.bank + other._low)
+        self.bank += other.bank
+        return self
+
+    def ev(self) -> float:
+        """Mean result per round"""
+        return self.rounds.mean
+
+    def stdev(self) -> float:
+        """Standard deviation of the result of a round"""
+        return self.rounds.stdev()
+
+    def hourly(self, rounds_per_hour: float = 100) -> Tuple[float, float]:
+        """Expected result and its standard deviation over an hour of `rounds_per_hour` rounds"""
+        return self.ev() * rounds_per_hour, self.stdev() * sqrt(rounds_per_hour)
+
+    def n0(self) -> float:
+        """Rounds until the expected result is one standard deviation (variance / EV²); infinite without an edge"""
+        ev = self.ev()
+        return self.rounds.variance() / (ev * ev) if ev > 0 else inf
+
+    def risk_of_ruin(self, bankroll: float) -> float:
+        """
+        Chance of ever losing `bankroll` playing on forever, by the diffusion
+        approximation exp(-2 EV bankroll / variance); certain without an edge
+        """
+        ev = self.ev()
+        variance = self.rounds.variance()
+        if ev <= 0:
+            return 1.0
+        if variance == 0:
+            return 0.0
+        return exp(-2 * ev * bankroll / variance)
+
+    def bankroll_for(self, risk: float) -> float:
+        """The bankroll with a `risk` of ruin, the inverse of `risk_of_ruin`"""
+        ev = self.ev()
+        return -self.rounds.variance() * log(risk) / (2 * ev) if ev > 0 else inf
+
+    def by_count(self) -> Dict[int, Tuple[int, float, float]]:
+        """The rounds, EV and standard deviation of each true count bucket played, by its lowest true count"""
+        return {idx + TC_MIN: (stats.count, stats.mean, stats.stdev()) for idx, stats in enumerate(self.bins) if stats.count}
+
+    def __repr__(self) -> str:
+        ev_hour, sd_hour = self.hourly()
+        return (f"{ self.rounds.count } rounds: EV ${ self.ev():.4f}/round (SD { self.stdev():.4f}), "
+                f"${ ev_hour:.2f}/hour (SD { sd_hour:.2f}), N0 { self.n0():.0f}, max drawdown ${ self.max_drawdown }")
+
+
+def track(rounds: int, seed, policy: PlayerPolicy = BasicPolicy(), rules: Dict = None, system: CountingSystem = HI_LO) -> BankrollStats:
+    """
+    Plays `rounds` rounds of one player of `policy` in this process, recording
+    each round's result and the true count of `system` it was bet at.
+    """
+    game = Blackjack(**(DEFAULT_RULES if rules is None else rules), rng=substream(seed, 'shoe'))
+    game.add_player(policy)
+    state = game._players[0][1]
+    count = game._deck.track(system)
+
+    stats = BankrollStats()
+    for _ in range(rounds):
+        true_count = count.true_count()
+        bank = state._bank
+        wagered = state._wagered
+        game.simulate_rounds(1)
+        stats.record(state._bank - bank, state._wagered - wagered, true_count)
+
+    return stats
+
+def _track_shard(args) -> BankrollStats:
+    return track(*args)
+
+def run_bankroll(rounds: int, seed = 0, policy: PlayerPolicy = BasicPolicy(), rules: Dict = None, system: CountingSystem = HI_LO,
+                 workers: int = None, shards: int = None) -> BankrollStats:
+    """
+    Plays `rounds` rounds split into `shards` sessions (`SHARDS` by default)
+    across `workers` processes, and merges their statistics. Shard `i` is
+    seeded with `(seed, i)`, so a run is reproducible for a given `seed` and
+    `shards`, whatever the number of workers.
+    """
+    shards = shards or SHARDS
+
+    jobs = [(len(shard_rounds), (seed, shard), policy, rules, system) for shard, shard_rounds in enumerate(split(rounds, shards))]
+
+    stats = BankrollStats()
+    for shard_stats in run_jobs(_track_shard, jobs, workers):
+        stats.merge(shard_stats)
+    return stats
+
+
+if __name__ == "__main__":
+    from .deviations import CountPolicy
+
+    stats = run_bankroll(1000000, policy=CountPolicy())
+    print(stats)
+    print(f"Risk of ruin with $10,000: { 100 * stats.risk_of_ruin(10000):.2f}%")
+    for true_count, (rounds, ev, sd) in stats.by_count().items():
+        print(f"TC { true_count:+3d}: { rounds:8d} rounds, EV { ev:+.3f}, SD { sd:.2f}")
@@ -0,0 +1,113 @@
+import json
+from array import array
+from typing import Dict, List
+
+from table_games.common import Card
+
+from .blackjack import SpotState
+
+# Action codes
+STAND = 0
+HIT = 1
+DOUBLE_HIT = 2      # Double if allowed, otherwise hit
+DOUBLE_STAND = 3    # Double if allowed, otherwise stand
+SPLIT = 4
+NO_SPLIT = 5
+
+ACTION_CODES = {
+    'S': STAND,
+    'H': HIT,
+    'DH': DOUBLE_HIT,
+    'DS': DOUBLE_STAND,
+    'Y': SPLIT,
+    'N': NO_SPLIT,
+}
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+
+# Hand classes, in the order of the chart sections
+HARD = 0
+SOFT = 1
+PAIRS = 2
+HAND_CLASSES = ('hard', 'soft', 'pairs')
+
+ROWS = 32           # Totals 0-31; every total a live hand can have
+COLUMNS = 10
+
+# Chart column of each dealer upcard point value: 2-10, then the ace
+UPCARD_COLUMN = (None, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def table_index(hand_class: int, total: int, up_points: int) -> int:
+    return (hand_class * ROWS + total) * COLUMNS + UPCARD_COLUMN[up_points]
+
+
+class StrategyTable:
+    """
+    A strategy chart compiled to a flat array of action codes.
+
+    The chart has the same shape as `basic_strategy`: a 'hard', 'soft' and
+    'pairs' section, each mapping a total (or the point value of the paired
+    card) to ten action names for dealer upcards 2-10 and A. Hard and soft
+    totals outside a section's rows are clamped to its first or last row when
+    compiling, so a decision is a single lookup at `table_index`.
+    """
+
+    def __init__(self, chart: Dict[str, Dict[int, List[str]]]) -> None:
+        self._chart = {
+            section: {int(total): list(row) for total, row in chart[section].items()}
+            for section in HAND_CLASSES
+        }
+        self._actions = array('B', [NO_SPLIT]) * (len(HAND_CLASSES) * ROWS * COLUMNS)
+
+        for hand_class, section in enumerate(HAND_CLASSES):
+            rows = self._chart[section]
+            for total, row in rows.items():
+                if len(row) != COLUMNS:
+                    raise ValueError(f"Row { section } { total } has { len(row) } columns")
+
+            if hand_class == PAIRS:
+                for total, row in rows.items():
+                    self._fill(hand_class, total, row)
+                continue
+
+            low, high = min(rows), max(rows)
+            for total in range(ROWS):
+                row = rows.get(min(max(total, low), high))
+                if row is None:
+                    raise ValueError(f"Missing row { section } { total }")
+                self._fill(hand_class, total, row)
+
+    def _fill(self, hand_class: int, total: int, row: List[str]) -> None:
+        start = (hand_class * ROWS + total) * COLUMNS
+        for column, name in enumerate(row):
+            if name not in ACTION_CODES:
+                raise ValueError(f"Unknown action { name !r}")
+            self._actions[start + column] = ACTION_CODES[name]
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.chart(), f, indent=2)
+
+    def chart(self) -> Dict[str, Dict[int, List[str]]]:
+        """The chart this table was compiled from"""
+        return {section: {total: list(row) for total, row in rows.items()} for section, rows in self._chart.items()}
+
+    def lookup(self, hand_class: int, total: int, up_points: int) -> int:
+        return self._actions[table_index(hand_class, total, up_points)]
+
+    def split(self, spot: SpotState, up_card: Card) -> bool:
+        """True if the chart splits this spot's pair"""
+        if not spot._pair:
+            return False
+        return self._actions[table_index(PAIRS, spot._cards[0]._points, up_card._points)] == SPLIT
+
+    def play(self, spot: SpotState, up_card: Card) -> int:
+        """The hard or soft action for this spot, ignoring splits"""
+        if spot.is_soft():
+            return self._actions[table_index(SOFT, spot._hard + 10, up_card._points)]
+        return self._actions[table_index(HARD, spot._hard, up_card._points)]
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import pickle
+from typing import Dict, Tuple
+
+from table_games.__about__ import __version__
+
+from .blackjack import PlayerPolicy
+from .deviations import BetRamp
+from .montecarlo import SimulationResult, run_jobs, simulate
+
+_PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def code_version() -> str:
+    """The package version and a hash of its sources, so cached results expire when the code changes"""
+    digest = hashlib.sha256()
+    for root, dirs, files in sorted(os.walk(_PACKAGE)):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, _PACKAGE).encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return f"{ __version__ }+{ digest.hexdigest()[:16] }"
+
+def cell_key(rules: Dict, policy: PlayerPolicy, rounds: int, seed, players: int, version: str) -> str:
+    """Content hash of everything a cell's result depends on"""
+    config = (sorted(rules.items()), policy, rounds, seed, players, version)
+    return hashlib.sha256(pickle.dumps(config, protocol=4)).hexdigest()
+
+def _run_cell(args) -> SimulationResult:
+    return simulate(*args)
+
+
+def sweep(rules: Dict[str, Dict], policies: Dict[str, PlayerPolicy], rounds: int, ramps: Dict[str, BetRamp] = None,
+          seed = 0, players: int = 1, workers: int = None, cache_dir: str = '.sweep-cache') -> Dict[Tuple[str, str, str], SimulationResult]:
+    """
+    Simulates every combination of rule set, policy and bet ramp.
+
+    `rules` maps names to keyword arguments for `Blackjack`. Each policy is
+    played as is, and also with each of `ramps` if it has a `with_ramp` method
+    (like `CountPolicy`). Results are keyed by (rules name, policy name, ramp
+    name), the ramp name being None for a policy played as is.
+
+    Each cell plays `rounds` rounds from `seed` in one process of a pool of
+    `workers`, and its result is stored in `cache_dir` under a hash of its
+    configuration and of the code. Cells already there aren't simulated again.
+    """
+    version = code_version()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    cells = {}
+    for rules_name, game_rules in rules.items():
+        for policy_name, policy in policies.items():
+            variants = {None: policy}
+            if ramps and hasattr(policy, 'with_ramp'):
+                variants = {ramp_name: policy.with_ramp(ramp) for ramp_name, ramp in ramps.items()}
+            for ramp_name, variant in variants.items():
+                cells[(rules_name, policy_name, ramp_name)] = (game_rules, variant)
+
+    results = {}
+    pending = {}
+    for name, (game_rules, policy) in cells.items():
+        path = os.path.join(cache_dir, cell_key(game_rules, policy, rounds, seed, players, version) + '.json')
+        if os.path.exists(path):
+            with open(path) as f:
+                results[name] = SimulationResult.from_dict(json.load(f))
+        else:
+            pending[name] = (path, (rounds, seed, policy, players, game_rules))
+
+    if pending:
+        jobs = [job for path, job in pending.values()]
+        for (name, (path, job)), result in zip(pending.items(), run_jobs(_run_cell, jobs, workers)):
+            with open(path + '.tmp', 'w') as f:
+                json.dump(result.to_dict(), f)
+            os.replace(path + '.tmp', path)
+            results[name] = result
+
+    return {name: results[name] for name in cells}
@@ -1 +1,4 @@
-from .cards import *
\ No newline at end of file
+from .cards import *
+from .rng import make_rng, substream
+from .counting import COUNTING_SYSTEMS, HI_LO, KO, OMEGA_II, Count, CountingSystem
+from .replay import ReplayShoe, generate_shoes, write_shoes
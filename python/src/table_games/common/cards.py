@@ -1,7 +1,11 @@
+from array import array
 from enum import Enum
-from typing import List
+from typing import List, Tuple
 import random
 
+from .counting import Count, CountingSystem
+from .rng import make_rng, substream
+
 class CSuit(Enum):
     CLUBS = 1
     DIAMONDS = 2
@@ -25,57 +29,266 @@ class CValue(Enum):
     KING = 13
 
 
+_SUIT_SYMBOLS = {
+    CSuit.CLUBS.value:    "♧",
+    CSuit.DIAMONDS.value: "♢",
+    CSuit.HEARTS.value:   "♡",
+    CSuit.SPADES.value:   "♤"
+}
+
+_VALUE_NAMES = {
+    CValue.ACE.value:     "A",
+    CValue.JACK.value:    "J",
+    CValue.QUEEN.value:   "Q",
+    CValue.KING.value:    "K"
+}
+
+# Letters of the short form of a card, e.g. 'CA' for the ace of clubs
+_SUIT_LETTERS = "CDHS"
+_VALUE_LETTERS = "A23456789TJQK"
+
+
 class Card:
+    """
+    An immutable playing card.
+
+    Cards are interned: `Card(suit, value)` always returns the same instance for
+    a given suit and value, so a shoe of any size shares the 52 objects in
+    `CARDS`. Each card carries its blackjack point value (`_points`) and its
+    index into `CARDS` (`_code`) so neither has to be derived again.
+    """
+
+    __slots__ = ('_suit', '_value', '_points', '_code', '_repr')
+
+    _interned = {}
+
+    def __new__(cls, suit: int, value: int):
+        card = cls._interned.get((suit, value))
+        if card is not None:
+            return card
+
+        if suit not in _SUIT_SYMBOLS or not (CValue.ACE.value <= value <= CValue.KING.value):
+            raise ValueError(f"Invalid card: suit { suit }, value { value }")
+
+        card = super().__new__(cls)
+        set_field = super(Card, card).__setattr__
+        set_field('_suit', suit)
+        set_field('_value', value)
+        set_field('_points', min(value, 10))
+        set_field('_code', (suit - 1) * len(CValue) + (value - 1))
+        set_field('_repr', f"{ _SUIT_SYMBOLS[suit] }{ _VALUE_NAMES.get(value, value) }")
+
+        cls._interned[(suit, value)] = card
+        return card
+
+    @classmethod
+    def parse(cls, short: str) -> 'Card':
+        """The card written as a suit letter and a value letter, e.g. 'CA' or 'DT'"""
+        if len(short) != 2 or short[0] not in _SUIT_LETTERS or short[1] not in _VALUE_LETTERS:
+            raise ValueError(f"Invalid card: { short !r}")
+        return cls(_SUIT_LETTERS.index(short[0]) + 1, _VALUE_LETTERS.index(short[1]) + 1)
 
-    def __init__(self, suit: int, value: int) -> None:
-        self._suit = suit
-        self._value = value
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        return (Card, (self._suit, self._value))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self) -> str:
-        suit_map = {
-            CSuit.CLUBS.value:    "♧",
-            CSuit.DIAMONDS.value: "♢",
-            CSuit.HEARTS.value:   "♡",
-            CSuit.SPADES.value:   "♤"
-        }
+        return self._repr
 
-        value_map = {
-            CValue.ACE.value:     "A",
-            CValue.JACK.value:    "J",
-            CValue.QUEEN.value:   "Q",
-            CValue.KING.value:    "K"
-        }
 
-        suit = suit_map[self._suit]
-        value = self._value if self._value not in value_map else value_map[self._value]
+# Every card, indexed by its `_code`
+CARDS = tuple(Card(suit.value, value.value) for suit in CSuit for value in CValue)
 
-        return f"{suit}{value}"
+
+# Point value of each card code, less one: an index into a composition
+_COMPOSITION_INDEX = bytes(card._points - 1 for card in CARDS).ljust(256, b'\0')
 
 
 class Deck:
+    """
+    An ordered run of cards, stored as an array of card codes and a read cursor.
+
+    Drawing advances the cursor instead of removing the card, so a draw is O(1)
+    and the dealt cards stay in the buffer to be reshuffled in place.
+
+    `rng` is the `random.Random` (or a seed for one) used to shuffle. Without
+    one the deck shuffles with the global `random` module.
 
-    def __init__(self, cards: List[Card]) -> None:
-        self._cards = cards
+    The deck keeps a `Count` for every counting system registered with `track`,
+    updated in O(1) as each card is seen. Burned and hidden cards aren't counted
+    until they are revealed, and every count restarts when the deck is shuffled.
+    """
+
+    def __init__(self, cards: List[Card], rng = None) -> None:
+        self._setup(array('B', [card._code for card in cards]), rng)
+
+    def _setup(self, codes: array, rng) -> None:
+        self._codes = codes
+        self._cursor = 0
+        self._rng = random if rng is None else make_rng(rng)
+        self._counts: List[Count] = []
+
+    @classmethod
+    def _from_codes(cls, codes: array, rng = None):
+        deck = cls.__new__(cls)
+        deck._setup(codes, rng)
+        return deck
 
     def __add__(self, o):
-        new_cards = [*self._cards, *o._cards]
-        return Deck(new_cards)
+        new_codes = self._codes[self._cursor:] + o._codes[o._cursor:]
+        deck = Deck._from_codes(new_codes)
+        deck._rng = self._rng
+        return deck
 
     def shuffle(self):
-        random.shuffle(self._cards)
+        """Returns every dealt card to the deck and shuffles it in place"""
+        self._cursor = 0
+        self._rng.shuffle(self._codes)
+        for count in self._counts:
+            count.reset()
 
     def draw(self):
-        return self._cards.pop(0)
+        code = self._codes[self._cursor]
+        self._cursor += 1
+        if self._counts:
+            for count in self._counts:
+                count._running += count._tags[code]
+        return CARDS[code]
+
+    def draw_hidden(self):
+        """Draws a card face down; it isn't counted until it is revealed"""
+        code = self._codes[self._cursor]
+        self._cursor += 1
+        return CARDS[code]
+
+    def reveal(self, card: Card) -> None:
+        """Counts a card drawn with `draw_hidden`"""
+        for count in self._counts:
+            count._running += count._tags[card._code]
+
+    def burn(self) -> None:
+        """Discards the next card unseen"""
+        self._cursor += 1
+
+    def track(self, system: CountingSystem) -> Count:
+        """The live count of `system` over this deck, starting to track it if needed"""
+        for count in self._counts:
+            if count._system is system:
+                return count
+
+        count = Count(system, self)
+        self._counts.append(count)
+        return count
     
     def __len__(self):
-        return len(self._cards)
+        return len(self._codes) - self._cursor
+
+    def composition(self) -> Tuple[int, ...]:
+        """The number of undealt cards of each point value, aces first and tens last"""
+        remaining = self._codes[self._cursor:].tobytes().translate(_COMPOSITION_INDEX)
+        return tuple(remaining.count(idx) for idx in range(10))
 
     @classmethod
-    def Standard(cls):
-        cards = []
-        
-        for suit in CSuit:
-            for value in CValue:
-                cards.append(Card(suit.value, value.value))
-
-        return Deck(cards)
\ No newline at end of file
+    def Standard(cls, rng = None):
+        return Deck._from_codes(array('B', range(len(CARDS))), rng)
+
+
+class Shoe(Deck):
+    """`deck_count` standard decks, preallocated as one buffer"""
+
+    def __init__(self, deck_count: int = 1, rng = None) -> None:
+        self._setup(array('B', range(len(CARDS))) * deck_count, rng)
+
+
+class LazyShoe(Shoe):
+    """
+    A shoe whose shuffle is O(1): it returns every card to the shoe and each
+    draw then takes one of the undealt cards at random, swapping it into
+    place (a Fisher-Yates shuffle, run only as far as the cards dealt).
+
+    It deals the same distribution of shoes as `Shoe` for a fraction of the
+    shuffling work when most of the shoe is cut off, but not the same shoes for
+    a given seed.
+    """
+
+    def _setup(self, codes: array, rng) -> None:
+        super()._setup(codes, rng)
+        self._random = self._rng.random
+
+    def shuffle(self):
+        """Returns every dealt card to the shoe; they are shuffled as they are drawn"""
+        self._cursor = 0
+        for count in self._counts:
+            count.reset()
+
+    def _pick(self) -> int:
+        codes = self._codes
+        cursor = self._cursor
+        pick = cursor + int(self._random() * (len(codes) - cursor))
+        code = codes[pick]
+        codes[pick] = codes[cursor]
+        codes[cursor] = code
+        self._cursor = cursor + 1
+        return code
+
+    def draw(self):
+        code = self._pick()
+        if self._counts:
+            for count in self._counts:
+                count._running += count._tags[code]
+        return CARDS[code]
+
+    def draw_hidden(self):
+        return CARDS[self._pick()]
+
+    def burn(self) -> None:
+        self._pick()
+
+
+class CSMShoe(LazyShoe):
+    """
+    A continuous shuffling machine: the cards of each round go back into the
+    shoe with `recycle` once the round is over, and every card is drawn at
+    random from all the cards not on the table.
+    """
+
+    def recycle(self) -> None:
+        """Returns the dealt cards to the shoe"""
+        self.shuffle()
+
+
+class PairedShoe(Shoe):
+    """
+    A shoe whose `n`th shuffle is drawn from `substream(seed, 'shoe', n)`
+    alone, whatever was dealt before: games dealing from paired shoes of the
+    same seed see the same sequence of shoes even when they deal a different
+    number of cards from each, so their results differ by the play, not the luck.
+
+    The first shuffle deals shoe `start`; `shoe` is the one being dealt.
+    """
+
+    def __init__(self, deck_count: int = 1, seed = 0, start: int = 0) -> None:
+        super().__init__(deck_count)
+        self._seed = seed
+        self._ordered = self._codes[:]
+        self.shoe = start - 1
+
+    def shuffle(self):
+        self.shoe += 1
+        self._codes[:] = self._ordered
+        substream(self._seed, 'shoe', self.shoe).shuffle(self._codes)
+
+        self._cursor = 0
+        for count in self._counts:
+            count.reset()
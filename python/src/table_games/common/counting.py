@@ -0,0 +1,72 @@
+from typing import Sequence
+
+
+class CountingSystem:
+    """
+    A card counting system.
+
+    `tags` are the count values of each point value, aces first and ten-valued
+    cards last. Unbalanced systems start the count at `offset` per deck after
+    the first (e.g. -4 per extra deck for KO).
+    """
+
+    def __init__(self, name: str, tags: Sequence[float], offset: float = 0) -> None:
+        if len(tags) != 10:
+            raise ValueError("A counting system needs a tag for each of the ten point values")
+
+        self.name = name
+        self.tags = tuple(tags)
+        self.offset = offset
+
+        # Tag of each card code, so counting a card is a single lookup
+        self._code_tags = tuple(self.tags[min(code % 13 + 1, 10) - 1] for code in range(52))
+
+    def initial_count(self, deck_count: float) -> float:
+        return self.offset * (deck_count - 1)
+
+    def __repr__(self) -> str:
+        return f"CountingSystem({ self.name !r})"
+
+
+#                              A   2  3  4  5  6  7  8  9  T
+HI_LO    = CountingSystem('Hi-Lo',    (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1))
+KO       = CountingSystem('KO',       (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1), offset=-4)
+OMEGA_II = CountingSystem('Omega II', ( 0, 1, 1, 2, 2, 2, 1, 0, -1, -2))
+
+COUNTING_SYSTEMS = {system.name: system for system in (HI_LO, KO, OMEGA_II)}
+
+
+class Count:
+    """
+    The live count of one system over a deck, kept up to date by the deck as
+    cards are seen (see `Deck.track`).
+
+    Copying a count returns the same object, so a copied `PlayerState` still
+    reads the live count.
+    """
+
+    def __init__(self, system: CountingSystem, deck) -> None:
+        self._system = system
+        self._deck = deck
+        self._tags = system._code_tags
+        self._running = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self._running = self._system.initial_count(len(self._deck._codes) / 52)
+
+    def running_count(self) -> float:
+        return self._running
+
+    def decks_remaining(self) -> float:
+        return len(self._deck) / 52
+
+    def true_count(self) -> float:
+        decks = self.decks_remaining()
+        return self._running / decks if decks > 0 else self._running
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
@@ -0,0 +1,112 @@
+import mmap
+from typing import Iterable, Union
+
+from .cards import CARDS, Card, Deck, Shoe
+from .rng import make_rng
+
+# How a card may be given to `write_shoes`: a `Card`, its code, or its short form
+CardLike = Union[Card, int, str]
+
+
+def _code(card: CardLike) -> int:
+    if isinstance(card, Card):
+        return card._code
+    if isinstance(card, str):
+        return Card.parse(card)._code
+    if not 0 <= card < len(CARDS):
+        raise ValueError(f"Invalid card code: { card }")
+    return card
+
+
+def write_shoes(path: str, shoes: Iterable[Iterable[CardLike]], deck_count: int = None) -> int:
+    """
+    Writes `shoes` to `path` in the format read by `ReplayShoe`: one byte per
+    card code, one shoe after another. Shoes are written as they are produced,
+    so `shoes` may be a generator of any length.
+
+    Every shoe must hold `deck_count` decks' worth of cards, or as many as the
+    first shoe if `deck_count` is None. Returns the number of shoes written.
+    """
+    size = None if deck_count is None else deck_count * len(CARDS)
+    written = 0
+
+    with open(path, 'wb') as file:
+        for shoe in shoes:
+            if isinstance(shoe, Deck):
+                codes = shoe._codes[shoe._cursor:].tobytes()
+            else:
+                codes = bytes(_code(card) for card in shoe)
+
+            if size is None:
+                size = len(codes)
+            if not codes or len(codes) != size:
+                raise ValueError(f"Shoe { written } holds { len(codes) } cards, expected { size }")
+
+            file.write(codes)
+            written += 1
+
+    return written
+
+def generate_shoes(path: str, count: int, deck_count: int = 6, rng = None) -> int:
+    """Writes `count` shuffled shoes of `deck_count` decks to `path`, shuffled with `rng` (a seed or `random.Random`)"""
+    shoe = Shoe(deck_count, make_rng(rng))
+
+    def shuffled():
+        for _ in range(count):
+            shoe.shuffle()
+            yield shoe
+
+    return write_shoes(path, shuffled(), deck_count)
+
+
+class ReplayShoe(Deck):
+    """
+    A shoe that deals the shoes stored in a file by `write_shoes`, in order,
+    instead of shuffling its own.
+
+    The file is memory-mapped, not read: only the pages of the shoes being
+    dealt are loaded, and processes replaying the same file share them.
+    Shuffling moves on to the next stored shoe (or does nothing if no card of
+    the current one has been dealt), wrapping around after the last one.
+
+    `start` and `stride` pick which stored shoes are dealt, so that shoe
+    `start`, `start + stride`, ... can go to one worker and the others to the
+    rest: `ReplayShoe(path, 6, i, n)` for `i` in `range(n)` splits the file
+    between `n` workers.
+    """
+
+    def __init__(self, path: str, deck_count: int = 1, start: int = 0, stride: int = 1) -> None:
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        self._size = deck_count * len(CARDS)
+        if len(self._view) % self._size:
+            self.close()
+            raise ValueError(f"{ path } does not hold whole shoes of { deck_count } decks")
+
+        self._shoes = len(self._view) // self._size
+        self._stride = stride
+        self._shoe = start % self._shoes
+        self._setup(self._segment(), None)
+
+    def _segment(self) -> memoryview:
+        offset = self._shoe * self._size
+        return self._view[offset:offset + self._size]
+
+    def shuffle(self):
+        """Moves on to the next stored shoe"""
+        if self._cursor:
+            self._shoe = (self._shoe + self._stride) % self._shoes
+            self._codes.release()
+            self._codes = self._segment()
+        self._cursor = 0
+        for count in self._counts:
+            count.reset()
+
+    def close(self) -> None:
+        """Unmaps the file; the shoe can't be dealt from afterwards"""
+        if getattr(self, '_codes', None) is not None:
+            self._codes.release()
+        self._view.release()
+        self._map.close()
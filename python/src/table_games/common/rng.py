@@ -0,0 +1,27 @@
+import hashlib
+import random
+
+
+def make_rng(seed = None) -> random.Random:
+    """
+    A random number generator for `seed`.
+
+    A `random.Random` is returned as is; anything else (an int, a string, or
+    None for a fresh OS-seeded stream) seeds a new one.
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+def substream(seed, *key) -> random.Random:
+    """
+    An independent stream derived from `seed` and `key`, e.g.
+    `substream(seed, 'table', 3)`.
+
+    Streams for different keys don't overlap, so tables, workers or policies can
+    each be given their own stream and the whole run still replays from `seed`.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(128)
+    digest = hashlib.sha256(repr((seed, key)).encode()).digest()
+    return random.Random(int.from_bytes(digest, 'big'))
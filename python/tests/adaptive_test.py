@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from table_games.blackjack.blackjack import SpotStandAction
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.adaptive import MAX_ROUNDS, SEPARATED, STDERR, boundary, run_adaptive, separation
+from table_games.blackjack.montecarlo import DEFAULT_RULES
+
+
+class StandPolicy(BasicPolicy):
+
+    @classmethod
+    def Action(cls, player, spot, up_card, submit):
+        submit(SpotStandAction())
+
+
+def test_stops_at_the_target_stderr():
+    run = run_adaptive({'default': DEFAULT_RULES}, {'basic': BasicPolicy()}, target_stderr=0.5, batch=500, workers=1)
+    result = run.results[('default', 'basic')]
+
+    assert run.reasons[('default', 'basic')] == STDERR
+    assert result.stderr() <= 0.5
+    assert result.rounds == 500 * run.batches
+
+def test_stops_once_policies_separate():
+    policies = {'basic': BasicPolicy(), 'stand': StandPolicy()}
+    run = run_adaptive({'default': DEFAULT_RULES}, policies, alpha=0.05, batch=500, max_rounds=100000, workers=1)
+
+    assert set(run.reasons.values()) == {SEPARATED}
+    assert separation(run.results[('default', 'basic')], run.results[('default', 'stand')]) >= 1.96
+    assert run.results[('default', 'basic')].rounds < 100000
+
+def test_rules_are_not_compared():
+    rules = {'h17': DEFAULT_RULES, 's17': dict(DEFAULT_RULES, h17=False)}
+    run = run_adaptive(rules, {'stand': StandPolicy()}, alpha=0.05, batch=500, max_rounds=2000, workers=1)
+
+    assert set(run.reasons.values()) == {MAX_ROUNDS}
+
+def test_boundary_corrects_for_repeated_looks():
+    looks = [boundary(0.05, (k - 1) / 10, k / 10) for k in range(1, 11)]
+
+    assert all(a > b for a, b in zip(looks, looks[1:]))
+    assert looks[0] > 4
+    assert looks[-1] > 1.96
+
+def test_gives_up_after_max_rounds():
+    run = run_adaptive({'default': DEFAULT_RULES}, {'basic': BasicPolicy()}, target_stderr=1e-6, batch=300, max_rounds=900, workers=1)
+
+    assert run.reasons[('default', 'basic')] == MAX_ROUNDS
+    assert run.results[('default', 'basic')].rounds == 900
+
+def test_reproducible_across_workers():
+    rules = {'h17': DEFAULT_RULES, 's17': dict(DEFAULT_RULES, h17=False)}
+    a = run_adaptive(rules, {'basic': BasicPolicy()}, target_stderr=0.6, batch=300, workers=1)
+    b = run_adaptive(rules, {'basic': BasicPolicy()}, target_stderr=0.6, batch=300, workers=2)
+
+    assert {cell: result.to_dict() for cell, result in a.results.items()} == \
+           {cell: result.to_dict() for cell, result in b.results.items()}
+
+def test_needs_a_stopping_rule():
+    with pytest.raises(ValueError, match='alpha'):
+        run_adaptive({'default': DEFAULT_RULES}, {'basic': BasicPolicy()})
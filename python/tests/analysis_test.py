@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import time
+
+import pytest
+
+from table_games.common.cards import *
+from table_games.blackjack.blackjack import Blackjack, PlayerState, SpotState
+from table_games.blackjack.analysis import Analyzer
+
+
+def spot_of(*values):
+    spot = SpotState()
+    for value in values:
+        spot.dealt(Card(CSuit.CLUBS.value, value))
+    return spot
+
+def composition_without(deck_count, *values):
+    composition = list(Shoe(deck_count).composition())
+    for value in values:
+        composition[min(value, 10) - 1] -= 1
+    return composition
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return Analyzer()
+
+@pytest.fixture(scope='module')
+def game():
+    return Blackjack(6, True, 5, 5, 100)
+
+def test_sixteen_against_ten(analyzer, game):
+    plays = analyzer.evaluate(spot_of(10, 6), Card(CSuit.HEARTS.value, 10), game, composition_without(6, 10, 6, 10))
+
+    assert plays['stand'] == pytest.approx(-0.541, abs=1e-3)
+    assert plays['hit'] == pytest.approx(-0.535, abs=1e-3)
+    assert plays['split'] is None
+
+def test_double_eleven(analyzer, game):
+    spot = spot_of(5, 6)
+    up_card = Card(CSuit.HEARTS.value, 6)
+    name, ev = analyzer.best(spot, up_card, game, composition_without(6, 5, 6, 6))
+
+    assert name == 'double'
+    assert ev > 0
+
+def test_no_double_on_three_cards(analyzer, game):
+    plays = analyzer.evaluate(spot_of(2, 3, 4), Card(CSuit.HEARTS.value, 10), game, composition_without(6, 2, 3, 4, 10))
+
+    assert plays['double'] is None
+
+def test_split_eights(analyzer, game):
+    plays = analyzer.evaluate(spot_of(8, 8), Card(CSuit.HEARTS.value, 10), game, composition_without(6, 8, 8, 10))
+
+    assert plays['split'] > max(plays['stand'], plays['hit'])
+
+def test_split_follows_the_resplit_rules(analyzer):
+    up_card = Card(CSuit.HEARTS.value, 10)
+    aces = spot_of(1, 1)
+    aces._split = True
+    composition = composition_without(6, 1, 1, 10)
+
+    assert analyzer.evaluate(aces, up_card, Blackjack(6, True, 5, 5, 100, rsa=True), composition)['split'] is not None
+    assert analyzer.evaluate(aces, up_card, Blackjack(6, True, 5, 5, 100, rsa=False), composition)['split'] is None
+
+    player = PlayerState()
+    player._spots = [spot_of(8, 8) for _ in range(3)]
+    for spot in player._spots:
+        spot._root = player._spots[0]._root
+        spot._split = True
+    eights = player._spots[0]
+    composition = composition_without(6, 8, 8, 8, 8, 8, 8, 10)
+
+    assert analyzer.evaluate(eights, up_card, Blackjack(6, True, 5, 5, 100, spc=4), composition, player)['split'] is not None
+    assert analyzer.evaluate(eights, up_card, Blackjack(6, True, 5, 5, 100, spc=3), composition, player)['split'] is None
+    assert analyzer.evaluate(eights, up_card, Blackjack(6, True, 5, 5, 100, spc=2), composition)['split'] is None
+
+def test_cache_is_reused(analyzer, game):
+    args = (spot_of(10, 2), Card(CSuit.HEARTS.value, 4), game, composition_without(6, 10, 2, 4))
+    first = analyzer.evaluate(*args)
+    hits = analyzer._hit.cache_info().hits
+
+    assert analyzer.evaluate(*args) == first
+    assert analyzer._hit.cache_info().hits > hits
+
+@pytest.mark.parametrize('values, up', [((10, 6), 10), ((8, 8), 10), ((2, 3), 6), ((1, 2), 5)])
+def test_decisions_take_milliseconds(game, values, up):
+    analyzer = Analyzer()
+    start = time.perf_counter()
+    analyzer.evaluate(spot_of(*values), Card(CSuit.HEARTS.value, up), game, composition_without(6, *values, up))
+
+    assert time.perf_counter() - start < 0.1
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from table_games.common.cards import *
+from table_games.blackjack.blackjack import Blackjack
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.batch import BatchBlackjack
+
+
+@pytest.mark.parametrize('rules', [
+    dict(h17=True, das=True, spc=4, rsa=True, bj=1.5),
+    dict(h17=False, das=False, spc=2, rsa=False, bj=1.2),
+])
+def test_batch_matches_scalar_engine(rules):
+    tables, rounds = 60, 30
+    rng = np.random.default_rng(3)
+    ranks = np.tile(np.arange(1, 14, dtype=np.uint8), 4 * 6)
+    shoes = np.stack([rng.permutation(ranks) for _ in range(tables)])
+
+    batch = BatchBlackjack(tables, 6, pen=5, shoes=shoes, **rules)
+    batch.play_rounds(rounds)
+
+    for idx in range(tables):
+        game = Blackjack(6, pen=5, tmin=1, tmax=100, **rules)
+        game.add_player(BasicPolicy())
+        game._deck = Deck([Card(CSuit.CLUBS.value, int(rank)) for rank in shoes[idx]])
+        game.simulate_rounds(rounds)
+
+        assert game._players[0][1]._bank == pytest.approx(10 * batch.bank[idx])
+        assert len(game._deck) == shoes.shape[1] - batch._cursor[idx]
+
+def test_batch_tallies():
+    batch = BatchBlackjack(500, 6, True, 5, seed=1)
+    result = batch.play_rounds(40)
+
+    assert result.rounds == 500 * 40
+    assert result.hands == result.wins + result.losses + result.pushes + result.blackjacks
+    assert abs(result.bank - batch.bank.sum()) < 1e-6
+    assert -0.05 < result.edge() < 0.05
+
+@pytest.mark.parametrize('rsa, spc, bank', [(False, 4, -2), (True, 2, -2), (True, 4, -3)])
+def test_split_aces_stand_on_a_second_ace_without_resplits(rsa, spc, bank):
+    ranks = [1, 6, 1, 10, 1, 5, 2, 3, 4] + [9] * 43
+    batch = BatchBlackjack(1, 1, True, 1, spc=spc, rsa=rsa, shoes=np.array([ranks]))
+    batch.play_rounds(1)
+    assert batch.bank[0] == bank
+
+    game = Blackjack(1, True, 1, 1, 100, spc=spc, rsa=rsa)
+    game.add_player(BasicPolicy())
+    game._deck = Deck([Card(CSuit.CLUBS.value, rank) for rank in ranks])
+    game.simulate_rounds(1)
+
+    assert game._players[0][1]._bank == pytest.approx(10 * batch.bank[0])
+    assert batch._cursor[0] == len(ranks) - len(game._deck)
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from collections import Counter
+
+from table_games.common.cards import *
+from table_games.common.rng import substream
+
+
+def faces(cards):
+    return [(card._suit, card._value) for card in cards]
+
+def test_deck_draws_in_order():
+    cards = [Card(CSuit.CLUBS.value, CValue.ACE.value), Card(CSuit.HEARTS.value, CValue.TEN.value)]
+    deck = Deck(cards)
+
+    assert len(deck) == 2
+    assert faces([deck.draw(), deck.draw()]) == faces(cards)
+    assert len(deck) == 0
+
+def test_deck_add_keeps_undealt_cards():
+    a = Deck.Standard()
+    a.draw()
+    b = a + Deck.Standard()
+
+    assert len(b) == 103
+
+def test_shoe_shuffle_returns_dealt_cards():
+    shoe = Shoe(6)
+    assert len(shoe) == 6 * 52
+
+    for _ in range(100):
+        shoe.draw()
+    assert len(shoe) == 6 * 52 - 100
+
+    shoe.shuffle()
+    assert len(shoe) == 6 * 52
+
+    counts = Counter(faces(shoe.draw() for _ in range(len(shoe))))
+    assert len(counts) == 52
+    assert set(counts.values()) == {6}
+
+def test_cards_are_interned():
+    card = Card(CSuit.SPADES.value, CValue.KING.value)
+
+    assert card is Card(CSuit.SPADES.value, CValue.KING.value)
+    assert card is CARDS[card._code]
+    assert card._points == 10
+    assert repr(card) == "♤K"
+
+def test_cards_are_immutable():
+    card = Card(CSuit.HEARTS.value, CValue.ACE.value)
+    try:
+        card._value = 2
+        assert False
+    except AttributeError:
+        pass
+
+def test_shoe_shares_interned_cards():
+    shoe = Shoe(8)
+    dealt = {id(shoe.draw()) for _ in range(len(shoe))}
+
+    assert len(dealt) == 52
+
+def test_seeded_shoes_shuffle_alike():
+    a = Shoe(6, rng=42)
+    b = Shoe(6, rng=42)
+    a.shuffle()
+    b.shuffle()
+
+    assert a._codes == b._codes
+
+def test_substreams_are_independent_and_reproducible():
+    a = Shoe(6, rng=substream(42, 'table', 0))
+    b = Shoe(6, rng=substream(42, 'table', 1))
+    c = Shoe(6, rng=substream(42, 'table', 0))
+    for shoe in (a, b, c):
+        shoe.shuffle()
+
+    assert a._codes == c._codes
+    assert a._codes != b._codes
+
+def test_lazy_shoe_deals_every_card_once():
+    shoe = LazyShoe(2, rng=7)
+    shoe.shuffle()
+    shoe.burn()
+    dealt = [shoe.draw() for _ in range(len(shoe))]
+
+    counts = Counter(faces(dealt))
+    assert len(dealt) == 2 * 52 - 1
+    assert max(counts.values()) <= 2
+
+    shoe.shuffle()
+    assert len(shoe) == 2 * 52
+    assert Counter(faces(shoe.draw() for _ in range(len(shoe)))) == Counter({face: 2 for face in faces(CARDS)})
+
+def test_csm_shoe_takes_cards_back():
+    shoe = CSMShoe(1, rng=7)
+    for _ in range(100):
+        for _ in range(10):
+            shoe.draw()
+        assert len(shoe) == 42
+        shoe.recycle()
+        assert len(shoe) == 52
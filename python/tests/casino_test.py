@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from table_games.blackjack.blackjack import Blackjack, PlayerState
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.casino import Floor, run_casino
+from table_games.blackjack.deviations import CountPolicy
+
+
+def test_players_move_between_tables():
+    a = Blackjack(6, True, 5, 5, 100, rng=1)
+    b = Blackjack(6, True, 5, 5, 100, rng=2)
+    policy = CountPolicy()
+    state = PlayerState()
+    a.add_player(BasicPolicy())
+    a.add_player(policy, state)
+
+    assert a.remove_player(state)
+    assert b.add_player(policy, state)
+    assert state._count is b._deck.track(policy.COUNT)
+    assert [seat._index for seat in a._seats] == [0]
+    assert b.simulate_rounds(5) == 5
+
+def test_floor_hoppers_play_every_round():
+    floor = Floor(range(4), seed=3, players=2, hoppers=[CountPolicy(), CountPolicy()], min_true_count=1)
+    floor.play_rounds(300)
+
+    for result in floor.results:
+        assert result.rounds == 300
+    for hopper in floor.hoppers:
+        assert hopper.result.rounds == 300
+        assert hopper.moves > 0
+        assert hopper.result.hands >= 300
+
+def test_casino_is_reproducible_across_workers():
+    serial = run_casino(6, 100, seed=5, hoppers=0, workers=1)
+    parallel = run_casino(6, 100, seed=5, hoppers=0, workers=3)
+
+    assert list(serial.tables) == list(range(6))
+    assert [result.bank for result in serial.tables.values()] == [result.bank for result in parallel.tables.values()]
+    assert serial.table_total().rounds == 600
+
+def test_casino_spreads_hoppers_over_floors():
+    result = run_casino(4, 50, seed=5, hoppers=3, floor_tables=2, workers=2)
+
+    assert len(result.hoppers) == 3
+    assert result.hopper_total().rounds == 150
+
+def test_hoppers_do_not_depend_on_the_workers():
+    serial = run_casino(4, 300, seed=5, hoppers=2, workers=1)
+    parallel = run_casino(4, 300, seed=5, hoppers=2, workers=4)
+
+    assert [result.bank for result in serial.tables.values()] == [result.bank for result in parallel.tables.values()]
+    assert [result.bank for result in serial.hoppers] == [result.bank for result in parallel.hoppers]
+    assert serial.moves == parallel.moves
+    assert all(moves > 0 for moves in serial.moves)
+
+def test_hoppers_stay_put_when_tables_are_full():
+    floor = Floor(range(2), seed=3, players=5, hoppers=[CountPolicy(), CountPolicy()], min_true_count=100)
+    hopper, other = floor.hoppers
+
+    assert hopper.table is not other.table
+    assert not floor._seat(hopper, other.table)
+    assert hopper.state in [state for _, state in hopper.table._players]
+
+    floor.play_rounds(50)
+    assert hopper.moves == other.moves == 0
+
+    try:
+        Floor(range(1), players=6, hoppers=[CountPolicy()])
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from table_games.common import *
+from table_games.blackjack.blackjack import Blackjack, BlackjackState
+from table_games.blackjack.basic import BasicPolicy
+
+
+def hi_lo(cards):
+    return sum(HI_LO.tags[card._points - 1] for card in cards)
+
+def test_counts_drawn_cards_only():
+    shoe = Shoe(2, rng=3)
+    shoe.shuffle()
+    count = shoe.track(HI_LO)
+
+    shoe.burn()
+    seen = [shoe.draw() for _ in range(30)]
+    hidden = shoe.draw_hidden()
+
+    assert count.running_count() == hi_lo(seen)
+    shoe.reveal(hidden)
+    assert count.running_count() == hi_lo(seen + [hidden])
+    assert count.decks_remaining() == pytest.approx((104 - 32) / 52)
+    assert count.true_count() == pytest.approx(count.running_count() / count.decks_remaining())
+
+def test_shuffle_resets_counts():
+    shoe = Shoe(6, rng=3)
+    ko = shoe.track(KO)
+    omega = shoe.track(OMEGA_II)
+    assert shoe.track(KO) is ko
+
+    for _ in range(50):
+        shoe.draw()
+    shoe.shuffle()
+
+    assert ko.running_count() == -20
+    assert omega.running_count() == 0
+
+class CountingBasicPolicy(BasicPolicy):
+    COUNT = HI_LO
+
+def test_players_read_the_table_count():
+    game = Blackjack(6, True, 5, 5, 100, rng=11)
+    game.add_player(CountingBasicPolicy())
+    count = game._players[0][1]._count
+
+    seen = []
+    while True:
+        if game._state == BlackjackState.CLEANUP:
+            cards = list(game._dealer)
+            for spot in game._players[0][1]._spots:
+                cards += spot._cards
+            seen += cards
+            reshuffling = (game._deck_count - game._pen) * 52 > len(game._deck)
+            game.next()
+            if reshuffling:
+                break
+            assert count.running_count() == hi_lo(seen)
+            assert count.decks_remaining() == len(game._deck) / 52
+        else:
+            game.next()
+
+    assert count.running_count() == 0
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from table_games.common.cards import *
+from table_games.blackjack.blackjack import Blackjack
+from table_games.blackjack.basic import BASIC_TABLE
+from table_games.blackjack.deviations import *
+from table_games.blackjack.strategy import DOUBLE_HIT, HARD, HIT, PAIRS, SPLIT, STAND, NO_SPLIT, UPCARD_COLUMN, StrategyTable, table_index
+
+
+def test_buckets_floor_and_clamp():
+    assert tc_bucket(0.5) - tc_bucket(0) == 0
+    assert tc_bucket(-0.5) - tc_bucket(0) == -1
+    assert tc_bucket(50) == tc_bucket(TC_MAX)
+    assert tc_bucket(-50) == 0
+
+def test_deviation_tables():
+    tables = compile_deviations(BASIC_TABLE, ILLUSTRIOUS_18)
+
+    assert tables[tc_bucket(-1)].lookup(HARD, 16, 10) == HIT
+    assert tables[tc_bucket(0)].lookup(HARD, 16, 10) == STAND
+    assert tables[tc_bucket(-3)].lookup(HARD, 12, 5) == HIT
+    assert tables[tc_bucket(4)].lookup(PAIRS, 10, 5) == NO_SPLIT
+    assert tables[tc_bucket(5)].lookup(PAIRS, 10, 5) == SPLIT
+
+def test_deviations_keep_basic_strategy_at_a_neutral_count():
+    tables = compile_deviations(BASIC_TABLE, ILLUSTRIOUS_18)
+
+    def differences(true_count):
+        table = tables[tc_bucket(true_count)]
+        return [idx for idx, (a, b) in enumerate(zip(table._actions, BASIC_TABLE._actions)) if a != b]
+
+    # Only the two deviations indexed at 0 differ from basic strategy around it
+    assert differences(0) == [table_index(HARD, 16, 10)]
+    assert differences(-0.5) == [table_index(HARD, 12, 4)]
+
+def test_deviations_fall_through_to_the_base_chart():
+    chart = BASIC_TABLE.chart()
+    chart['hard'][11][UPCARD_COLUMN[1]] = 'H'
+    s17 = compile_deviations(StrategyTable(chart), ILLUSTRIOUS_18)
+    h17 = compile_deviations(BASIC_TABLE, ILLUSTRIOUS_18)
+
+    assert s17[tc_bucket(0)].lookup(HARD, 11, 1) == HIT
+    assert s17[tc_bucket(1)].lookup(HARD, 11, 1) == DOUBLE_HIT
+    assert h17[tc_bucket(-5)].lookup(HARD, 11, 1) == DOUBLE_HIT
+
+def test_bet_ramp():
+    ramp = BetRamp([(2, 2, 50), (-10, 1, 5), (0, 1, 10)])
+
+    assert (ramp.spots(-3), ramp.bet(-3)) == (1, 5)
+    assert ramp.bet(1.9) == 10
+    assert (ramp.spots(7), ramp.bet(7)) == (2, 50)
+
+def test_count_policy_plays_a_shoe():
+    game = Blackjack(6, True, 5, 5, 200, rng=21)
+    game.add_player(CountPolicy())
+    game.add_player(CountPolicy())
+    state = game._players[0][1]
+
+    bets = set()
+    for _ in range(300):
+        game.next()
+        game.next()
+        bets.update(spot._bet for spot in state._spots)
+        game.simulate_rounds(1)
+
+    assert state._count is game._players[1][1]._count
+    assert len(bets) > 1
+    assert state._hands > 300
+
+def test_count_policy_bets_within_the_table_limits():
+    game = Blackjack(6, True, 5, 5, 100, rng=21)
+    game.add_player(CountPolicy(ramp=BetRamp([(TC_MIN, 1, 1), (1, 2, 150)])))
+    state = game._players[0][1]
+
+    bets = set()
+    for _ in range(300):
+        game.next()
+        game.next()
+        bets.update(spot._bet for spot in state._spots)
+        game.simulate_rounds(1)
+
+    assert bets == {5, 100}
+    assert state._hands >= 300
+
+def test_refused_bets_sit_the_round_out():
+    class Overbet(CountPolicy):
+        def Bet(self, player, submit):
+            assert not submit(1000)
+
+    game = Blackjack(6, True, 5, 5, 100, rng=21)
+    game.add_player(Overbet())
+    state = game._players[0][1]
+    cards = len(game._deck)
+
+    game.simulate_rounds(10)
+    assert state._hands == 0
+    assert state._wagered == 0
+    assert len(game._deck) < cards
+
+def test_default_ramp_is_within_the_default_limits():
+    from table_games.blackjack.montecarlo import DEFAULT_RULES
+
+    assert all(DEFAULT_RULES['tmin'] <= bet <= DEFAULT_RULES['tmax'] for _, _, bet in DEFAULT_RAMP.steps)
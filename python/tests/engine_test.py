@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import random
+
+from table_games.common.cards import Card, Deck
+from table_games.blackjack.blackjack import Blackjack, BlackjackState, PlayerView, PlayerState
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.events import EventKind, ListSink
+
+
+def make_game(seed, players=3):
+    random.seed(seed)
+    game = Blackjack(6, True, 5, 5, 100)
+    for _ in range(players):
+        game.add_player(BasicPolicy())
+    return game
+
+def step_rounds(game, rounds):
+    played = 0
+    while played < rounds:
+        if game._state == BlackjackState.CLEANUP:
+            played += 1
+        game.next()
+
+# Dealt player, upcard, player, hole card, then the draws of the round
+SCRIPT = [
+    'CT', 'C9', 'CJ', 'C7', 'DT',           # 20 against a dealer's 16, who busts: +10
+    'C5', 'D6', 'C6', 'HT', 'C9', 'D7',     # 11 doubled to 20 against 16, who busts: +20
+    'ST', 'DK', 'S6', 'H9', 'HK',           # 16 hit and busted against a 19: -10
+    'CA', 'C7', 'CK', 'D9', 'C2',           # A blackjack against a 16, paid 3 to 2: +15
+]
+BANKS = [10, 30, 20, 35]
+
+def scripted_game():
+    game = Blackjack(1, True, 1, 5, 100)
+    game.add_player(BasicPolicy())
+    game._deck = Deck([Card.parse(code) for code in SCRIPT] + [Card.parse('H2')] * 10)
+    return game
+
+def test_simulate_rounds_matches_next():
+    stepped = scripted_game()
+    simulated = scripted_game()
+
+    for bank in BANKS:
+        step_rounds(stepped, 1)
+        assert simulated.simulate_rounds(1) == 1
+        assert stepped._players[0][1]._bank == simulated._players[0][1]._bank == bank
+
+    assert simulated._state == stepped._state == BlackjackState.PREBETTING
+    assert len(simulated._deck) == len(stepped._deck)
+
+def test_simulate_rounds_matches_next_over_a_shoe():
+    stepped = make_game(1234)
+    step_rounds(stepped, 500)
+
+    simulated = make_game(1234)
+    assert simulated.simulate_rounds(500) == 500
+
+    assert simulated._deck._codes == stepped._deck._codes
+    assert [state._bank for _, state in simulated._players] == [state._bank for _, state in stepped._players]
+
+def test_simulate_rounds_finishes_round_in_progress():
+    stepped = make_game(99, players=1)
+    step_rounds(stepped, 10)
+
+    simulated = make_game(99, players=1)
+    simulated.next()
+    simulated.next()
+    simulated.simulate_rounds(9)
+
+    assert simulated._players[0][1]._bank == stepped._players[0][1]._bank
+
+def test_player_view_is_read_only():
+    state = PlayerState()
+    state._bank = 25
+    view = PlayerView(state)
+
+    assert view._bank == 25
+    assert len(view._spots) == 1
+    try:
+        view._bank = 0
+        assert False
+    except AttributeError:
+        pass
+
+def test_player_view_hides_the_live_state():
+    state = PlayerState()
+    view = PlayerView(state)
+
+    view._spots[0]._bet = 100
+    assert state._spots[0]._bet == 0
+    for name in ('_player', '__dict__', '_results'):
+        try:
+            getattr(view, name)
+            assert False
+        except AttributeError:
+            pass
+
+def test_silent_by_default(capsys):
+    make_game(5).simulate_rounds(200)
+
+    assert capsys.readouterr().out == ''
+
+def test_events_are_sent_to_the_sink():
+    random.seed(5)
+    sink = ListSink()
+    game = Blackjack(6, True, 5, 5, 100, events=sink)
+    game.add_player(BasicPolicy())
+    game.simulate_rounds(200)
+
+    kinds = {event.kind for event in sink.events}
+    assert {EventKind.SPREAD, EventKind.STAND, EventKind.HIT, EventKind.SHUFFLE} <= kinds
+    assert all(event.player == 0 for event in sink.events if event.kind == EventKind.HIT)
+
+def test_seeded_games_ignore_global_random():
+    banks = []
+    for global_seed in (1, 2):
+        random.seed(global_seed)
+        game = Blackjack(6, True, 5, 5, 100, rng=77)
+        game.add_player(BasicPolicy())
+        game.simulate_rounds(300)
+        banks.append(game._players[0][1]._bank)
+
+    assert banks[0] == banks[1]
+
+def test_csm_returns_the_cards_every_round():
+    game = Blackjack(2, True, 1, 5, 100, rng=4, csm=True)
+    game.add_player(BasicPolicy())
+    game.add_player(BasicPolicy())
+
+    for _ in range(300):
+        game.simulate_rounds(1)
+        assert len(game._deck) == 2 * 52
+
+    assert game._players[0][1]._hands >= 300
+
+def test_lazy_shuffle_plays_the_same_game_rules():
+    game = Blackjack(6, True, 5, 5, 100, rng=4, lazy=True)
+    game.add_player(BasicPolicy())
+    game.simulate_rounds(2000)
+
+    state = game._players[0][1]
+    assert state._hands >= 2000
+    assert state._wins + state._losses + state._pushes + state._blackjacks == state._hands
+
+def test_split_aces_stand_on_a_second_ace_without_resplits():
+    codes = ['CA', 'H6', 'DA', 'HT', 'SA', 'C5', 'H2', 'H3', 'H4']
+    for rsa, spc, resplits in ((False, 4, False), (True, 2, False), (True, 4, True)):
+        events = ListSink()
+        game = Blackjack(1, True, 1, 5, 100, spc=spc, rsa=rsa, events=events)
+        game.add_player(BasicPolicy())
+        game._deck = Deck([Card.parse(code) for code in codes] + [Card.parse('D9')] * 10)
+        game.simulate_rounds(1)
+
+        actions = [event.kind for event in events.events if event.kind in (EventKind.SPLIT, EventKind.HIT, EventKind.DOUBLE)]
+        assert actions == ([EventKind.SPLIT] * (2 if resplits else 1))
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from table_games.blackjack.basic import BASIC_TABLE
+from table_games.blackjack.batch import BatchBlackjack
+from table_games.blackjack.env import (DOUBLE, HIT, OBS_CAN_DOUBLE, OBS_COMPOSITION, OBS_TOTAL, OBS_UPCARD,
+                                       OBSERVATION_SIZE, STAND, VectorEnv, table_actions)
+
+
+def test_observations_are_decisions():
+    env = VectorEnv(256, seed=1)
+    obs, info = env.reset()
+
+    for _ in range(50):
+        assert obs.shape == (256, OBSERVATION_SIZE)
+        assert ((obs[:, OBS_TOTAL] >= 4) & (obs[:, OBS_TOTAL] <= 21)).all()
+        assert ((obs[:, OBS_UPCARD] >= 1) & (obs[:, OBS_UPCARD] <= 10)).all()
+        assert np.allclose(obs[:, OBS_COMPOSITION:].sum(axis=1), 1)
+        obs, rewards, terminated, truncated, info = env.step(np.full(256, HIT))
+
+    assert not truncated.any()
+
+def test_standing_ends_every_hand():
+    env = VectorEnv(64, seed=2)
+    env.reset()
+    _, rewards, terminated, _, info = env.step(np.full(64, STAND))
+
+    assert terminated.all()
+    assert set(np.unique(rewards)) <= {-1, 0, 1}
+
+def test_doubling_doubles_the_stake():
+    env = VectorEnv(64, seed=3)
+    obs, _ = env.reset()
+    assert obs[:, OBS_CAN_DOUBLE].all()
+    _, rewards, terminated, _, _ = env.step(np.full(64, DOUBLE))
+
+    assert terminated.all()
+    assert set(np.unique(rewards)) <= {-2, 0, 2}
+
+def test_invalid_actions_are_refused():
+    env = VectorEnv(4, seed=5)
+    env.reset()
+    episodes = env.episodes
+
+    with pytest.raises(ValueError):
+        env.step(np.array([STAND, HIT, 7, STAND]))
+    with pytest.raises(ValueError):
+        env.step(np.full(3, STAND))
+    assert env.episodes == episodes
+
+def test_bank_adds_up():
+    env = VectorEnv(128, seed=4)
+    obs, info = env.reset()
+    total = info['natural'].sum()
+
+    for _ in range(200):
+        obs, rewards, _, _, info = env.step(table_actions(BASIC_TABLE, obs))
+        total += rewards.sum() + info['natural'].sum()
+
+    assert total == pytest.approx(env.bank.sum())
+
+def test_basic_strategy_matches_the_batch_engine():
+    # The environment never splits, so compare with a batch game that can't either
+    env = VectorEnv(2048, seed=5)
+    obs, _ = env.reset()
+    for _ in range(1000):
+        obs, *_ = env.step(table_actions(BASIC_TABLE, obs))
+
+    batch = BatchBlackjack(2048, 6, True, 5, spc=1, seed=5).play_rounds(800)
+    env_ev = env.bank.sum() / env.episodes
+
+    assert abs(env_ev - batch.ev()) < 4 * 1.15 / np.sqrt(env.episodes) + 4 * batch.stderr()
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from table_games.common.cards import *
+from table_games.blackjack.blackjack import Hand, SpotState, best_total, hard_total, soft_total
+
+
+def hand(*values):
+    h = SpotState()
+    for value in values:
+        h.dealt(Card(CSuit.CLUBS.value, value))
+    return h
+
+def test_running_totals_match_rescans():
+    for values in [(1, 6), (1, 1, 9), (10, 6, 1), (13, 12), (1, 13), (5, 5, 5, 1, 1)]:
+        h = hand(*values)
+        cards = list(h._cards)
+
+        assert h.hard_total() == hard_total(cards)
+        assert h.soft_total() == soft_total(cards)
+        assert h.best_total() == best_total(cards)
+
+def test_flags():
+    assert hand(1, 12).is_blackjack()
+    assert not hand(1, 5, 5).is_blackjack()
+    assert hand(8, 8).is_pair()
+    assert not hand(12, 13).is_pair()
+    assert hand(1, 6).is_soft()
+    assert not hand(1, 6, 10).is_soft()
+
+def test_split_keeps_first_card():
+    h = hand(1, 1)
+    second = h.split()
+
+    assert second._value == 1
+    assert len(h) == 1
+    assert h.hard_total() == 1
+    assert not h.is_pair()
+
+def test_clear():
+    h = Hand()
+    h.dealt(Card(CSuit.SPADES.value, CValue.ACE.value))
+    h.clear()
+
+    assert len(h) == 0
+    assert h.soft_total() == 0
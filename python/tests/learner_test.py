@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from table_games.blackjack.basic import BasicPolicy, basic_strategy
+from table_games.blackjack.learner import CHART_ROWS, QTable, chart_diff, learn
+from table_games.blackjack.strategy import DOUBLE_HIT, HARD, PAIRS, SPLIT, STAND, StrategyTable
+
+
+@pytest.fixture(scope='module')
+def learned():
+    return learn(3, 30000, seed=1, workers=1)
+
+def test_learns_the_clear_cases(learned):
+    table = learned.table()
+
+    for up in range(1, 11):
+        assert table.lookup(HARD, 20, up) == STAND
+        assert table.lookup(HARD, 19, up) == STAND
+    assert table.lookup(HARD, 11, 6) == DOUBLE_HIT
+    assert table.lookup(PAIRS, 1, 7) == SPLIT
+
+def test_exports_a_playable_chart(learned):
+    chart = learned.chart()
+
+    assert set(chart) == {'hard', 'soft', 'pairs'}
+    assert sorted(chart['hard']) == list(CHART_ROWS['hard'])
+    assert all(len(row) == 10 for rows in chart.values() for row in rows.values())
+
+    class Learned(BasicPolicy):
+        TABLE = StrategyTable(chart)
+    assert Learned.TABLE.chart() == chart
+
+def test_diff_against_basic_strategy(learned):
+    assert chart_diff(basic_strategy, basic_strategy) == []
+
+    diff = chart_diff(learned.chart(), basic_strategy)
+    cells = sum(len(rows) * 10 for rows in learned.chart().values())
+    assert len(diff) < cells / 2
+    assert all(section in ('hard', 'soft', 'pairs') for section, *_ in diff)
+
+def test_merges_and_forgets():
+    q = QTable()
+    sums = np.ones_like(q.sums)
+    q.merge(sums, sums)
+    q.decay(0.5).merge(3 * sums, sums)
+
+    assert np.allclose(q.values(), 3.5 / 1.5)
+
+def test_parallel_learning_is_reproducible():
+    a = learn(2, 2000, seed=3, workers=2)
+    b = learn(2, 2000, seed=3, workers=2)
+
+    assert np.array_equal(a.sums, b.sums)
+    assert a.counts.sum() > 0
+
+def test_learning_does_not_depend_on_the_workers():
+    a = learn(2, 2000, seed=3, workers=1)
+    b = learn(2, 2000, seed=3, workers=2)
+
+    assert np.array_equal(a.sums, b.sums)
+    assert np.array_equal(a.counts, b.counts)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from table_games.blackjack.montecarlo import SimulationResult, run, run_jobs, simulate, split, worker_pool
+
+
+def test_simulate_tallies_hands():
+    result = simulate(2000, 'tally', players=2)
+
+    assert result.rounds == 2000
+    assert result.hands == result.wins + result.losses + result.pushes + result.blackjacks
+    assert result.hands >= 2 * 2000
+    assert result.wagered == 2 * 2000 * 10
+    assert abs(result.ev() * result.rounds - result.bank) < 1e-6
+
+def test_run_is_reproducible_across_worker_counts():
+    serial = run(3000, seed=7, workers=1, shards=3)
+    parallel = run(3000, seed=7, workers=3, shards=3)
+
+    assert serial.rounds == parallel.rounds == 3000
+    assert serial.bank == parallel.bank
+    assert serial.wins == parallel.wins
+
+def test_merge_matches_single_result():
+    a = SimulationResult()
+    b = SimulationResult()
+    both = SimulationResult()
+    for idx, net in enumerate([10, -10, 0, 15, -20, 10]):
+        (a if idx % 2 else b).record_round(net)
+        both.record_round(net)
+
+    merged = SimulationResult().merge(a).merge(b)
+    assert merged.ev() == both.ev()
+    assert abs(merged.stdev() - both.stdev()) < 1e-9
+
+def test_split_covers_the_total():
+    runs = split(10, 4)
+
+    assert [len(part) for part in runs] == [3, 3, 2, 2]
+    assert [index for part in runs for index in part] == list(range(10))
+    assert [len(part) for part in split(2, 3)] == [1, 1, 0]
+
+def test_run_jobs_keeps_the_order_of_the_jobs():
+    jobs = list(range(8))
+
+    assert list(run_jobs(abs, jobs, workers=1)) == jobs
+    assert list(run_jobs(abs, jobs, workers=2)) == jobs
+    with worker_pool(2) as pool:
+        assert list(run_jobs(abs, jobs, pool=pool)) == jobs
+    with worker_pool(1) as pool:
+        assert pool is None
+
+def test_default_shards_do_not_depend_on_the_workers():
+    serial = run(1600, seed=7, workers=1)
+    parallel = run(1600, seed=7, workers=2)
+
+    assert serial.to_dict() == parallel.to_dict()
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from math import sqrt
+
+import pytest
+
+from table_games.common.cards import PairedShoe
+from table_games.blackjack.blackjack import PlayerSpreadAction
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.deviations import CountPolicy
+from table_games.blackjack.paired import compare
+
+
+class FlatDeviations(CountPolicy):
+    """Plays the deviations at a flat bet, so only the play differs from basic strategy"""
+
+    def PrebetAction(self, player, submit):
+        submit(PlayerSpreadAction(1))
+
+    def Bet(self, player, submit):
+        submit(10)
+
+    def InsuranceAction(self, player):
+        return False
+
+
+def test_paired_shoes_ignore_what_was_dealt():
+    a = PairedShoe(2, seed=9)
+    b = PairedShoe(2, seed=9)
+    a.shuffle()
+    b.shuffle()
+    for _ in range(30):
+        a.draw()
+    for _ in range(70):
+        b.draw()
+
+    a.shuffle()
+    b.shuffle()
+    assert a._codes == b._codes
+    assert a.shoe == b.shoe == 1
+
+    c = PairedShoe(2, seed=9, start=1)
+    c.shuffle()
+    assert c._codes == a._codes
+
+def test_identical_policies_have_no_difference():
+    paired = compare({'a': BasicPolicy(), 'b': BasicPolicy()}, 40, workers=1)
+
+    assert paired.shoes == 40
+    assert paired.results['a'].to_dict() == paired.results['b'].to_dict()
+    assert paired.difference('b') == (0.0, 0.0)
+
+def test_pairing_shrinks_the_error_of_the_difference():
+    paired = compare({'basic': BasicPolicy(), 'deviations': FlatDeviations()}, 300, workers=1)
+    basic = paired.results['basic']
+    deviations = paired.results['deviations']
+
+    _, stderr = paired.difference('deviations')
+    assert 0 < stderr < sqrt(basic.stderr() ** 2 + deviations.stderr() ** 2) / 1.5
+
+def test_results_do_not_depend_on_sharding():
+    policies = {'basic': BasicPolicy(), 'deviations': FlatDeviations()}
+    one = compare(policies, 30, seed=4, workers=1, shards=1)
+    three = compare(policies, 30, seed=4, workers=2, shards=3)
+
+    for name in policies:
+        assert one.results[name].to_dict() == three.results[name].to_dict()
+    assert one.differences['deviations'].mean == pytest.approx(three.differences['deviations'].mean)
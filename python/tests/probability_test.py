@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from itertools import permutations
+
+import pytest
+
+from table_games.common.cards import *
+from table_games.blackjack.blackjack import Blackjack
+from table_games.blackjack.probability import BLACKJACK, BUST, DealerProbabilities
+
+
+def composition_of(values):
+    counts = [0] * 10
+    for value in values:
+        counts[min(value, 10) - 1] += 1
+    return tuple(counts)
+
+def enumerate_dealer(up_value, values, h17):
+    """Plays the dealer through `Blackjack` for every order of `values`"""
+    game = Blackjack(1, h17, 0, 1, 100)
+    totals = [0] * 7
+    orders = list(permutations(values))
+    for order in orders:
+        cards = [Card(CSuit.CLUBS.value, value) for value in order]
+        game._dealer.clear()
+        game._dealer.dealt(Card(CSuit.HEARTS.value, up_value))
+        game._dealer.dealt(cards[0])
+        game._deck = Deck(cards[1:])
+
+        if game._dealer.is_blackjack():
+            totals[BLACKJACK] += 1
+            continue
+        game._results()
+        total = game._dealer.best_total()
+        totals[BUST if total > 21 else total - 17] += 1
+    return [count / len(orders) for count in totals]
+
+@pytest.mark.parametrize('h17', [True, False])
+@pytest.mark.parametrize('up_value,values', [
+    (6, [1, 2, 3, 10, 11, 12, 13]),
+    (1, [1, 5, 6, 7, 10, 12, 2]),
+    (10, [1, 4, 6, 2, 9, 13, 3]),
+])
+def test_matches_engine(h17, up_value, values):
+    outcomes = DealerProbabilities(h17).outcomes(min(up_value, 10), composition_of(values), peek=False)
+
+    assert outcomes == pytest.approx(enumerate_dealer(up_value, values, h17))
+
+def test_peek_excludes_blackjack():
+    shoe = Shoe(6)
+    shoe.draw()    # The upcard, an ace
+    outcomes = DealerProbabilities().outcomes(1, shoe.composition())
+
+    assert outcomes[BLACKJACK] == 0
+    assert sum(outcomes) == pytest.approx(1)
+
+def test_all_tens():
+    outcomes = DealerProbabilities().outcomes(10, (0,) * 9 + (20,))
+
+    assert outcomes[3] == 1
+
+def test_h17_busts_more():
+    composition = Shoe(6).composition()
+    h17 = DealerProbabilities(True).outcomes(6, composition)
+    s17 = DealerProbabilities(False).outcomes(6, composition)
+
+    assert h17[BUST] > s17[BUST]
+    assert sum(h17) == pytest.approx(1)
+
+def test_cache_is_bounded():
+    dealer = DealerProbabilities(maxsize=100)
+    dealer.outcomes(2, Shoe(2).composition())
+
+    assert dealer.cache_info().currsize <= 100
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from table_games.blackjack.blackjack import Blackjack, BlackjackState
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.profiler import Profiler
+
+
+def play(profile: bool, rounds: int = 300):
+    game = Blackjack(2, True, 1, 5, 100, rng=3)
+    game.add_player(BasicPolicy())
+    profiler = Profiler().attach(game) if profile else None
+    game.add_player(BasicPolicy())
+    game.simulate_rounds(rounds)
+    return game, profiler
+
+def test_profiling_does_not_change_the_game():
+    plain, _ = play(False)
+    profiled, _ = play(True)
+
+    assert [state._bank for _, state in plain._players] == [state._bank for _, state in profiled._players]
+
+def test_counts_phases_callbacks_and_cards():
+    game, profiler = play(True)
+    report = profiler.report()
+
+    assert report['rounds'] == 300
+    assert report['phases']['PREBETTING']['calls'] == 300
+    assert report['phases']['ACTION']['calls'] <= 300
+    assert report['callbacks']['Bet']['calls'] == 600
+    assert report['callbacks']['Action']['calls'] > 0
+    assert report['reshuffles'] > 0
+    assert 0 < report['policy_share'] < 1
+
+    timer = profiler.phases[BlackjackState.DEALING]
+    assert sum(timer.histogram) == timer.calls
+    assert timer.max_ns <= timer.total_ns
+
+    # Four cards a round at the least, plus the burn of each shuffle
+    assert report['cards_drawn'] >= 4 * 300
+
+def test_detach_restores_the_game():
+    game, profiler = play(True, 10)
+    profiler.detach()
+    drawn = profiler.cards_drawn()
+
+    game.simulate_rounds(10)
+
+    assert profiler.rounds() == 10
+    assert profiler.cards_drawn() == drawn
+    assert type(game._seats[0]._policy) is BasicPolicy
+    assert '_prebet' not in game.__dict__
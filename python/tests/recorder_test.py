@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from table_games.common.cards import CARDS, Card, Deck
+from table_games.blackjack.blackjack import Blackjack, PlayerPolicy, PlayerSpreadAction, SpotHitAction, SpotStandAction
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.recorder import HandRecorder, ragged, read_chunks
+
+
+def test_records_every_hand(tmp_path):
+    game = Blackjack(6, True, 5, 5, 100, rng=8)
+    game.add_player(BasicPolicy())
+    game.add_player(BasicPolicy())
+
+    with HandRecorder(str(tmp_path), chunk_rows=100, max_pending=1).attach(game):
+        game.simulate_rounds(500)
+
+    chunks = list(read_chunks(str(tmp_path)))
+    assert len(chunks) > 1
+    assert all(len(chunk['round']) <= 100 for chunk in chunks)
+
+    columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0] if not name.endswith('_end')}
+    hands = sum(state._hands for _, state in game._players)
+    assert len(columns['round']) == hands
+    assert columns['round'][-1] == 499
+
+    banks = [state._bank for _, state in game._players]
+    for player in (0, 1):
+        mine = columns['player'] == player
+        assert (columns['payout'][mine] - columns['bet'][mine]).sum() == banks[player]
+
+    hands = ragged(chunks[0], 'cards')
+    assert len(hands) == len(chunks[0]['round'])
+    assert all(len(cards) >= 2 for cards in hands)
+    assert [CARDS[code] for code in hands[0]]
+    assert len(columns['actions']) > 0
+
+
+class HitTo20(PlayerPolicy):
+
+    def PrebetAction(self, player, submit):
+        submit(PlayerSpreadAction(1))
+
+    def Bet(self, player, submit):
+        submit(10)
+
+    def Action(self, player, spot, up_card, submit):
+        submit(SpotHitAction() if spot._hard < 20 else SpotStandAction())
+
+def test_records_hands_of_any_length(tmp_path):
+    # Sixteen aces and two twos make a hard 20 of 18 cards
+    codes = ['CA', 'C9', 'DA', 'C8'] + ['HA', 'SA'] * 7 + ['C2', 'D2'] + ['C7'] * 20
+    game = Blackjack(8, True, 0, 5, 100)
+    game._deck = Deck([Card.parse(code) for code in codes])
+    game.add_player(HitTo20())
+
+    with HandRecorder(str(tmp_path)).attach(game):
+        game.simulate_rounds(1)
+
+    chunk, = read_chunks(str(tmp_path))
+    cards, = ragged(chunk, 'cards')
+    assert len(cards) == 18
+    assert [CARDS[code] for code in ragged(chunk, 'dealer')[0]] == [Card.parse('C9'), Card.parse('C8')]
+    assert len(ragged(chunk, 'actions')[0]) == 17
+
+def test_write_errors_are_raised(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(np, 'savez', fail)
+
+    game = Blackjack(6, True, 5, 5, 100, rng=8)
+    game.add_player(BasicPolicy())
+
+    with pytest.raises(OSError, match="disk full"):
+        with HandRecorder(str(tmp_path), chunk_rows=10, max_pending=1).attach(game):
+            game.simulate_rounds(500)
+    assert not list(read_chunks(str(tmp_path)))
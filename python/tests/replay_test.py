@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from table_games.common.cards import *
+from table_games.common.replay import ReplayShoe, generate_shoes, write_shoes
+from table_games.blackjack.blackjack import Blackjack
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.montecarlo import run
+
+
+def test_parse_short_cards():
+    assert Card.parse('CA') is Card(CSuit.CLUBS.value, CValue.ACE.value)
+    assert Card.parse('DT') is Card(CSuit.DIAMONDS.value, CValue.TEN.value)
+    assert Card.parse('SK')._points == 10
+
+    with pytest.raises(ValueError):
+        Card.parse('X9')
+
+def test_replays_shoes_in_order(tmp_path):
+    path = str(tmp_path / 'shoes.bin')
+    first = [CARDS[code] for code in range(52)]
+    second = list(reversed(first))
+    assert write_shoes(path, [first, [card._code for card in second]]) == 2
+
+    shoe = ReplayShoe(path)
+    assert len(shoe) == 52
+    assert [shoe.draw() for _ in range(3)] == first[:3]
+    assert shoe.composition()[0] == 3
+
+    shoe.shuffle()
+    assert [shoe.draw() for _ in range(52)] == second
+    shoe.shuffle()
+    assert shoe.draw() is first[0]
+
+    shoe.close()
+
+def test_undealt_shoe_is_not_skipped(tmp_path):
+    path = str(tmp_path / 'shoes.bin')
+    write_shoes(path, [['CA'] * 52, ['D2'] * 52])
+
+    shoe = ReplayShoe(path)
+    shoe.shuffle()
+    assert shoe.draw() is Card.parse('CA')
+
+def test_rejects_partial_shoes(tmp_path):
+    path = str(tmp_path / 'shoes.bin')
+    write_shoes(path, [['CA'] * 52])
+
+    with pytest.raises(ValueError):
+        ReplayShoe(path, deck_count=2)
+    with pytest.raises(ValueError):
+        write_shoes(path, [['CA'] * 52, ['CA'] * 51])
+
+def test_games_on_the_same_shoes_match(tmp_path):
+    path = str(tmp_path / 'shoes.bin')
+    generate_shoes(path, 20, 2, rng=5)
+
+    banks = []
+    for _ in range(2):
+        game = Blackjack(2, True, 1, 5, 100, shoe=ReplayShoe(path, 2))
+        game.add_player(BasicPolicy())
+        game.simulate_rounds(200)
+        banks.append(game._players[0][1]._bank)
+        game._deck.close()
+
+    assert banks[0] == banks[1]
+
+def test_replayed_runs_ignore_the_seed(tmp_path):
+    path = str(tmp_path / 'shoes.bin')
+    generate_shoes(path, 50, 6, rng=1)
+
+    a = run(2000, seed=1, workers=1, shards=2, replay=path)
+    b = run(2000, seed=2, workers=2, shards=2, replay=path)
+    c = run(2000, seed=1, workers=1, shards=2)
+
+    assert a.to_dict() == b.to_dict()
+    assert a.to_dict() != c.to_dict()
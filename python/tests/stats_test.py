@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import random
+import statistics
+
+import pytest
+
+from table_games.blackjack.deviations import CountPolicy
+from table_games.blackjack.stats import BankrollStats, RunningStats, run_bankroll, track
+
+
+def test_running_stats_match_the_two_pass_formulas():
+    rng = random.Random(1)
+    values = [rng.gauss(0.5, 3) for _ in range(1000)]
+
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == 1000
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance() == pytest.approx(statistics.variance(values))
+
+def test_merged_stats_match_one_stream():
+    rng = random.Random(2)
+    values = [rng.choice((-10, 0, 10, 15)) for _ in range(500)]
+
+    whole, first, second = RunningStats(), RunningStats(), RunningStats()
+    for idx, value in enumerate(values):
+        whole.add(value)
+        (first if idx < 123 else second).add(value)
+    first.merge(second)
+
+    assert first.count == whole.count
+    assert first.mean == pytest.approx(whole.mean)
+    assert first.variance() == pytest.approx(whole.variance())
+
+def test_drawdown_and_histogram():
+    stats = BankrollStats()
+    for net in (10, 10, -10, -10, -10, 20, -5):
+        stats.record(net, 10)
+
+    assert stats.bank == 5
+    assert stats.max_drawdown == 30
+    assert stats.wagered == 70
+    assert stats.histogram[-10] == 3
+
+def test_merged_drawdown_spans_the_shards():
+    rng = random.Random(2)
+    for _ in range(50):
+        nets = [rng.choice((-10, -5, 0, 5, 10, 15)) for _ in range(rng.randrange(1, 30))]
+        cut = rng.randrange(len(nets) + 1)
+        whole, first, second = BankrollStats(), BankrollStats(), BankrollStats()
+        for idx, net in enumerate(nets):
+            whole.record(net)
+            (first if idx < cut else second).record(net)
+
+        merged = first.merge(second)
+        assert (merged.bank, merged.max_drawdown, merged._peak, merged._low) == \
+               (whole.bank, whole.max_drawdown, whole._peak, whole._low)
+
+    # Up 20 in the first shard, then down 30 in the second
+    first, second = BankrollStats(), BankrollStats()
+    first.record(20)
+    second.record(-30)
+    assert first.merge(second).max_drawdown == 30
+
+def test_risk_of_ruin():
+    stats = BankrollStats()
+    for net in (10, -10) * 50 + (10,) * 5:
+        stats.record(net)
+
+    assert stats.ev() > 0
+    assert stats.risk_of_ruin(1000) < stats.risk_of_ruin(100) < 1
+    assert stats.risk_of_ruin(stats.bankroll_for(0.05)) == pytest.approx(0.05)
+    assert stats.n0() == pytest.approx(stats.rounds.variance() / stats.ev() ** 2)
+
+    losing = BankrollStats()
+    losing.record(-10)
+    losing.record(-5)
+    assert losing.risk_of_ruin(1000) == 1.0
+
+def test_tracks_a_counting_player():
+    stats = track(3000, 4, CountPolicy())
+    by_count = stats.by_count()
+
+    assert stats.rounds.count == 3000
+    assert sum(rounds for rounds, _, _ in by_count.values()) == 3000
+    assert len(by_count) > 3
+    assert stats.wagered > 0
+
+def test_parallel_runs_are_reproducible():
+    a = run_bankroll(2000, seed=5, workers=1, shards=2)
+    b = run_bankroll(2000, seed=5, workers=2, shards=2)
+
+    assert a.rounds.count == 2000
+    assert a.bank == b.bank
+    assert a.rounds.variance() == pytest.approx(b.rounds.variance())
+    assert a.max_drawdown == b.max_drawdown
+
+def test_default_shards_do_not_depend_on_the_workers():
+    a = run_bankroll(1600, seed=5, workers=1)
+    b = run_bankroll(1600, seed=5, workers=2)
+
+    assert a.bank == b.bank
+    assert a.histogram == b.histogram
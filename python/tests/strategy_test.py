@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from itertools import product
+
+from table_games.common.cards import *
+from table_games.blackjack.blackjack import SpotState
+from table_games.blackjack.basic import BASIC_TABLE, basic_strategy
+from table_games.blackjack.strategy import *
+
+
+def chart_action(spot, up_card):
+    """The decision read straight from the chart, the way `BasicPolicy` used to"""
+    column = up_card._points - 2
+    if column == -1: column = 9
+
+    if spot.is_pair() and basic_strategy['pairs'][spot._cards[0]._points][column] == 'Y':
+        return 'Y'
+    if spot.is_soft():
+        return basic_strategy['soft'][min(max(13, spot.soft_total()), 20)][column]
+    return basic_strategy['hard'][min(max(8, spot.hard_total()), 17)][column]
+
+def table_action(table, spot, up_card):
+    if table.split(spot, up_card):
+        return 'Y'
+    return ACTION_NAMES[table.play(spot, up_card)]
+
+def test_table_matches_chart():
+    values = range(CValue.ACE.value, CValue.KING.value + 1)
+    for count in (2, 3):
+        for hand in product(values, repeat=count):
+            spot = SpotState()
+            for value in hand:
+                spot.dealt(Card(CSuit.CLUBS.value, value))
+            if spot.hard_total() > 21:
+                continue
+
+            for up_value in values:
+                up_card = Card(CSuit.HEARTS.value, up_value)
+                assert table_action(BASIC_TABLE, spot, up_card) == chart_action(spot, up_card)
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / 'basic.json'
+    BASIC_TABLE.save(str(path))
+    table = StrategyTable.load(str(path))
+
+    assert table._actions == BASIC_TABLE._actions
+    assert table.chart() == basic_strategy
+
+def test_rejects_unknown_actions():
+    chart = BASIC_TABLE.chart()
+    chart['hard'][17][0] = 'X'
+    try:
+        StrategyTable(chart)
+        assert False
+    except ValueError:
+        pass
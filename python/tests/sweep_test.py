@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2023-present David Kopala <kopala.david@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import os
+
+from table_games.blackjack import sweep as sweep_module
+from table_games.blackjack.basic import BasicPolicy
+from table_games.blackjack.deviations import BetRamp, CountPolicy
+from table_games.blackjack.sweep import sweep
+
+
+RULES = {
+    'h17': dict(deck_count=6, h17=True, pen=5, tmin=5, tmax=200),
+    's17': dict(deck_count=6, h17=False, pen=5, tmin=5, tmax=200),
+}
+POLICIES = {'basic': BasicPolicy(), 'count': CountPolicy()}
+RAMPS = {'flat': BetRamp([(-10, 1, 10)]), 'spread': BetRamp([(-10, 1, 10), (2, 1, 50)])}
+
+def test_sweep_caches_cells(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    results = sweep(RULES, POLICIES, 200, ramps=RAMPS, workers=1, cache_dir=cache_dir)
+
+    assert set(results) == {
+        ('h17', 'basic', None), ('s17', 'basic', None),
+        ('h17', 'count', 'flat'), ('h17', 'count', 'spread'),
+        ('s17', 'count', 'flat'), ('s17', 'count', 'spread'),
+    }
+    assert all(result.rounds == 200 for result in results.values())
+    assert len(os.listdir(cache_dir)) == 6
+
+    def fail(job):
+        raise AssertionError("A cached cell was simulated again")
+    monkeypatch.setattr(sweep_module, '_run_cell', fail)
+    again = sweep(RULES, POLICIES, 200, ramps=RAMPS, workers=1, cache_dir=cache_dir)
+
+    assert {name: result.bank for name, result in again.items()} == {name: result.bank for name, result in results.items()}
+
+def test_sweep_only_runs_new_cells(tmp_path):
+    cache_dir = str(tmp_path)
+    sweep({'h17': RULES['h17']}, {'basic': BasicPolicy()}, 100, workers=1, cache_dir=cache_dir)
+    results = sweep(RULES, {'basic': BasicPolicy()}, 100, workers=2, cache_dir=cache_dir)
+
+    assert len(results) == 2
+    assert len(os.listdir(cache_dir)) == 2